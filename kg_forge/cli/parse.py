@@ -11,6 +11,20 @@ from kg_forge.utils.verbose import create_verbose_logger
 console = Console()
 
 
+def _document_totals(documents) -> tuple:
+    """Sum link counts and content lengths in a single pass.
+    
+    Returns:
+        Tuple of (total links, total content characters)
+    """
+    total_links = 0
+    total_chars = 0
+    for doc in documents:
+        total_links += len(doc.links)
+        total_chars += len(doc.text)
+    return total_links, total_chars
+
+
 @click.command(name="parse")
 @click.pass_context
 @click.option(
@@ -74,19 +88,21 @@ def parse_html(ctx: click.Context, source: Path, show_content: bool, show_links:
             if verbose_logger:
                 verbose_logger.info(f"Starting directory parse: {source}")
             documents = loader.load_from_directory(source)
-            if verbose_logger:
-                verbose_logger.info(
-                    f"Directory parsing complete:\n"
-                    f"  Files processed: {len(documents)}\n"
-                    f"  Total content: {sum(len(d.text) for d in documents)} chars\n"
-                    f"  Total links: {sum(len(d.links) for d in documents)}"
-                )
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         if verbose_logger:
             verbose_logger.error(f"Parsing failed: {e}")
         return
     
+    total_links, total_chars = _document_totals(documents)
+    if verbose_logger and not source.is_file():
+        verbose_logger.info(
+            f"Directory parsing complete:\n"
+            f"  Files processed: {len(documents)}\n"
+            f"  Total content: {total_chars} chars\n"
+            f"  Total links: {total_links}"
+        )
+    
     console.print(f"[green]✓ Successfully parsed {len(documents)} document(s)[/green]\n")
     
     # Display each document
@@ -133,5 +149,5 @@ def parse_html(ctx: click.Context, source: Path, show_content: bool, show_links:
     # Summary
     console.print("[bold green]Summary:[/bold green]")
     console.print(f"  Total documents: {len(documents)}")
-    console.print(f"  Total links: {sum(len(doc.links) for doc in documents)}")
-    console.print(f"  Total content: {sum(len(doc.text) for doc in documents):,} characters")
+    console.print(f"  Total links: {total_links}")
+    console.print(f"  Total content: {total_chars:,} characters")
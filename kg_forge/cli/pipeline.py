@@ -218,8 +218,9 @@ def run_pipeline(
             for i, error in enumerate(stats.errors[:10], 1):
                 click.echo(f"  {i}. {error}")
             
-            if len(stats.errors) > 10:
-                remaining = len(stats.errors) - 10
+            total_errors = len(stats.errors) + stats.dropped_errors
+            if total_errors > 10:
+                remaining = total_errors - 10
                 click.echo(f"  ... and {remaining} more error(s)")
             
             click.echo()
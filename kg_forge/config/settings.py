@@ -14,6 +14,8 @@ class Neo4jConfig(BaseModel):
     uri: str = Field(default="bolt://localhost:7687")
     username: str = Field(default="neo4j")
     password: str = Field(default="password")
+    max_connection_pool_size: int = Field(default=100)
+    connection_acquisition_timeout: float = Field(default=60.0)
 
 
 class AWSConfig(BaseModel):
@@ -27,6 +29,10 @@ class AWSConfig(BaseModel):
 class GraphConfig(BaseModel):
     """Graph database configuration."""
     backend: str = Field(default="neo4j")
+    batch_size: int = Field(default=1000, gt=0)
+    query_timeout: Optional[float] = Field(default=None, gt=0)
+    warmup: bool = Field(default=False)
+    warm_queries: List[str] = Field(default_factory=list)
 
 
 class PipelineConfig(BaseModel):
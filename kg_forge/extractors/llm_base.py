@@ -79,7 +79,7 @@ class LLMEntityExtractor(EntityExtractor):
         Raises:
             APIError: If too many consecutive failures occur
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Check consecutive failures
         if self._consecutive_failures >= self.max_consecutive_failures:
@@ -121,9 +121,9 @@ class LLMEntityExtractor(EntityExtractor):
         while retry_count <= self.max_retries:
             try:
                 # Delegate to subclass for actual API call
-                llm_start = time.time()
+                llm_start = time.monotonic()
                 response = self._call_llm_api(prompt, request.max_tokens)
-                llm_call_time = time.time() - llm_start
+                llm_call_time = time.monotonic() - llm_start
                 
                 response_text = response["text"]
                 tokens_used = response.get("tokens")
@@ -174,7 +174,7 @@ class LLMEntityExtractor(EntityExtractor):
                         raw_response=response_text,
                         model_name=self.model_name,
                         tokens_used=tokens_used,
-                        extraction_time=time.time() - start_time,
+                        extraction_time=time.monotonic() - start_time,
                         success=False,
                         error=f"Parse error after {retry_count} attempts: {e}"
                     )
@@ -200,7 +200,7 @@ class LLMEntityExtractor(EntityExtractor):
                     return ExtractionResult(
                         entities=[],
                         model_name=self.model_name,
-                        extraction_time=time.time() - start_time,
+                        extraction_time=time.monotonic() - start_time,
                         success=False,
                         error=f"LLM API error: {e}"
                     )
@@ -215,7 +215,7 @@ class LLMEntityExtractor(EntityExtractor):
                     f"below confidence threshold {request.min_confidence}"
                 )
         
-        extraction_time = time.time() - start_time
+        extraction_time = time.monotonic() - start_time
         
         return ExtractionResult(
             entities=entities,
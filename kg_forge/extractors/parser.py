@@ -2,16 +2,114 @@
 Parser for LLM responses into structured entities and relationships.
 """
 
-import json
 import re
+import sys
 import logging
-from typing import List, Tuple
+from typing import List, Tuple, Union
+
+# Fastest available JSON decoder (msgspec, then orjson, then stdlib).
+# All of them accept UTF-8 bytes and decode in a single C pass.
+try:
+    import msgspec
+    _loads = msgspec.json.Decoder().decode
+    _DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    try:
+        import orjson
+        _loads = orjson.loads
+    except ImportError:  # orjson is an optional speedup too
+        import json
+        _loads = json.loads
+    _DECODE_ERRORS = (ValueError,)
 
 from kg_forge.models.extraction import ExtractedEntity, ExtractedRelationship
 from kg_forge.extractors.base import ParseError
 
 logger = logging.getLogger(__name__)
 
+# Pattern: ```json\n{...}\n``` or ```\n{...}\n```
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+# Content between outermost { }
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Keys consumed by the parser; everything else is kept as a property
+_ENTITY_RESERVED = frozenset({"type", "entity_type", "type_id", "name", "confidence"})
+_REL_RESERVED = frozenset({"from_entity", "to_entity", "relation_type", "type", "confidence"})
+
+# Raw relation type -> interned uppercase form (small, bounded vocabulary)
+_REL_TYPE_CACHE: dict = {}
+_REL_TYPE_CACHE_MAXSIZE = 1024
+
+
+def _normalize_relation_type(relation_type) -> str:
+    """Uppercase a relation type, reusing one interned string per raw value."""
+    raw = relation_type if isinstance(relation_type, str) else str(relation_type)
+    normalized = _REL_TYPE_CACHE.get(raw)
+    if normalized is None:
+        normalized = sys.intern(raw.upper())
+        if len(_REL_TYPE_CACHE) >= _REL_TYPE_CACHE_MAXSIZE:
+            # Drop the oldest entry to stay bounded on adversarial input
+            del _REL_TYPE_CACHE[next(iter(_REL_TYPE_CACHE))]
+        _REL_TYPE_CACHE[raw] = normalized
+    return normalized
+
+
+# Python literals LLMs sometimes emit in place of JSON ones
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def _repair_json(text: str) -> str:
+    """Fix trailing commas and bare Python literals outside of JSON strings.
+    
+    Args:
+        text: JSON-like text
+        
+    Returns:
+        Repaired text (unchanged if nothing needed fixing)
+    """
+    out = []
+    i = 0
+    n = len(text)
+    in_string = False
+    
+    while i < n:
+        ch = text[i]
+        
+        if in_string:
+            out.append(ch)
+            if ch == '\\' and i + 1 < n:
+                out.append(text[i + 1])
+                i += 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch == ',':
+            # Drop the comma if only whitespace separates it from a closing bracket
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j >= n or text[j] not in '}]':
+                out.append(ch)
+        elif ch in 'TFN' and not (i and (text[i - 1].isalnum() or text[i - 1] == '_')):
+            for literal, replacement in _PYTHON_LITERALS.items():
+                end = i + len(literal)
+                if text.startswith(literal, i) and not (
+                    end < n and (text[end].isalnum() or text[end] == '_')
+                ):
+                    out.append(replacement)
+                    i = end - 1
+                    break
+            else:
+                out.append(ch)
+        else:
+            out.append(ch)
+        i += 1
+    
+    return "".join(out)
+
 
 class ResponseParser:
     """Parse LLM JSON responses into ExtractedEntity objects.
@@ -23,39 +121,71 @@ class ResponseParser:
     - Unexpected fields
     """
     
-    def parse(self, response_text: str) -> Tuple[List[ExtractedEntity], List[ExtractedRelationship]]:
+    def parse(
+        self,
+        response_text: str,
+        include_relationships: bool = True
+    ) -> Union[Tuple[List[ExtractedEntity], List[ExtractedRelationship]], List[ExtractedEntity]]:
         """Parse LLM response into entities and relationships.
         
         Args:
             response_text: Raw text response from LLM
+            include_relationships: If False, skip relationship parsing and
+                return only the list of entities
             
         Returns:
-            Tuple of (entities, relationships)
+            Tuple of (entities, relationships), or just entities when
+            include_relationships is False
             
         Raises:
             ParseError: If response cannot be parsed
         """
         if not response_text or not response_text.strip():
             logger.warning("Empty response from LLM")
-            return [], []
+            return ([], []) if include_relationships else []
         
         # Extract JSON from markdown code blocks if present
         json_text = self._extract_json(response_text)
         
         # Parse JSON
         try:
-            data = json.loads(json_text)
-        except json.JSONDecodeError as e:
-            # Log the problematic text for debugging
-            preview = json_text[:500] if len(json_text) > 500 else json_text
-            logger.error(f"Failed to parse JSON. Error: {e}")
-            logger.error(f"Response text (first 500 chars): {preview}")
-            if len(json_text) > 500:
-                logger.error(f"Full response length: {len(json_text)} characters")
-            raise ParseError(f"Invalid JSON in LLM response: {e}")
+            data = _loads(json_text.encode('utf-8'))
+        except _DECODE_ERRORS as e:
+            # Cheap local fix-up of common LLM mistakes before forcing a retry
+            data = self._loads_repaired(json_text)
+            if data is None:
+                # Log the problematic text for debugging
+                preview = json_text[:500] if len(json_text) > 500 else json_text
+                logger.error(f"Failed to parse JSON. Error: {e}")
+                logger.error(f"Response text (first 500 chars): {preview}")
+                if len(json_text) > 500:
+                    logger.error(f"Full response length: {len(json_text)} characters")
+                raise ParseError(f"Invalid JSON in LLM response: {e}")
         
         # Extract entities and relationships from parsed data
-        return self._extract_entities(data)
+        entities, relationships = self._extract_entities(data, include_relationships)
+        return (entities, relationships) if include_relationships else entities
+    
+    def _loads_repaired(self, json_text: str):
+        """Try to decode JSON after repairing common LLM formatting mistakes.
+        
+        Args:
+            json_text: JSON text that failed to decode
+            
+        Returns:
+            Decoded data, or None if the text could not be repaired
+        """
+        repaired = _repair_json(json_text)
+        if repaired == json_text:
+            return None
+        
+        try:
+            data = _loads(repaired.encode('utf-8'))
+        except _DECODE_ERRORS:
+            return None
+        
+        logger.warning("Repaired malformed JSON in LLM response (trailing commas or Python literals)")
+        return data
     
     def _extract_json(self, text: str) -> str:
         """Extract JSON from text, handling markdown code blocks.
@@ -67,31 +197,38 @@ class ResponseParser:
             Extracted JSON string
         """
         # Try to find JSON in markdown code block
-        # Pattern: ```json\n{...}\n``` or ```\n{...}\n```
-        code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-        matches = re.findall(code_block_pattern, text, re.DOTALL)
+        match = _CODE_BLOCK_RE.search(text)
         
-        if matches:
+        if match:
             logger.debug("Found JSON in markdown code block")
-            return matches[0].strip()
+            return match.group(1).strip()
         
-        # Try to find raw JSON object
-        # Look for content between outermost { }
-        json_pattern = r'\{.*\}'
-        matches = re.findall(json_pattern, text, re.DOTALL)
+        # Try to find raw JSON object, keeping the longest match
+        # (likely the complete JSON) without building a list of matches
+        best = None
+        best_len = -1
+        for match in _JSON_OBJ_RE.finditer(text):
+            candidate = match.group(0)
+            if len(candidate) > best_len:
+                best, best_len = candidate, len(candidate)
         
-        if matches:
-            # Return the longest match (likely the complete JSON)
-            return max(matches, key=len)
+        if best is not None:
+            return best
         
         # Return as-is if no patterns matched
         return text.strip()
     
-    def _extract_entities(self, data: dict) -> Tuple[List[ExtractedEntity], List[ExtractedRelationship]]:
+    def _extract_entities(
+        self,
+        data: dict,
+        include_relationships: bool = True
+    ) -> Tuple[List[ExtractedEntity], List[ExtractedRelationship]]:
         """Extract entities AND relationships from parsed JSON data.
         
         Args:
             data: Parsed JSON dictionary
+            include_relationships: If False, relationships are not parsed
+                and an empty list is returned in their place
             
         Returns:
             Tuple of (entities, relationships)
@@ -122,6 +259,9 @@ class ResponseParser:
         
         logger.info(f"Parsed {len(entities)} entities from response")
         
+        if not include_relationships:
+            return entities, []
+        
         # Extract relationships (optional field)
         relationships = self._parse_relationships_list(
             data.get("relations", []),
@@ -160,10 +300,7 @@ class ResponseParser:
         confidence = float(data.get("confidence", 1.0))
         
         # Get any additional properties (including aliases, evidence, etc.)
-        properties = {
-            k: v for k, v in data.items()
-            if k not in ("type", "entity_type", "type_id", "name", "confidence")
-        }
+        properties = {k: v for k, v in data.items() if k not in _ENTITY_RESERVED}
         
         return ExtractedEntity(
             entity_type=str(entity_type),
@@ -190,34 +327,45 @@ class ResponseParser:
             logger.warning(f"Expected relations to be list, got {type(relations_data).__name__}. Skipping relationships.")
             return []
         
+        entity_count = len(entities)
         relationships = []
+        out_of_range = []
         for i, rel_data in enumerate(relations_data):
             try:
-                rel = self._parse_relationship(rel_data, entities)
+                rel = self._parse_relationship(rel_data, entity_count)
                 relationships.append(rel)
+            except IndexError:
+                out_of_range.append(i)  # Reported once below
             except Exception as e:
                 logger.warning(f"Failed to parse relationship at index {i}: {e}")
                 continue  # Skip malformed relationships
         
+        if out_of_range:
+            logger.warning(
+                f"Skipped {len(out_of_range)} relationships with entity indices "
+                f"out of range (0-{entity_count - 1}) at positions {out_of_range}"
+            )
+        
         logger.info(f"Parsed {len(relationships)} relationships")
         return relationships
     
     def _parse_relationship(
         self, 
         data: dict, 
-        entities: List[ExtractedEntity]
+        entity_count: int
     ) -> ExtractedRelationship:
         """Parse single relationship from dict, storing entity INDICES (not resolved names).
         
         Args:
             data: Relationship dict with integer indices
-            entities: List of entities (for validation only)
+            entity_count: Number of parsed entities (for index validation only)
             
         Returns:
             ExtractedRelationship with stored indices
             
         Raises:
             ValueError: If relationship data is invalid
+            IndexError: If an entity index is out of range
         """
         if not isinstance(data, dict):
             raise ValueError(f"Expected dict, got {type(data).__name__}")
@@ -238,27 +386,23 @@ class ResponseParser:
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid entity index: {e}")
         
-        if from_idx < 0 or from_idx >= len(entities):
-            raise ValueError(f"from_entity index {from_idx} out of range (0-{len(entities)-1})")
-        
-        if to_idx < 0 or to_idx >= len(entities):
-            raise ValueError(f"to_entity index {to_idx} out of range (0-{len(entities)-1})")
+        if not (0 <= from_idx < entity_count and 0 <= to_idx < entity_count):
+            raise IndexError(
+                f"entity indices ({from_idx}, {to_idx}) out of range (0-{entity_count - 1})"
+            )
         
         # Optional fields
         confidence = float(data.get("confidence", 1.0))
         
         # Extract properties (evidence, etc.)
-        properties = {
-            k: v for k, v in data.items()
-            if k not in ("from_entity", "to_entity", "relation_type", "type", "confidence")
-        }
+        properties = {k: v for k, v in data.items() if k not in _REL_RESERVED}
         
         # IMPORTANT: Store INDICES, not resolved names
         # This allows indices to remain valid after hooks modify entities in-place
         return ExtractedRelationship(
             from_index=from_idx,
             to_index=to_idx,
-            relation_type=str(relation_type).upper(),  # Normalize to uppercase
+            relation_type=_normalize_relation_type(relation_type),  # Normalize to uppercase
             confidence=confidence,
             properties=properties
         )
@@ -3,8 +3,9 @@ Build extraction prompts from entity definitions and templates.
 """
 
 import logging
+import mmap
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, FrozenSet, Tuple
 
 from kg_forge.entities.loader import EntityDefinitionsLoader
 
@@ -18,6 +19,10 @@ class PromptBuilder:
     a prompt template to create complete extraction prompts.
     """
     
+    # Template placeholders (must appear once each, in this order)
+    ENTITY_DEFINITIONS_PLACEHOLDER = "{{ENTITY_TYPE_DEFINITIONS}}"
+    TEXT_PLACEHOLDER = "{{TEXT}}"
+    
     def __init__(
         self,
         entities_dir: Path = Path("entities_extract"),
@@ -37,15 +42,35 @@ class PromptBuilder:
         if not self.template_path.exists():
             raise FileNotFoundError(f"Template not found: {self.template_path}")
         
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            self.template = f.read()
+        # Split template around placeholders once so each prompt is a single join
+        self._tpl_parts = self._read_template_parts()
         
         # Cache entity definitions (load once, reuse many times)
         self._cached_definitions = self.loader.load_all().definitions
         
+        # Per-definition rendered blocks (definitions never change at runtime)
+        self._rendered_defs = self._render_all(self._cached_definitions)
+        
+        # Lowercase type ID -> original type ID for case-insensitive filtering
+        self._lower_index = {eid.lower(): eid for eid in self._cached_definitions}
+        
+        # Rendered entity definitions text, keyed by requested types (None = all)
+        self._defs_cache: Dict[Optional[FrozenSet[str]], str] = {}
+        
         logger.info(f"Loaded prompt template from {self.template_path}")
         logger.info(f"Cached {len(self._cached_definitions)} entity definitions")
     
+    def reload(self) -> None:
+        """Reload entity definitions from disk and drop rendered text cache.
+        
+        Call this if entity definition files change while the builder is alive.
+        """
+        self._cached_definitions = self.loader.load_all().definitions
+        self._rendered_defs = self._render_all(self._cached_definitions)
+        self._lower_index = {eid.lower(): eid for eid in self._cached_definitions}
+        self._defs_cache.clear()
+        logger.info(f"Reloaded {len(self._cached_definitions)} entity definitions")
+    
     def build_extraction_prompt(
         self,
         content: str,
@@ -62,16 +87,110 @@ class PromptBuilder:
         Returns:
             Complete prompt with instructions, entity definitions, and content
         """
+        # Normalize requested types to lowercase for matching and caching
+        cache_key = frozenset(t.lower() for t in entity_types) if entity_types else None
+        
+        entity_defs_text = self._defs_cache.get(cache_key)
+        if entity_defs_text is None:
+            entity_defs_text = self._render_definitions(cache_key, entity_types)
+            self._defs_cache[cache_key] = entity_defs_text
+        
+        # Truncate content if too long
+        if len(content) > max_content_length:
+            logger.warning(
+                f"Content length {len(content)} exceeds max {max_content_length}, truncating"
+            )
+            content = content[:max_content_length] + "\n\n[... content truncated ...]"
+        
+        # Fill placeholders in a single concatenation pass
+        pre, mid, post = self._tpl_parts
+        return "".join((pre, entity_defs_text, mid, content, post))
+    
+    @property
+    def template(self) -> str:
+        """Template text with its placeholders, rebuilt from the split parts."""
+        pre, mid, post = self._tpl_parts
+        return "".join((
+            pre, self.ENTITY_DEFINITIONS_PLACEHOLDER, mid, self.TEXT_PLACEHOLDER, post
+        ))
+    
+    def _read_template_parts(self) -> Tuple[str, str, str]:
+        """Read the template through a read-only mmap and split it.
+        
+        Only the three slices around the placeholders are decoded, so the
+        raw template is never held as a whole string.
+        
+        Returns:
+            Tuple of (before definitions, between placeholders, after text)
+        """
+        with open(self.template_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if not self.template_path.stat().st_size:
+                return self._split_template(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._split_template(mm)
+    
+    def _split_template(self, template) -> Tuple[str, str, str]:
+        """Split template into the text around its two placeholders.
+        
+        Args:
+            template: Raw template bytes (or a read-only mmap of them)
+            
+        Returns:
+            Tuple of (before definitions, between placeholders, after text)
+            
+        Raises:
+            ValueError: If a placeholder is missing, repeated, or out of order
+        """
+        defs_marker = self.ENTITY_DEFINITIONS_PLACEHOLDER
+        text_marker = self.TEXT_PLACEHOLDER
+        
+        positions = []
+        for marker in (defs_marker, text_marker):
+            needle = marker.encode('utf-8')
+            start = template.find(needle)
+            if start == -1 or template.find(needle, start + 1) != -1:
+                raise ValueError(
+                    f"Template {self.template_path} must contain {marker} exactly once"
+                )
+            positions.append((start, start + len(needle)))
+        
+        (defs_start, defs_end), (text_start, text_end) = positions
+        if text_start < defs_end:
+            raise ValueError(
+                f"Template {self.template_path} must place {defs_marker} before {text_marker}"
+            )
+        
+        return (
+            template[:defs_start].decode('utf-8'),
+            template[defs_end:text_start].decode('utf-8'),
+            template[text_end:].decode('utf-8'),
+        )
+    
+    def _render_definitions(
+        self,
+        entity_types_lower: Optional[FrozenSet[str]],
+        entity_types: Optional[List[str]]
+    ) -> str:
+        """Filter cached definitions by type and render them as prompt text.
+        
+        Args:
+            entity_types_lower: Lowercased requested types, or None for all
+            entity_types: Requested types as given by the caller (for logging)
+            
+        Returns:
+            Formatted entity definitions text
+        """
         # Use cached entity definitions (loaded once in __init__)
         all_definitions = self._cached_definitions
         
         # Filter by types if specified (case-insensitive)
-        if entity_types:
-            # Normalize requested types to lowercase for matching
-            entity_types_lower = [t.lower() for t in entity_types]
+        if entity_types_lower:
+            lower_index = self._lower_index
+            selected_ids = {lower_index[t] for t in entity_types_lower if t in lower_index}
+            # Keep definition order stable regardless of request order
             definitions = {
-                k: v for k, v in all_definitions.items()
-                if k.lower() in entity_types_lower
+                k: v for k, v in all_definitions.items() if k in selected_ids
             }
             if not definitions:
                 logger.warning(
@@ -84,21 +203,7 @@ class PromptBuilder:
         
         logger.info(f"Building prompt with {len(definitions)} entity types")
         
-        # Build entity type definitions text
-        entity_defs_text = self._build_entity_definitions(definitions)
-        
-        # Truncate content if too long
-        if len(content) > max_content_length:
-            logger.warning(
-                f"Content length {len(content)} exceeds max {max_content_length}, truncating"
-            )
-            content = content[:max_content_length] + "\n\n[... content truncated ...]"
-        
-        # Replace placeholders in template
-        prompt = self.template.replace("{{ENTITY_TYPE_DEFINITIONS}}", entity_defs_text)
-        prompt = prompt.replace("{{TEXT}}", content)
-        
-        return prompt
+        return self._build_entity_definitions(definitions)
     
     def _build_entity_definitions(self, definitions: dict) -> str:
         """Build entity definitions text from loaded definitions.
@@ -109,37 +214,65 @@ class PromptBuilder:
         Returns:
             Formatted entity definitions text
         """
-        lines = []
+        rendered = self._rendered_defs
+        return "\n".join(
+            rendered[entity_id] if entity_id in rendered
+            else self._render_definition(entity_id, definition)
+            for entity_id, definition in definitions.items()
+        )
+    
+    @classmethod
+    def _render_all(cls, definitions: dict) -> Dict[str, str]:
+        """Render every definition into its prompt text block.
         
-        for entity_id, definition in definitions.items():
-            # Use EntityDefinition attributes, not dictionary access
-            name = definition.name if definition.name else entity_id
-            lines.append(f"## {name}")
-            lines.append(f"**ID**: `{entity_id}`")
-            lines.append("")
-            
-            if definition.description:
-                lines.append(f"**Description**: {definition.description}")
-                lines.append("")
-            
-            if definition.relations:
-                lines.append("**Relations**:")
-                for relation in definition.relations:
-                    lines.append(
-                        f"- {relation.target_entity_type}: "
-                        f"{relation.forward_label} / {relation.reverse_label}"
-                    )
-                lines.append("")
+        Args:
+            definitions: Dictionary of EntityDefinition objects
             
-            if definition.examples:
-                lines.append("**Examples**:")
-                for example in definition.examples:
-                    lines.append(f"- **{example.name}**: {example.description}")
-                lines.append("")
+        Returns:
+            Mapping of entity type ID to rendered text block
+        """
+        return {
+            entity_id: cls._render_definition(entity_id, definition)
+            for entity_id, definition in definitions.items()
+        }
+    
+    @staticmethod
+    def _render_definition(entity_id: str, definition) -> str:
+        """Render a single entity definition as a prompt text block.
+        
+        Args:
+            entity_id: Entity type ID
+            definition: EntityDefinition object
             
-            lines.append("---")
+        Returns:
+            Formatted text block (ends with a separator line)
+        """
+        # Use EntityDefinition attributes, not dictionary access
+        name = definition.name if definition.name else entity_id
+        lines = [f"## {name}", f"**ID**: `{entity_id}`", ""]
+        
+        if definition.description:
+            lines += [f"**Description**: {definition.description}", ""]
+        
+        if definition.relations:
+            lines.append("**Relations**:")
+            lines += [
+                f"- {relation.target_entity_type}: "
+                f"{relation.forward_label} / {relation.reverse_label}"
+                for relation in definition.relations
+            ]
+            lines.append("")
+        
+        if definition.examples:
+            lines.append("**Examples**:")
+            lines += [
+                f"- **{example.name}**: {example.description}"
+                for example in definition.examples
+            ]
             lines.append("")
         
+        lines += ["---", ""]
+        
         return "\n".join(lines)
     
     def get_loaded_types(self) -> List[str]:
@@ -148,5 +281,4 @@ class PromptBuilder:
         Returns:
             List of entity type IDs
         """
-        defs_obj = self.loader.load_all()
-        return list(defs_obj.definitions.keys())
+        return list(self._cached_definitions.keys())
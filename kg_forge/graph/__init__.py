@@ -13,18 +13,40 @@ Usage:
     
     client = get_graph_client(config)
     entity_repo = get_entity_repository(client)
+
+Exported names are resolved lazily (PEP 562) so importing a submodule such as
+kg_forge.graph.exceptions does not load anything else.
 """
 
-from kg_forge.graph.base import (
-    GraphClient,
-    EntityRepository,
-    DocumentRepository,
-    SchemaManager,
-)
+import importlib
 
 __all__ = [
     "GraphClient",
+    "AsyncGraphClient",
     "EntityRepository", 
     "DocumentRepository",
     "SchemaManager",
 ]
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "GraphClient": ".base",
+    "AsyncGraphClient": ".base",
+    "EntityRepository": ".base",
+    "DocumentRepository": ".base",
+    "SchemaManager": ".base",
+}
+
+
+def __getattr__(name):
+    """Import exported names on first access."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
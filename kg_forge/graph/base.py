@@ -6,10 +6,55 @@ by different graph database backends (Neo4j, etc.).
 NO database-specific imports should be in this file.
 """
 
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
 
+# Entity name normalization tables, built once at import time
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+# ASCII fast path: one translate pass lowercases A-Z and turns everything
+# but a-z, 0-9 and whitespace into a space
+_ASCII_FOLD_TABLE = str.maketrans({
+    c: (c.lower() if 'A' <= c <= 'Z' else ' ')
+    for c in map(chr, range(128))
+    if not (c.isspace() or 'a' <= c <= 'z' or '0' <= c <= '9')
+})
+
+
+@lru_cache(maxsize=65_536)
+def _normalize_name(name: str) -> str:
+    """Apply the entity name normalization rules (see EntityRepository.normalize_name)."""
+    if '(' in name:
+        name = _PAREN_RE.sub('', name)
+    
+    # Lowercase and replace anything but alphanumerics and whitespace with a space
+    if name.isascii():
+        normalized = name.translate(_ASCII_FOLD_TABLE)
+    else:
+        normalized = _NON_ALNUM_RE.sub(' ', name.lower())
+    
+    # Collapse multiple spaces to single space and trim
+    return ' '.join(normalized.split())
+
+
+def normalize_names_batch(names: List[str]) -> List[str]:
+    """Normalize many entity names at once.
+    
+    Duplicate names are normalized once; results are in input order.
+    
+    Args:
+        names: Original names
+        
+    Returns:
+        list: Normalized names
+    """
+    normalized = {name: _normalize_name(name) for name in set(names)}
+    return [normalized[name] for name in names]
+
+
 class GraphClient(ABC):
     """Abstract base class for graph database client.
     
@@ -53,6 +98,50 @@ class GraphClient(ABC):
         self.close()
 
 
+class AsyncGraphClient(ABC):
+    """Abstract base class for asynchronous graph database clients.
+    
+    Async counterpart of GraphClient for callers running on an event loop
+    (e.g. web servers), where blocking on every round-trip would stall
+    other tasks.
+    """
+    
+    @abstractmethod
+    async def connect(self) -> bool:
+        """Connect to the graph database.
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the database connection.
+        
+        Should be idempotent - safe to call multiple times.
+        """
+        pass
+    
+    @abstractmethod
+    async def verify_connectivity(self) -> bool:
+        """Verify that the database is accessible.
+        
+        Returns:
+            bool: True if database responds, False otherwise
+        """
+        pass
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
 class SchemaManager(ABC):
     """Abstract base class for schema management operations.
     
@@ -255,23 +344,33 @@ class EntityRepository(ABC):
         """
         pass
     
-    @abstractmethod
-    def normalize_name(self, name: str) -> str:
+    @staticmethod
+    def normalize_name(name: str) -> str:
         """Normalize an entity name for matching.
         
         Normalization rules:
-        1. Remove content in parentheses
+        1. Remove content in parentheses (e.g., "(KD)", "(v2)")
         2. Convert to lowercase
         3. Trim and collapse whitespace
         4. Keep only alphanumeric and spaces
         
+        Backends may override this, but must keep the same rules so that
+        names normalize identically everywhere. Results are memoized in a
+        bounded LRU, since the same names recur across many mentions. This
+        is a static method, so no repository instance is needed to call it.
+        
         Args:
             name: Original name
             
         Returns:
             str: Normalized name
+            
+        Examples:
+            "Knowledge Discovery (KD)" -> "knowledge discovery"
+            "Platform  Engineering" -> "platform engineering"
+            "AI/ML Platform" -> "ai ml platform"
         """
-        pass
+        return _normalize_name(name)
 
 
 class DocumentRepository(ABC):
@@ -378,6 +477,7 @@ class DocumentRepository(ABC):
         doc_id: str,
         entity_type: str,
         entity_name: str,
+        normalized_name: Optional[str] = None,
         **properties
     ) -> Dict[str, Any]:
         """Create a MENTIONS relationship from document to entity.
@@ -387,6 +487,8 @@ class DocumentRepository(ABC):
             doc_id: Document identifier
             entity_type: Entity type
             entity_name: Entity name
+            normalized_name: Already-normalized entity name, if the caller
+                has it; computed from entity_name otherwise
             **properties: Relationship properties (e.g., confidence)
             
         Returns:
@@ -417,7 +519,8 @@ class DocumentRepository(ABC):
         namespace: str,
         entity_type: str,
         entity_name: str,
-        limit: int = 10
+        limit: int = 10,
+        normalized_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Find documents that mention a specific entity.
         
@@ -426,6 +529,8 @@ class DocumentRepository(ABC):
             entity_type: Entity type
             entity_name: Entity name
             limit: Maximum number of results
+            normalized_name: Already-normalized entity name, if the caller
+                has it; computed from entity_name otherwise
             
         Returns:
             list: List of related documents
@@ -16,6 +16,14 @@ class SchemaError(GraphError):
     pass
 
 
+class QueryError(GraphError):
+    """A query was rejected or aborted by the database (e.g. it timed out)."""
+    
+    def __init__(self, message: str, query: str = ""):
+        self.query = query
+        super().__init__(message)
+
+
 class EntityNotFoundError(GraphError):
     """Entity not found in graph."""
     
@@ -60,3 +68,8 @@ class InvalidNamespaceError(GraphError):
         if reason:
             msg += f" - {reason}"
         super().__init__(msg)
+
+
+# Legacy names kept as aliases so there is a single class hierarchy
+GraphDatabaseError = GraphError
+Neo4jConnectionError = ConnectionError
@@ -7,7 +7,7 @@ The factory ensures that consumers (CLI, business logic) only depend on abstract
 interfaces, not concrete implementations.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Tuple, Type
 from kg_forge.graph.base import (
     GraphClient,
     EntityRepository,
@@ -20,6 +20,59 @@ if TYPE_CHECKING:
     from kg_forge.config.settings import Settings
 
 
+# Client type -> (entity repository, document repository, schema manager).
+# Filled on first use so backend modules are only imported when needed.
+_REPO_REGISTRY: Dict[
+    Type[GraphClient],
+    Tuple[Type[EntityRepository], Type[DocumentRepository], Type[SchemaManager]]
+] = {}
+
+
+def _load_registry() -> None:
+    """Register the built-in backends."""
+    # Import here to avoid circular dependencies
+    from kg_forge.graph.neo4j.client import Neo4jClient
+    from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
+    from kg_forge.graph.neo4j.document_repo import Neo4jDocumentRepository
+    from kg_forge.graph.neo4j.schema import Neo4jSchemaManager
+    
+    _REPO_REGISTRY[Neo4jClient] = (
+        Neo4jEntityRepository,
+        Neo4jDocumentRepository,
+        Neo4jSchemaManager,
+    )
+
+
+def _backend_classes(client: GraphClient, kind: str):
+    """Look up the repository classes registered for a client's type.
+    
+    Args:
+        client: Graph client instance
+        kind: Human-readable name of the requested component, for errors
+        
+    Returns:
+        tuple: (entity repository, document repository, schema manager) classes
+        
+    Raises:
+        GraphError: If client type is not supported
+    """
+    if not _REPO_REGISTRY:
+        _load_registry()
+    
+    client_type = type(client)
+    classes = _REPO_REGISTRY.get(client_type)
+    if classes is None:
+        # Subclasses and objects that only pass isinstance (e.g. spec'd
+        # mocks) share the repositories of the registered client they match
+        for registered, candidate in list(_REPO_REGISTRY.items()):
+            if isinstance(client, registered):
+                classes = candidate
+                break
+        else:
+            raise GraphError(f"No {kind} available for client type: {client_type.__name__}")
+    return classes
+
+
 def get_graph_client(config: "Settings") -> GraphClient:
     """Get graph client based on configuration.
     
@@ -41,7 +94,13 @@ def get_graph_client(config: "Settings") -> GraphClient:
         return Neo4jClient(
             uri=config.neo4j.uri,
             username=config.neo4j.username,
-            password=config.neo4j.password
+            password=config.neo4j.password,
+            max_connection_pool_size=config.neo4j.max_connection_pool_size,
+            connection_acquisition_timeout=config.neo4j.connection_acquisition_timeout,
+            query_timeout=getattr(backend, 'query_timeout', None),
+            batch_size=getattr(backend, 'batch_size', 1000),
+            warmup=getattr(backend, 'warmup', False),
+            warmup_queries=getattr(backend, 'warm_queries', None)
         )
     else:
         raise GraphError(f"Unsupported graph backend: {backend_type}")
@@ -59,14 +118,7 @@ def get_entity_repository(client: GraphClient) -> EntityRepository:
     Raises:
         GraphError: If client type is not supported
     """
-    # Import here to avoid circular dependencies
-    from kg_forge.graph.neo4j.client import Neo4jClient
-    from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
-    
-    if isinstance(client, Neo4jClient):
-        return Neo4jEntityRepository(client)
-    else:
-        raise GraphError(f"No entity repository available for client type: {type(client).__name__}")
+    return _backend_classes(client, "entity repository")[0](client)
 
 
 def get_document_repository(client: GraphClient) -> DocumentRepository:
@@ -81,14 +133,7 @@ def get_document_repository(client: GraphClient) -> DocumentRepository:
     Raises:
         GraphError: If client type is not supported
     """
-    # Import here to avoid circular dependencies
-    from kg_forge.graph.neo4j.client import Neo4jClient
-    from kg_forge.graph.neo4j.document_repo import Neo4jDocumentRepository
-    
-    if isinstance(client, Neo4jClient):
-        return Neo4jDocumentRepository(client)
-    else:
-        raise GraphError(f"No document repository available for client type: {type(client).__name__}")
+    return _backend_classes(client, "document repository")[1](client)
 
 
 def get_schema_manager(client: GraphClient) -> SchemaManager:
@@ -103,11 +148,4 @@ def get_schema_manager(client: GraphClient) -> SchemaManager:
     Raises:
         GraphError: If client type is not supported
     """
-    # Import here to avoid circular dependencies
-    from kg_forge.graph.neo4j.client import Neo4jClient
-    from kg_forge.graph.neo4j.schema import Neo4jSchemaManager
-    
-    if isinstance(client, Neo4jClient):
-        return Neo4jSchemaManager(client)
-    else:
-        raise GraphError(f"No schema manager available for client type: {type(client).__name__}")
+    return _backend_classes(client, "schema manager")[2](client)
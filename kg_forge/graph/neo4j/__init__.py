@@ -2,16 +2,44 @@
 
 This package provides concrete implementations of the graph interfaces
 specifically for Neo4j database.
+
+Exported names are resolved lazily (PEP 562): the Neo4j driver is only
+imported once one of the classes is actually used.
 """
 
-from kg_forge.graph.neo4j.client import Neo4jClient
-from kg_forge.graph.neo4j.schema import Neo4jSchemaManager
-from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
-from kg_forge.graph.neo4j.document_repo import Neo4jDocumentRepository
+import importlib
 
 __all__ = [
     "Neo4jClient",
+    "AsyncNeo4jClient",
     "Neo4jSchemaManager",
     "Neo4jEntityRepository",
     "Neo4jDocumentRepository",
+    "AsyncNeo4jEntityRepository",
+    "AsyncNeo4jDocumentRepository",
 ]
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "Neo4jClient": ".client",
+    "AsyncNeo4jClient": ".async_client",
+    "Neo4jSchemaManager": ".schema",
+    "Neo4jEntityRepository": ".entity_repo",
+    "Neo4jDocumentRepository": ".document_repo",
+    "AsyncNeo4jEntityRepository": ".async_repos",
+    "AsyncNeo4jDocumentRepository": ".async_repos",
+}
+
+
+def __getattr__(name):
+    """Import exported names on first access."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
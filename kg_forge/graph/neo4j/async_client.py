@@ -0,0 +1,228 @@
+"""Async Neo4j client implementation for graph database operations."""
+
+import logging
+from typing import List, Dict, Any, Optional
+from neo4j import AsyncGraphDatabase, AsyncDriver, READ_ACCESS, WRITE_ACCESS
+from neo4j.exceptions import ServiceUnavailable, AuthError
+
+from kg_forge.graph.base import AsyncGraphClient
+from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+from kg_forge.graph.neo4j.client import Neo4jClient, WriteSummary
+from kg_forge.graph.neo4j.query_errors import wrap_async_query_errors
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNeo4jClient(AsyncGraphClient):
+    """Neo4j implementation of AsyncGraphClient.
+    
+    Same API as Neo4jClient, but every operation is a coroutine backed by
+    the driver's AsyncGraphDatabase, so many queries can be in flight on a
+    single event loop.
+    """
+    
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        database: str = "neo4j",
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0
+    ):
+        """Initialize async Neo4j client.
+        
+        Args:
+            uri: Neo4j connection URI (e.g., bolt://localhost:7687)
+            username: Database username
+            password: Database password
+            database: Database name (default: neo4j)
+            max_connection_pool_size: Maximum number of pooled Bolt
+                connections kept by the driver (default: 100)
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection before failing (default: 60)
+        """
+        self.uri = uri
+        self.username = username
+        self.password = password
+        self.database = database
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self._driver: Optional[AsyncDriver] = None
+        
+    async def connect(self) -> bool:
+        """Connect to Neo4j database.
+        
+        Calling this again on a connected client is a no-op; a driver whose
+        verification fails is closed rather than kept.
+        
+        Returns:
+            bool: True if connection successful
+            
+        Raises:
+            GraphConnectionError: If connection fails
+        """
+        if self._driver is not None:
+            return True
+        
+        driver = None
+        try:
+            driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                keep_alive=True
+            )
+            # Verify connectivity
+            await driver.verify_connectivity()
+        except Exception as e:
+            if driver is not None:
+                await driver.close()
+            if isinstance(e, AuthError):
+                raise GraphConnectionError(f"Authentication failed: {e}")
+            if isinstance(e, ServiceUnavailable):
+                raise GraphConnectionError(f"Neo4j service unavailable: {e}")
+            raise GraphConnectionError(f"Failed to connect to Neo4j: {e}")
+        
+        self._driver = driver
+        logger.info(f"Connected to Neo4j at {self.uri} (async)")
+        return True
+    
+    async def close(self) -> None:
+        """Close the database connection.
+        
+        Idempotent - safe to call multiple times.
+        """
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+            logger.info("Closed Neo4j connection")
+    
+    async def verify_connectivity(self) -> bool:
+        """Verify that the database is accessible.
+        
+        Returns:
+            bool: True if database responds, False otherwise
+        """
+        if not self._driver:
+            return False
+        
+        try:
+            await self._driver.verify_connectivity()
+            return True
+        except Exception as e:
+            logger.error(f"Connectivity verification failed: {e}")
+            return False
+    
+    @wrap_async_query_errors("Query execution")
+    async def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        read_only: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a read query and return results.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            read_only: True to route as a read, False as a write; None
+                guesses from the query text
+            
+        Returns:
+            list: List of result records as dictionaries
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters or {}
+        
+        if read_only is None:
+            is_write = Neo4jClient._is_write(query)
+        else:
+            is_write = not read_only
+        access_mode = WRITE_ACCESS if is_write else READ_ACCESS
+        
+        async def _tx_function(tx):
+            result = await tx.run(query, parameters)
+            return await result.data()
+        
+        async with self._driver.session(
+            database=self.database, default_access_mode=access_mode
+        ) as session:
+            if is_write:
+                return await session.execute_write(_tx_function)
+            return await session.execute_read(_tx_function)
+    
+    @wrap_async_query_errors("Write query execution")
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> WriteSummary:
+        """Execute a write query and return summary.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            WriteSummary: Query execution counters
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters or {}
+        
+        async with self._driver.session(database=self.database) as session:
+            result = await session.run(query, parameters)
+            summary = await result.consume()
+            return WriteSummary.from_counters(summary.counters)
+    
+    @wrap_async_query_errors("Write transaction")
+    async def execute_write_tx(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a write transaction and return results.
+        
+        Useful for write queries that also return data (e.g., MERGE ... RETURN).
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            list: List of result records as dictionaries
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters or {}
+        
+        async def _tx_function(tx):
+            result = await tx.run(query, parameters)
+            return await result.data()
+        
+        async with self._driver.session(database=self.database) as session:
+            return await session.execute_write(_tx_function)
+    
+    @property
+    def driver(self) -> Optional[AsyncDriver]:
+        """Get the underlying async Neo4j driver.
+        
+        Returns:
+            AsyncDriver: Async Neo4j driver instance, or None if not connected
+        """
+        return self._driver
@@ -0,0 +1,157 @@
+"""Async Neo4j repositories for concurrent lookups.
+
+These mirror the read paths of Neo4jEntityRepository and
+Neo4jDocumentRepository on top of AsyncNeo4jClient, so callers running on an
+event loop can issue many independent lookups at once with asyncio.gather
+instead of paying one round-trip after another.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List, Tuple
+
+from kg_forge.graph.base import EntityRepository
+from kg_forge.graph.neo4j.async_client import AsyncNeo4jClient
+from kg_forge.graph.neo4j.document_repo import DOCUMENT_EXISTS_QUERY, GET_DOCUMENT_QUERY
+from kg_forge.graph.neo4j.entity_repo import GET_ENTITY_QUERY
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNeo4jEntityRepository:
+    """Async entity lookups backed by AsyncNeo4jClient."""
+    
+    def __init__(self, client: AsyncNeo4jClient):
+        """Initialize async entity repository.
+        
+        Args:
+            client: Async Neo4j client instance
+        """
+        self.client = client
+    
+    async def get_entity(
+        self,
+        namespace: str,
+        entity_type: str,
+        name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get an entity by type and name.
+        
+        Args:
+            namespace: Namespace for isolation
+            entity_type: Type of entity
+            name: Entity name (will be normalized for lookup)
+            
+        Returns:
+            dict: Entity data, or None if not found
+        """
+        params = {
+            "namespace": namespace,
+            "entity_type": entity_type,
+            "normalized_name": EntityRepository.normalize_name(name)
+        }
+        
+        try:
+            result = await self.client.execute_query(GET_ENTITY_QUERY, params, read_only=True)
+            if result and result[0].get('e'):
+                return dict(result[0]['e'])
+            return None
+        except Exception as e:
+            logger.error("Failed to get entity: %s", e)
+            return None
+    
+    async def bulk_get_entities(
+        self,
+        namespace: str,
+        keys: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Look up many entities concurrently.
+        
+        Args:
+            namespace: Namespace for isolation
+            keys: (entity_type, name) pairs
+            
+        Returns:
+            list: Entity data (or None) for each key, in input order
+        """
+        return list(await asyncio.gather(
+            *(self.get_entity(namespace, entity_type, name) for entity_type, name in keys)
+        ))
+
+
+class AsyncNeo4jDocumentRepository:
+    """Async document lookups backed by AsyncNeo4jClient."""
+    
+    def __init__(self, client: AsyncNeo4jClient):
+        """Initialize async document repository.
+        
+        Args:
+            client: Async Neo4j client instance
+        """
+        self.client = client
+    
+    async def get_document(
+        self,
+        namespace: str,
+        doc_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a document by ID.
+        
+        Args:
+            namespace: Namespace for isolation
+            doc_id: Document identifier
+            
+        Returns:
+            dict: Document data, or None if not found
+        """
+        params = {"namespace": namespace, "doc_id": doc_id}
+        
+        try:
+            result = await self.client.execute_query(GET_DOCUMENT_QUERY, params, read_only=True)
+            if result and result[0].get('d'):
+                return dict(result[0]['d'])
+            return None
+        except Exception as e:
+            logger.error("Failed to get document: %s", e)
+            return None
+    
+    async def document_exists(
+        self,
+        namespace: str,
+        doc_id: str
+    ) -> bool:
+        """Check if a document exists.
+        
+        Args:
+            namespace: Namespace for isolation
+            doc_id: Document identifier
+            
+        Returns:
+            bool: True if document exists
+        """
+        params = {"namespace": namespace, "doc_id": doc_id}
+        
+        try:
+            result = await self.client.execute_query(DOCUMENT_EXISTS_QUERY, params, read_only=True)
+            return bool(result[0]['exists']) if result else False
+        except Exception as e:
+            logger.error("Failed to check document existence: %s", e)
+            return False
+    
+    async def bulk_get_documents(
+        self,
+        namespace: str,
+        doc_ids: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Look up many documents concurrently.
+        
+        Args:
+            namespace: Namespace for isolation
+            doc_ids: Document identifiers
+            
+        Returns:
+            list: Document data (or None) for each ID, in input order
+        """
+        return list(await asyncio.gather(
+            *(self.get_document(namespace, doc_id) for doc_id in doc_ids)
+        ))
@@ -1,15 +1,142 @@
 """Neo4j client implementation for graph database operations."""
 
+import atexit
+import contextlib
+import copy
+import functools
+import importlib.util
 import logging
-from typing import List, Dict, Any, Optional
-from neo4j import GraphDatabase, Driver, Session, Result
-from neo4j.exceptions import ServiceUnavailable, AuthError
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
 
 from kg_forge.graph.base import GraphClient
 from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+from kg_forge.graph.neo4j.query_errors import wrap_query_errors
+
+# The neo4j driver is imported on first connect() to keep CLI startup fast
+if TYPE_CHECKING:
+    from neo4j import Driver
+    from kg_forge.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Session access modes (same values as neo4j.READ_ACCESS / neo4j.WRITE_ACCESS)
+READ_ACCESS = "READ"
+WRITE_ACCESS = "WRITE"
+
+# Shared parameter map for queries called without parameters; never mutated
+# (the driver copies parameters before use)
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
+# Cheap reads run after connecting so index and store pages are loaded
+# before the first real query
+DEFAULT_WARMUP_QUERIES = (
+    "SHOW INDEXES YIELD name RETURN count(name)",
+    "MATCH (n) RETURN count(n)",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def rust_codec_available() -> bool:
+    """Check whether the optional neo4j-rust-ext codec is installed.
+    
+    When present the driver uses it transparently for Bolt (de)serialization;
+    install it with ``pip install kg-forge[fast]``.
+    """
+    try:
+        return importlib.util.find_spec("neo4j._rust") is not None
+    except ImportError:
+        return False
+
+
+class WriteSummary(NamedTuple):
+    """Counters reported by Neo4j for a write query.
+    
+    For callers written against the previous dict return type it also
+    supports the read-only mapping API keyed by counter name:
+    ``summary["nodes_created"]``, ``in``, ``get``, ``keys``, ``items``,
+    ``values`` and ``dict(summary)``. Iteration and integer indexing keep
+    tuple semantics; use ``_asdict()`` for a real dict.
+    """
+    nodes_created: int = 0
+    nodes_deleted: int = 0
+    relationships_created: int = 0
+    relationships_deleted: int = 0
+    properties_set: int = 0
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the named counter, or default if there is no such counter."""
+        return getattr(self, key) if key in self._fields else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Return the counter names."""
+        return self._fields
+    
+    def values(self) -> Tuple[int, ...]:
+        """Return the counter values, in the order of keys()."""
+        return tuple(self)
+    
+    def items(self) -> List[Tuple[str, int]]:
+        """Return (name, value) pairs for every counter."""
+        return list(zip(self._fields, self))
+    
+    @classmethod
+    def from_counters(cls, counters) -> "WriteSummary":
+        """Build a summary from a neo4j SummaryCounters object."""
+        return cls(
+            counters.nodes_created,
+            counters.nodes_deleted,
+            counters.relationships_created,
+            counters.relationships_deleted,
+            counters.properties_set,
+        )
+    
+    def __add__(self, other):
+        if isinstance(other, WriteSummary):
+            return WriteSummary(*(a + b for a, b in zip(self, other)))
+        return tuple.__add__(self, other)
+
+
+# Drivers shared across clients with identical connection settings:
+# key -> [driver, number of connected clients using it]
+_DRIVER_CACHE: Dict[Tuple[Any, ...], List[Any]] = {}
+_DRIVER_CACHE_LOCK = threading.Lock()
+
+# Process-wide clients handed out by Neo4jClient.get_shared_client
+_SHARED_CLIENTS: Dict[Tuple[Any, ...], "Neo4jClient"] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+# Queries matching this are routed as writes and never served from the read cache
+_WRITE_RE = re.compile(
+    r"\b(?:MERGE|CREATE|SET|DELETE|REMOVE|DROP|CALL)\b", re.IGNORECASE
+)
+
+
+def _describe_unwind(query_template, rows, *args, **kwargs):
+    """Log the template and row count of a failed execute_unwind_write."""
+    return query_template, f"<{len(rows)} rows>"
+
+
+def _describe_statements(statements):
+    """Log the distinct query texts and count of a failed write batch."""
+    queries = "\n".join(dict.fromkeys(query for query, _ in statements))
+    return queries, f"<{len(statements)} statements>"
+
 
 class Neo4jClient(GraphClient):
     """Neo4j implementation of GraphClient.
@@ -23,7 +150,15 @@ class Neo4jClient(GraphClient):
         uri: str,
         username: str,
         password: str,
-        database: str = "neo4j"
+        database: str = "neo4j",
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        query_cache_size: int = 0,
+        query_cache_ttl: float = 60.0,
+        query_timeout: Optional[float] = None,
+        batch_size: int = 1000,
+        warmup: bool = False,
+        warmup_queries: Optional[List[str]] = None
     ):
         """Initialize Neo4j client.
         
@@ -32,48 +167,197 @@ class Neo4jClient(GraphClient):
             username: Database username
             password: Database password
             database: Database name (default: neo4j)
+            max_connection_pool_size: Maximum number of pooled Bolt
+                connections kept by the driver (default: 100)
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection before failing (default: 60)
+            query_cache_size: Maximum number of read results kept in the
+                query cache; 0 disables caching (default: 0). Only writes
+                made through this client invalidate it, so enable it only
+                when no other process writes to the database concurrently
+            query_cache_ttl: Seconds a cached read result stays valid
+                (default: 60)
+            query_timeout: Default transaction timeout in seconds for
+                queries; None uses the server setting (default: None)
+            batch_size: Default number of rows sent per transaction by
+                execute_unwind_write (default: 1000)
+            warmup: Run warm-up reads after connecting (default: False)
+            warmup_queries: Extra read queries to run during warm-up
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
-        self._driver: Optional[Driver] = None
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self._driver: Optional["Driver"] = None
+        self._verified = False
+        # Server agent string (e.g. "Neo4j/5.20.0") from the connect handshake
+        self.server_agent: Optional[str] = None
+        self.query_timeout = query_timeout
+        self.batch_size = batch_size
+        self.warmup = warmup
+        self.warmup_queries = list(warmup_queries or [])
+        self.query_cache_size = query_cache_size
+        self.query_cache_ttl = query_cache_ttl
+        self._query_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Session bound by batch_session(), per thread
+        self._local = threading.local()
         
-    def connect(self) -> bool:
+    @classmethod
+    def get_shared_client(cls, config: "Settings") -> "Neo4jClient":
+        """Get the process-wide connected client for these settings.
+        
+        Every call with equivalent connection settings returns the same
+        instance, so repositories built from it share one driver and its
+        warm connection pool. Shared clients are closed at interpreter exit
+        (or explicitly via close_shared_clients); callers should not close
+        them themselves.
+        
+        Args:
+            config: Application settings
+            
+        Returns:
+            Neo4jClient: Connected shared client
+            
+        Raises:
+            GraphConnectionError: If connection fails
+        """
+        from kg_forge.graph.factory import get_graph_client
+        
+        candidate = get_graph_client(config)
+        key = candidate._driver_key() + (candidate.database,)
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(key)
+            if client is None:
+                candidate.connect()
+                if not _SHARED_CLIENTS:
+                    atexit.register(cls.close_shared_clients)
+                client = _SHARED_CLIENTS[key] = candidate
+        return client
+    
+    @staticmethod
+    def close_shared_clients() -> None:
+        """Close every client handed out by get_shared_client."""
+        with _SHARED_CLIENTS_LOCK:
+            clients = list(_SHARED_CLIENTS.values())
+            _SHARED_CLIENTS.clear()
+        for client in clients:
+            client.close()
+    
+    def connect(self, skip_verify: bool = False) -> bool:
         """Connect to Neo4j database.
         
+        Calling this again on a connected, verified client is a no-op.
+        
+        Args:
+            skip_verify: Skip the connectivity handshake (for callers that
+                trust the endpoint); errors then surface on the first query
+        
         Returns:
             bool: True if connection successful
             
         Raises:
             GraphConnectionError: If connection fails
         """
-        try:
-            self._driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.username, self.password)
-            )
-            # Verify connectivity
-            self._driver.verify_connectivity()
-            logger.info(f"Connected to Neo4j at {self.uri}")
+        if self._driver is not None and (self._verified or skip_verify):
             return True
+        
+        from neo4j.exceptions import ServiceUnavailable, AuthError
+        
+        try:
+            if self._driver is None:
+                self._driver = self._acquire_driver()
+            if not skip_verify:
+                # Verify connectivity; the same handshake reports the server
+                # version, so nothing needs to query dbms.components() later
+                self.server_agent = self._driver.get_server_info().agent
+                self._verified = True
+            logger.info(f"Connected to Neo4j at {self.uri} ({self.server_agent or 'unverified'})")
         except AuthError as e:
             raise GraphConnectionError(f"Authentication failed: {e}")
         except ServiceUnavailable as e:
             raise GraphConnectionError(f"Neo4j service unavailable: {e}")
         except Exception as e:
             raise GraphConnectionError(f"Failed to connect to Neo4j: {e}")
+        
+        if self.warmup and self._verified:
+            self._warm_up()
+        return True
+    
+    def _warm_up(self) -> None:
+        """Run the warm-up reads; failures are logged and ignored."""
+        queries = list(DEFAULT_WARMUP_QUERIES) + self.warmup_queries
+        try:
+            with self._session(READ_ACCESS, reuse_bound=False) as session:
+                for query in queries:
+                    session.run(query).consume()
+            logger.debug(f"Ran {len(queries)} warm-up queries")
+        except Exception as e:
+            logger.warning(f"Warm-up queries failed: {e}")
     
     def close(self) -> None:
         """Close the database connection.
         
         Idempotent - safe to call multiple times.
         """
+        self.cache_clear()
+        self._verified = False
         if self._driver:
-            self._driver.close()
+            self._release_driver()
             self._driver = None
             logger.info("Closed Neo4j connection")
     
+    def _driver_key(self) -> Tuple[Any, ...]:
+        """Key identifying drivers that can be shared with this client."""
+        return (
+            self.uri,
+            self.username,
+            self.password,
+            self.max_connection_pool_size,
+            self.connection_acquisition_timeout,
+        )
+    
+    def _acquire_driver(self) -> "Driver":
+        """Get a shared driver for this client's settings, creating it if needed."""
+        from neo4j import GraphDatabase
+        
+        key = self._driver_key()
+        with _DRIVER_CACHE_LOCK:
+            entry = _DRIVER_CACHE.get(key)
+            if entry is None:
+                driver = GraphDatabase.driver(
+                    self.uri,
+                    auth=(self.username, self.password),
+                    max_connection_pool_size=self.max_connection_pool_size,
+                    connection_acquisition_timeout=self.connection_acquisition_timeout,
+                    keep_alive=True
+                )
+                entry = _DRIVER_CACHE[key] = [driver, 0]
+                logger.info(
+                    "Created Neo4j driver for %s (Rust PackStream codec: %s)",
+                    self.uri, "active" if rust_codec_available() else "not installed"
+                )
+            entry[1] += 1
+            return entry[0]
+    
+    def _release_driver(self) -> None:
+        """Drop this client's reference; close the driver when no client uses it."""
+        key = self._driver_key()
+        with _DRIVER_CACHE_LOCK:
+            entry = _DRIVER_CACHE.get(key)
+            if entry is None or entry[0] is not self._driver:
+                # Not a shared driver (e.g. injected directly)
+                self._driver.close()
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _DRIVER_CACHE[key]
+                entry[0].close()
+    
     def verify_connectivity(self) -> bool:
         """Verify that the database is accessible.
         
@@ -90,81 +374,254 @@ class Neo4jClient(GraphClient):
             logger.error(f"Connectivity verification failed: {e}")
             return False
     
+    @wrap_query_errors("Query execution")
     def execute_query(
         self,
         query: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        read_only: Optional[bool] = None,
+        cache: bool = True
     ) -> List[Dict[str, Any]]:
         """Execute a read query and return results.
         
+        Reads run in read transactions, which a cluster routes to followers
+        or read replicas; writes go to the leader.
+        
         Args:
             query: Cypher query string
             parameters: Query parameters
+            timeout: Transaction timeout in seconds (default: query_timeout)
+            read_only: True to route as a read, False as a write; None
+                guesses from the query text
+            cache: Set False to bypass the read cache for this query (for
+                callers that keep their own cache or need fresh data)
             
         Returns:
             list: List of result records as dictionaries
             
         Raises:
             GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
         """
         if not self._driver:
             raise GraphConnectionError("Not connected to database")
         
-        parameters = parameters or {}
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
         
-        try:
-            with self._driver.session(database=self.database) as session:
-                result = session.run(query, parameters)
-                return [dict(record) for record in result]
-        except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Parameters: {parameters}")
-            raise GraphConnectionError(f"Query execution failed: {e}")
+        is_write = self._is_write(query) if read_only is None else not read_only
+        key = None if is_write or not cache else self._cache_key(query, parameters)
+        if is_write:
+            # Writes issued through execute_query invalidate cached reads too
+            self.cache_clear()
+        elif key is not None:
+            with self._cache_lock:
+                entry = self._query_cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._query_cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return copy.deepcopy(entry[1])
+                self.cache_misses += 1
+        
+        def _tx_function(tx):
+            return tx.run(query, parameters).data()
+        
+        _tx_function = self._with_timeout(_tx_function, timeout)
+        access_mode = WRITE_ACCESS if is_write else READ_ACCESS
+        
+        with self._session(access_mode) as session:
+            # Managed transactions retry transient errors, and reads can
+            # be routed to replicas in a cluster
+            if is_write:
+                rows = session.execute_write(_tx_function)
+            else:
+                rows = session.execute_read(_tx_function)
+        
+        if key is not None:
+            with self._cache_lock:
+                # Rows hold nested node/property dicts; copy them so callers
+                # mutating a result cannot change later hits
+                self._query_cache[key] = (
+                    time.monotonic() + self.query_cache_ttl,
+                    copy.deepcopy(rows),
+                )
+                self._query_cache.move_to_end(key)
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+        
+        return rows
+    
+    @wrap_query_errors("Query execution")
+    def execute_scalar(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        read_only: Optional[bool] = None
+    ) -> Any:
+        """Execute a query and return the first value of its first record.
+        
+        Meant for existence checks and counts: only one record is pulled and
+        no row dicts are built. Results are not cached.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            timeout: Transaction timeout in seconds (default: query_timeout)
+            read_only: True to route as a read, False as a write; None
+                guesses from the query text
+            
+        Returns:
+            The first column of the first record, or None if there are no rows
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
+        
+        is_write = self._is_write(query) if read_only is None else not read_only
+        if is_write:
+            self.cache_clear()
+        
+        def _tx_function(tx):
+            record = tx.run(query, parameters).single(strict=False)
+            return None if record is None else record[0]
+        
+        _tx_function = self._with_timeout(_tx_function, timeout)
+        access_mode = WRITE_ACCESS if is_write else READ_ACCESS
+        
+        with self._session(access_mode) as session:
+            if is_write:
+                return session.execute_write(_tx_function)
+            return session.execute_read(_tx_function)
+    
+    @wrap_query_errors("Read query")
+    def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a read query through the driver's ``execute_query`` API.
+        
+        The driver runs the query in one routed read transaction with
+        retries and bookmarks handled internally, without a session object
+        on our side. Meant for metadata and statistics reads; results are
+        not cached. Inside batch_session() the bound session is used.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            timeout: Transaction timeout in seconds (default: query_timeout)
+            
+        Returns:
+            list: List of result records as dictionaries
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
+        
+        bound = getattr(self._local, "session", None)
+        if bound is not None:
+            def _tx_function(tx):
+                return tx.run(query, parameters).data()
+            return bound.execute_read(self._with_timeout(_tx_function, timeout))
+        
+        from neo4j import RoutingControl
+        return self._driver.execute_query(
+            self._as_query(query, timeout),
+            parameters,
+            routing_=RoutingControl.READ,
+            database_=self.database,
+            result_transformer_=lambda result: result.data(),
+        )
+    
+    @wrap_query_errors("Query execution")
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        read_only: Optional[bool] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Execute a read query and yield records as they arrive.
+        
+        Unlike execute_query, results are neither materialized nor cached,
+        so callers that only need the first few rows can stop early. The
+        session stays open until the generator is exhausted or closed.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            read_only: True to route as a read, False as a write; None
+                guesses from the query text
+            
+        Yields:
+            dict: Result records as dictionaries
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
+        
+        is_write = self._is_write(query) if read_only is None else not read_only
+        access_mode = WRITE_ACCESS if is_write else READ_ACCESS
+        
+        with self._session(access_mode, reuse_bound=False) as session:
+            result = session.run(query, parameters)
+            for record in result:
+                yield record.data()
     
+    @wrap_query_errors("Write query execution")
     def execute_write(
         self,
         query: str,
-        parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> WriteSummary:
         """Execute a write query and return summary.
         
         Args:
             query: Cypher query string
             parameters: Query parameters
+            timeout: Transaction timeout in seconds (default: query_timeout)
             
         Returns:
-            dict: Query execution summary
+            WriteSummary: Query execution counters
             
         Raises:
             GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
         """
         if not self._driver:
             raise GraphConnectionError("Not connected to database")
         
-        parameters = parameters or {}
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
         
-        try:
-            with self._driver.session(database=self.database) as session:
-                result = session.run(query, parameters)
-                summary = result.consume()
-                return {
-                    "nodes_created": summary.counters.nodes_created,
-                    "nodes_deleted": summary.counters.nodes_deleted,
-                    "relationships_created": summary.counters.relationships_created,
-                    "relationships_deleted": summary.counters.relationships_deleted,
-                    "properties_set": summary.counters.properties_set,
-                }
-        except Exception as e:
-            logger.error(f"Write query execution failed: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Parameters: {parameters}")
-            raise GraphConnectionError(f"Write query execution failed: {e}")
+        self.cache_clear()
+        
+        with self._session() as session:
+            result = session.run(self._as_query(query, timeout), parameters)
+            return WriteSummary.from_counters(result.consume().counters)
     
+    @wrap_query_errors("Write transaction")
     def execute_write_tx(
         self,
         query: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """Execute a write transaction and return results.
         
@@ -173,36 +630,346 @@ class Neo4jClient(GraphClient):
         Args:
             query: Cypher query string
             parameters: Query parameters
+            timeout: Transaction timeout in seconds (default: query_timeout)
             
         Returns:
             list: List of result records as dictionaries
             
         Raises:
             GraphConnectionError: If not connected or query fails
+            QueryError: If the query times out
         """
         if not self._driver:
             raise GraphConnectionError("Not connected to database")
         
-        parameters = parameters or {}
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
         
         def _tx_function(tx):
-            result = tx.run(query, parameters)
-            return [dict(record) for record in result]
+            return tx.run(query, parameters).data()
+        
+        _tx_function = self._with_timeout(_tx_function, timeout)
+        
+        self.cache_clear()
+        
+        with self._session() as session:
+            return session.execute_write(_tx_function)
+    
+    @wrap_query_errors("Auto-commit query")
+    def execute_auto_commit(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a write query in an implicit (auto-commit) transaction.
+        
+        Required for ``CALL { ... } IN TRANSACTIONS``, which commits as it
+        goes and cannot run inside a managed transaction. The query is not
+        retried on transient errors and is not atomic as a whole.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            list: List of result records as dictionaries
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        parameters = parameters if parameters is not None else _EMPTY_PARAMS
+        
+        self.cache_clear()
+        
+        with self._session(WRITE_ACCESS) as session:
+            return session.run(query, parameters).data()
+    
+    @wrap_query_errors("Batched write", describe=_describe_unwind)
+    def execute_unwind_write(
+        self,
+        query_template: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        count_key: Optional[str] = None
+    ) -> Union[WriteSummary, int]:
+        """Execute a write query once per batch of rows.
+        
+        The query must consume its input with ``UNWIND $rows AS row`` and
+        reference ``row.<field>``, so each batch costs a single round-trip
+        and commit instead of one per row.
+        
+        Args:
+            query_template: Cypher query string containing ``UNWIND $rows AS row``
+            rows: Parameter maps, one per row
+            batch_size: Maximum number of rows sent per transaction
+                (default: the client's batch_size)
+            parameters: Parameters shared by every batch, besides ``rows``
+            count_key: Column of the single record the query returns; when
+                given, its values are summed instead of the counters
+            
+        Returns:
+            Union[WriteSummary, int]: Query execution counters summed over
+            all batches, or the summed ``count_key`` column if given
+            
+        Raises:
+            GraphConnectionError: If not connected or query fails
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        if batch_size is None:
+            batch_size = self.batch_size
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        totals = WriteSummary() if count_key is None else 0
+        
+        def _tx_function(tx, chunk):
+            result = tx.run(query_template, dict(parameters or {}, rows=chunk))
+            if count_key is None:
+                return result.consume()
+            record = result.single()
+            return record[count_key] if record else 0
+        
+        self.cache_clear()
+        
+        with self._session() as session:
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                outcome = session.execute_write(_tx_function, chunk)
+                if count_key is None:
+                    totals += WriteSummary.from_counters(outcome.counters)
+                else:
+                    totals += outcome
+        
+        return totals
+    
+    def batched_writes(self, batch_size: int = 1000) -> "WriteBatch":
+        """Collect write queries and commit them in shared transactions.
+        
+        Usage:
+            with client.batched_writes(batch_size=500) as batch:
+                for row in rows:
+                    batch.add(query, row)
+            print(batch.summary.nodes_created)
+        
+        Args:
+            batch_size: Number of statements committed per transaction
+            
+        Returns:
+            WriteBatch: Context manager collecting the writes
+        """
+        return WriteBatch(self, batch_size)
+    
+    def execute_write_batch(self, queries: Sequence[str]) -> WriteSummary:
+        """Run several parameterless write statements in one transaction.
+        
+        Meant for short lists such as schema DDL, where one commit replaces
+        a round-trip and commit per statement.
+        
+        Args:
+            queries: Cypher statements, run in order
+            
+        Returns:
+            WriteSummary: Counters summed over all statements
+            
+        Raises:
+            GraphConnectionError: If not connected or the transaction fails
+        """
+        with self.batched_writes(batch_size=max(len(queries), 1)) as batch:
+            for query in queries:
+                batch.add(query)
+        return batch.summary
+    
+    @contextlib.contextmanager
+    def batch_session(self) -> Iterator[Any]:
+        """Run this thread's queries on one session until the block exits.
         
+        For callers issuing many small queries back to back (schema setup,
+        validation): execute_query, execute_scalar, the execute_write*
+        methods and write batches reuse the session instead of acquiring a
+        new one per call. Nested blocks reuse the outer session. stream_query
+        always opens its own session, since a session holds one open result
+        at a time.
+        
+        Yields:
+            The bound driver session
+            
+        Raises:
+            GraphConnectionError: If not connected
+        """
+        if not self._driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        bound = getattr(self._local, "session", None)
+        if bound is not None:
+            yield bound
+            return
+        
+        with self._session(reuse_bound=False) as session:
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
+    
+    @contextlib.contextmanager
+    def _session(
+        self,
+        access_mode: Optional[str] = None,
+        reuse_bound: bool = True
+    ) -> Iterator[Any]:
+        """Open a session, or reuse the one bound by batch_session().
+        
+        Every session names its database explicitly, so the driver never
+        has to resolve the user's home database first.
+        
+        Args:
+            access_mode: Default access mode (READ_ACCESS or WRITE_ACCESS)
+            reuse_bound: Use this thread's batch session when one is bound
+        """
+        if reuse_bound:
+            bound = getattr(self._local, "session", None)
+            if bound is not None:
+                yield bound
+                return
+        
+        kwargs = {"database": self.database}
+        if access_mode is not None:
+            kwargs["default_access_mode"] = access_mode
+        with self._driver.session(**kwargs) as session:
+            yield session
+    
+    def cache_clear(self) -> None:
+        """Drop all cached read results."""
+        with self._cache_lock:
+            self._query_cache.clear()
+    
+    def _effective_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Resolve a per-call timeout against the client default."""
+        return timeout if timeout is not None else self.query_timeout
+    
+    def _with_timeout(self, tx_function, timeout: Optional[float]):
+        """Attach a transaction timeout to a transaction function, if any."""
+        timeout = self._effective_timeout(timeout)
+        if timeout is None:
+            return tx_function
+        from neo4j import unit_of_work
+        return unit_of_work(timeout=timeout)(tx_function)
+    
+    def _as_query(self, query: str, timeout: Optional[float]):
+        """Wrap a query string for session.run with a timeout, if any."""
+        timeout = self._effective_timeout(timeout)
+        if timeout is None:
+            return query
+        from neo4j import Query
+        return Query(query, timeout=timeout)
+    
+    @staticmethod
+    def _is_write(query: str) -> bool:
+        """Return True if the query contains a clause that may write."""
+        return _WRITE_RE.search(query) is not None
+    
+    def _cache_key(self, query: str, parameters: Dict[str, Any]):
+        """Build the read-cache key for a read query, or None if it must not be cached."""
+        if self.query_cache_size <= 0:
+            return None
+        key = (query, tuple(sorted(parameters.items())))
         try:
-            with self._driver.session(database=self.database) as session:
-                return session.execute_write(_tx_function)
-        except Exception as e:
-            logger.error(f"Write transaction failed: {e}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Parameters: {parameters}")
-            raise GraphConnectionError(f"Write transaction failed: {e}")
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values (lists, dicts)
+            return None
+        return key
     
     @property
-    def driver(self) -> Optional[Driver]:
+    def driver(self) -> Optional["Driver"]:
         """Get the underlying Neo4j driver.
         
         Returns:
             Driver: Neo4j driver instance, or None if not connected
         """
         return self._driver
+
+
+class WriteBatch:
+    """Buffer of write statements committed together by a Neo4jClient.
+    
+    Statements are sent in a single managed write transaction each time
+    ``batch_size`` of them are buffered, and once more on exit, so the
+    commit (and transaction log flush) cost is paid per batch instead of
+    per statement. If the ``with`` block raises, unflushed statements are
+    discarded.
+    """
+    
+    def __init__(self, client: Neo4jClient, batch_size: int = 1000):
+        """Initialize the batch.
+        
+        Args:
+            client: Connected Neo4j client
+            batch_size: Number of statements committed per transaction
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.client = client
+        self.batch_size = batch_size
+        self.summary = WriteSummary()
+        self._buffer: List[Tuple[str, Dict[str, Any]]] = []
+    
+    def add(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
+        """Queue a write statement, flushing when the batch is full.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        """
+        self._buffer.append(
+            (query, parameters if parameters is not None else _EMPTY_PARAMS)
+        )
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> WriteSummary:
+        """Commit all buffered statements in one transaction.
+        
+        Returns:
+            WriteSummary: Counters for the flushed statements
+            
+        Raises:
+            GraphConnectionError: If not connected or the transaction fails
+        """
+        if not self._buffer:
+            return WriteSummary()
+        driver = self.client.driver
+        if not driver:
+            raise GraphConnectionError("Not connected to database")
+        
+        statements, self._buffer = self._buffer, []
+        flushed = self._commit(statements)
+        self.summary += flushed
+        return flushed
+    
+    @wrap_query_errors("Batched write transaction", describe=_describe_statements)
+    def _commit(self, statements: List[Tuple[str, Dict[str, Any]]]) -> WriteSummary:
+        """Run statements in one managed write transaction."""
+        def _tx_function(tx):
+            total = WriteSummary()
+            for query, parameters in statements:
+                total += WriteSummary.from_counters(tx.run(query, parameters).consume().counters)
+            return total
+        
+        self.client.cache_clear()
+        
+        with self.client._session() as session:
+            return session.execute_write(_tx_function)
+    
+    def __enter__(self) -> "WriteBatch":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffer.clear()
@@ -1,10 +1,17 @@
 """Neo4j document repository implementation."""
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Union
 
-from kg_forge.graph.base import DocumentRepository
+from kg_forge.graph.base import DocumentRepository, normalize_names_batch
 from kg_forge.graph.neo4j.client import Neo4jClient
+from kg_forge.graph.neo4j.lookup_cache import lookup_cache_for
+from kg_forge.graph.neo4j.entity_repo import (
+    IN_TRANSACTIONS_THRESHOLD,
+    Neo4jEntityRepository,
+    _in_transactions,
+)
+from kg_forge.models.graph import DocumentRow
 from kg_forge.graph.exceptions import (
     DocumentNotFoundError,
     EntityNotFoundError,
@@ -14,6 +21,51 @@ from kg_forge.graph.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+GET_DOCUMENT_QUERY = """
+        MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
+        RETURN d
+        """
+
+DOCUMENT_EXISTS_QUERY = """
+        RETURN EXISTS {
+            MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
+        } AS exists
+        """
+
+# Per-row bodies of the bulk writes; each ends by returning ``count``
+_BULK_DOCUMENT_MERGE = """
+        MERGE (d:Doc {namespace: $namespace, doc_id: row.doc_id})
+        ON CREATE SET
+            d.source_path = row.source_path,
+            d.content_hash = row.content_hash,
+            d.created_at = timestamp()
+        ON MATCH SET
+            d.source_path = row.source_path,
+            d.content_hash = row.content_hash,
+            d.updated_at = timestamp()
+        SET d += row.metadata
+        RETURN count(d) AS count"""
+
+_BULK_MENTION_MERGE = """
+        MATCH (d:Doc {namespace: $namespace, doc_id: row.doc_id})
+        MATCH (e:Entity {
+            namespace: $namespace,
+            entity_type: row.entity_type,
+            normalized_name: row.normalized_name
+        })
+        MERGE (d)-[r:MENTIONS]->(e)
+        ON CREATE SET
+            r.namespace = $namespace,
+            r.created_at = timestamp()
+        SET r += row.properties
+        RETURN count(r) AS count"""
+
+_BULK_DOCUMENT_QUERY = "UNWIND $rows AS row" + _BULK_DOCUMENT_MERGE
+_BULK_DOCUMENT_IN_TX_QUERY = _in_transactions(_BULK_DOCUMENT_MERGE)
+_BULK_MENTION_QUERY = "UNWIND $rows AS row" + _BULK_MENTION_MERGE
+_BULK_MENTION_IN_TX_QUERY = _in_transactions(_BULK_MENTION_MERGE)
+
+
 class Neo4jDocumentRepository(DocumentRepository):
     """Neo4j implementation of DocumentRepository.
     
@@ -27,6 +79,8 @@ class Neo4jDocumentRepository(DocumentRepository):
             client: Neo4j client instance
         """
         self.client = client
+        # Shared with every other repository on this client
+        self._lookups = lookup_cache_for(client)
     
     def create_document(
         self,
@@ -74,14 +128,56 @@ class Neo4jDocumentRepository(DocumentRepository):
             result = self.client.execute_write_tx(query, params)
             if result and result[0].get('d'):
                 doc_data = dict(result[0]['d'])
-                logger.info(f"Created/updated document: '{doc_id}' in namespace '{namespace}'")
+                logger.info("Created/updated document: '%s' in namespace '%s'", doc_id, namespace)
                 return doc_data
             
             raise GraphError("Failed to create document")
             
         except Exception as e:
-            logger.error(f"Failed to create document: {e}")
+            logger.error("Failed to create document: %s", e)
             raise GraphError(f"Failed to create document: {e}")
+        finally:
+            self._lookups.pop(("doc", namespace, doc_id))
+    
+    def bulk_create_documents(
+        self,
+        namespace: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """Create or update many documents with one transaction per batch.
+        
+        Args:
+            namespace: Namespace for isolation
+            rows: Dicts with ``doc_id``, ``source_path``, ``content_hash`` and
+                optional ``metadata``
+            batch_size: Maximum number of rows sent per transaction
+                (default: the client's batch_size)
+            
+        Returns:
+            int: Number of documents written
+            
+        Raises:
+            GraphError: If a batch fails
+        """
+        params_rows = [
+            {
+                "doc_id": row["doc_id"],
+                "source_path": row["source_path"],
+                "content_hash": row["content_hash"],
+                "metadata": row.get("metadata") or {},
+            }
+            for row in rows
+        ]
+        
+        try:
+            return self._bulk_write(
+                _BULK_DOCUMENT_QUERY, _BULK_DOCUMENT_IN_TX_QUERY,
+                namespace, params_rows, batch_size, "documents"
+            )
+        finally:
+            for row in params_rows:
+                self._lookups.pop(("doc", namespace, row["doc_id"]))
     
     def get_document(
         self,
@@ -97,10 +193,7 @@ class Neo4jDocumentRepository(DocumentRepository):
         Returns:
             dict: Document data, or None if not found
         """
-        query = """
-        MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
-        RETURN d
-        """
+        query = GET_DOCUMENT_QUERY
         
         params = {
             "namespace": namespace,
@@ -108,32 +201,76 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
+            result = self.client.execute_query(query, params, read_only=True)
             if result and result[0].get('d'):
                 return dict(result[0]['d'])
             return None
         except Exception as e:
-            logger.error(f"Failed to get document: {e}")
+            logger.error("Failed to get document: %s", e)
             return None
     
+    def get_documents(
+        self,
+        namespace: str,
+        doc_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many documents in a single query.
+        
+        Args:
+            namespace: Namespace for isolation
+            doc_ids: Document identifiers
+            
+        Returns:
+            dict: Document data keyed by doc_id; missing documents are absent
+        """
+        if not doc_ids:
+            return {}
+        
+        query = """
+        MATCH (d:Doc {namespace: $namespace})
+        WHERE d.doc_id IN $doc_ids
+        RETURN d
+        """
+        
+        params = {
+            "namespace": namespace,
+            "doc_ids": list(dict.fromkeys(doc_ids))
+        }
+        
+        try:
+            result = self.client.execute_query(query, params, read_only=True)
+            return {r['d']['doc_id']: dict(r['d']) for r in result}
+        except Exception as e:
+            logger.error("Failed to get documents: %s", e)
+            return {}
+    
     def document_exists(
         self,
         namespace: str,
-        doc_id: str
+        doc_id: str,
+        use_cache: bool = True
     ) -> bool:
         """Check if a document exists.
         
+        A positive result is memoized per client until this repository
+        writes the document or the entry expires. Misses are not memoized,
+        so a document written by another client is seen on the next call.
+        
         Args:
             namespace: Namespace for isolation
             doc_id: Document identifier
+            use_cache: Set False to always read from the database
             
         Returns:
             bool: True if document exists
         """
-        query = """
-        MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
-        RETURN count(d) as count
-        """
+        key = ("doc", namespace, doc_id)
+        if use_cache:
+            hit, cached = self._lookups.get(key)
+            if hit:
+                return cached
+        
+        query = DOCUMENT_EXISTS_QUERY
         
         params = {
             "namespace": namespace,
@@ -141,11 +278,14 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
-            return result[0]['count'] > 0 if result else False
+            exists = bool(self.client.execute_scalar(query, params, read_only=True))
         except Exception as e:
-            logger.error(f"Failed to check document existence: {e}")
+            logger.error("Failed to check document existence: %s", e)
             return False
+        
+        if exists:
+            self._lookups.put(key, True)
+        return exists
     
     def document_hash_exists(
         self,
@@ -162,8 +302,9 @@ class Neo4jDocumentRepository(DocumentRepository):
             bool: True if document with hash exists
         """
         query = """
-        MATCH (d:Doc {namespace: $namespace, content_hash: $content_hash})
-        RETURN count(d) as count
+        RETURN EXISTS {
+            MATCH (d:Doc {namespace: $namespace, content_hash: $content_hash})
+        } AS exists
         """
         
         params = {
@@ -172,10 +313,9 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
-            return result[0]['count'] > 0 if result else False
+            return bool(self.client.execute_scalar(query, params, read_only=True))
         except Exception as e:
-            logger.error(f"Failed to check document hash: {e}")
+            logger.error("Failed to check document hash: %s", e)
             return False
     
     def list_documents(
@@ -205,18 +345,54 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
+            result = self.client.execute_query(query, params, read_only=True)
             return [dict(r['d']) for r in result]
         except Exception as e:
-            logger.error(f"Failed to list documents: {e}")
+            logger.error("Failed to list documents: %s", e)
             return []
     
+    def iter_documents(
+        self,
+        namespace: str,
+        as_rows: bool = False
+    ) -> Iterator[Union[Dict[str, Any], DocumentRow]]:
+        """Stream all documents in namespace one at a time.
+        
+        Unlike list_documents there is no limit and nothing is buffered, so
+        large namespaces can be walked in constant memory and callers can
+        stop early.
+        
+        Args:
+            namespace: Namespace for isolation
+            as_rows: Yield slotted DocumentRow objects instead of dicts
+            
+        Yields:
+            dict or DocumentRow: Document data
+            
+        Raises:
+            GraphConnectionError: If the query fails
+        """
+        query = """
+        MATCH (d:Doc {namespace: $namespace})
+        RETURN d
+        ORDER BY d.doc_id
+        """
+        
+        records = self.client.stream_query(query, {"namespace": namespace}, read_only=True)
+        if as_rows:
+            for record in records:
+                yield DocumentRow.from_node(record['d'])
+        else:
+            for record in records:
+                yield record['d']
+    
     def add_mention(
         self,
         namespace: str,
         doc_id: str,
         entity_type: str,
         entity_name: str,
+        normalized_name: Optional[str] = None,
         **properties
     ) -> Dict[str, Any]:
         """Create a MENTIONS relationship from document to entity.
@@ -226,6 +402,8 @@ class Neo4jDocumentRepository(DocumentRepository):
             doc_id: Document identifier
             entity_type: Entity type
             entity_name: Entity name
+            normalized_name: Already-normalized entity name, if the caller
+                has it; computed from entity_name otherwise
             **properties: Relationship properties (e.g., confidence)
             
         Returns:
@@ -236,23 +414,29 @@ class Neo4jDocumentRepository(DocumentRepository):
             EntityNotFoundError: If entity doesn't exist
         """
         # Normalize entity name for lookup
-        from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
-        repo = Neo4jEntityRepository(self.client)
-        normalized_name = repo.normalize_name(entity_name)
+        if normalized_name is None:
+            normalized_name = Neo4jEntityRepository.normalize_name(entity_name)
         
+        # One round trip: probe both endpoints, MERGE only when both exist,
+        # and report which side is missing instead of re-querying
         query = """
-        MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
-        MATCH (e:Entity {
+        OPTIONAL MATCH (d:Doc {namespace: $namespace, doc_id: $doc_id})
+        OPTIONAL MATCH (e:Entity {
             namespace: $namespace,
             entity_type: $entity_type,
             normalized_name: $normalized_name
         })
-        MERGE (d)-[r:MENTIONS]->(e)
-        ON CREATE SET
-            r.namespace = $namespace,
-            r.created_at = timestamp()
-        SET r += $properties
-        RETURN r, d, e
+        WITH d, e
+        FOREACH (_ IN CASE WHEN d IS NOT NULL AND e IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (d)-[r:MENTIONS]->(e)
+            ON CREATE SET
+                r.namespace = $namespace,
+                r.created_at = timestamp()
+            SET r += $properties
+        )
+        WITH d, e
+        OPTIONAL MATCH (d)-[r:MENTIONS]->(e)
+        RETURN d IS NOT NULL AS has_doc, e IS NOT NULL AS has_ent, r
         """
         
         params = {
@@ -266,25 +450,118 @@ class Neo4jDocumentRepository(DocumentRepository):
         try:
             result = self.client.execute_write_tx(query, params)
             
-            if not result:
-                # Check which node is missing
-                doc_exists = self.document_exists(namespace, doc_id)
-                if not doc_exists:
-                    raise DocumentNotFoundError(namespace, doc_id)
+            row = result[0] if result else {}
+            if not row.get('has_doc'):
+                raise DocumentNotFoundError(namespace, doc_id)
+            if not row.get('has_ent'):
                 raise EntityNotFoundError(namespace, entity_type, entity_name)
             
             rel_data = dict(result[0]['r'])
             logger.info(
-                f"Created MENTIONS: Doc '{doc_id}' -> {entity_type}='{entity_name}'"
+                "Created MENTIONS: Doc '%s' -> %s='%s'", doc_id, entity_type, entity_name
             )
             return rel_data
             
         except (DocumentNotFoundError, EntityNotFoundError):
             raise
         except Exception as e:
-            logger.error(f"Failed to add mention: {e}")
+            logger.error("Failed to add mention: %s", e)
             raise GraphError(f"Failed to add mention: {e}")
     
+    def bulk_add_mentions(
+        self,
+        namespace: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """Create many MENTIONS relationships with one transaction per batch.
+        
+        Rows whose document or entity does not exist are skipped rather than
+        raising, so the returned count may be lower than ``len(rows)``.
+        
+        Args:
+            namespace: Namespace for isolation
+            rows: Dicts with ``doc_id``, ``entity_type``, ``entity_name`` and
+                optional ``properties``
+            batch_size: Maximum number of rows sent per transaction
+                (default: the client's batch_size)
+            
+        Returns:
+            int: Number of relationships written
+            
+        Raises:
+            GraphError: If a batch fails
+        """
+        normalized_names = normalize_names_batch([row["entity_name"] for row in rows])
+        params_rows = [
+            {
+                "doc_id": row["doc_id"],
+                "entity_type": row["entity_type"],
+                "normalized_name": normalized_name,
+                "properties": row.get("properties") or {},
+            }
+            for row, normalized_name in zip(rows, normalized_names)
+        ]
+        
+        return self._bulk_write(
+            _BULK_MENTION_QUERY, _BULK_MENTION_IN_TX_QUERY,
+            namespace, params_rows, batch_size, "mentions"
+        )
+    
+    def _bulk_write(
+        self,
+        query: str,
+        in_tx_query: str,
+        namespace: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int],
+        what: str
+    ) -> int:
+        """Run an ``UNWIND $rows`` query in batches and sum the counts.
+        
+        Above IN_TRANSACTIONS_THRESHOLD rows, in_tx_query is sent once in an
+        auto-commit transaction instead and the server commits every
+        ``batch_size`` rows; a failure part-way leaves earlier batches
+        committed.
+        
+        Args:
+            query: Cypher query returning a single ``count`` column
+            in_tx_query: The same write as ``CALL { ... } IN TRANSACTIONS``
+            namespace: Namespace for isolation
+            rows: Row parameter dicts
+            batch_size: Maximum number of rows sent per transaction
+                (default: the client's batch_size)
+            what: Description used in log and error messages
+            
+        Returns:
+            int: Total count returned by all batches
+            
+        Raises:
+            GraphError: If a batch fails
+        """
+        try:
+            if len(rows) > IN_TRANSACTIONS_THRESHOLD:
+                result = self.client.execute_auto_commit(
+                    in_tx_query,
+                    {
+                        "namespace": namespace,
+                        "rows": rows,
+                        "chunk": batch_size or self.client.batch_size,
+                    }
+                )
+                written = result[0]['count'] if result else 0
+            else:
+                written = self.client.execute_unwind_write(
+                    query, rows, batch_size,
+                    parameters={"namespace": namespace}, count_key="count"
+                )
+        except Exception as e:
+            logger.error("Failed to bulk write %s: %s", what, e)
+            raise GraphError(f"Failed to bulk write {what}: {e}")
+        
+        logger.info("Bulk wrote %s %s in namespace '%s'", written, what, namespace)
+        return written
+    
     def get_document_entities(
         self,
         namespace: str,
@@ -311,7 +588,7 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
+            result = self.client.execute_query(query, params, read_only=True)
             entities = []
             for r in result:
                 entity = dict(r['e'])
@@ -320,15 +597,66 @@ class Neo4jDocumentRepository(DocumentRepository):
                 entities.append(entity)
             return entities
         except Exception as e:
-            logger.error(f"Failed to get document entities: {e}")
+            logger.error("Failed to get document entities: %s", e)
             return []
     
+    def get_entities_for_documents(
+        self,
+        namespace: str,
+        doc_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the entities mentioned by each of several documents.
+        
+        Same result shape as get_document_entities, for a whole page of
+        documents in one query.
+        
+        Args:
+            namespace: Namespace for isolation
+            doc_ids: Document identifiers
+            
+        Returns:
+            dict: Entity lists keyed by doc_id; documents without mentions
+                map to an empty list
+        """
+        if not doc_ids:
+            return {}
+        
+        query = """
+        UNWIND $doc_ids AS did
+        MATCH (d:Doc {namespace: $namespace, doc_id: did})-[r:MENTIONS]->(e:Entity)
+        WITH did, e, r
+        ORDER BY e.entity_type, e.name
+        RETURN did, collect(e) AS ents, collect(r) AS rels
+        """
+        
+        unique_ids = list(dict.fromkeys(doc_ids))
+        params = {
+            "namespace": namespace,
+            "doc_ids": unique_ids
+        }
+        
+        entities: Dict[str, List[Dict[str, Any]]] = {doc_id: [] for doc_id in unique_ids}
+        try:
+            result = self.client.execute_query(query, params, read_only=True)
+        except Exception as e:
+            logger.error("Failed to get entities for documents: %s", e)
+            return entities
+        
+        for r in result:
+            doc_entities = entities[r['did']]
+            for node, rel in zip(r['ents'], r['rels']):
+                entity = dict(node)
+                entity['mention_properties'] = dict(rel)
+                doc_entities.append(entity)
+        return entities
+    
     def find_related_documents(
         self,
         namespace: str,
         entity_type: str,
         entity_name: str,
-        limit: int = 10
+        limit: int = 10,
+        normalized_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Find documents that mention a specific entity.
         
@@ -337,14 +665,15 @@ class Neo4jDocumentRepository(DocumentRepository):
             entity_type: Entity type
             entity_name: Entity name
             limit: Maximum number of results
+            normalized_name: Already-normalized entity name, if the caller
+                has it; computed from entity_name otherwise
             
         Returns:
             list: List of related documents
         """
         # Normalize entity name for lookup
-        from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
-        repo = Neo4jEntityRepository(self.client)
-        normalized_name = repo.normalize_name(entity_name)
+        if normalized_name is None:
+            normalized_name = Neo4jEntityRepository.normalize_name(entity_name)
         
         query = """
         MATCH (d:Doc {namespace: $namespace})-[r:MENTIONS]->(e:Entity {
@@ -365,7 +694,7 @@ class Neo4jDocumentRepository(DocumentRepository):
         }
         
         try:
-            result = self.client.execute_query(query, params)
+            result = self.client.execute_query(query, params, read_only=True)
             documents = []
             for r in result:
                 doc = dict(r['d'])
@@ -374,5 +703,5 @@ class Neo4jDocumentRepository(DocumentRepository):
                 documents.append(doc)
             return documents
         except Exception as e:
-            logger.error(f"Failed to find related documents: {e}")
+            logger.error("Failed to find related documents: %s", e)
             return []
@@ -1,11 +1,15 @@
 """Neo4j entity repository implementation."""
 
+import copy
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 
-from kg_forge.graph.base import EntityRepository
+from kg_forge.graph.base import EntityRepository, normalize_names_batch
 from kg_forge.graph.neo4j.client import Neo4jClient
+from kg_forge.graph.neo4j.lookup_cache import lookup_cache_for
+from kg_forge.models.graph import EntityRow
 from kg_forge.graph.exceptions import (
     EntityNotFoundError,
     DuplicateEntityError,
@@ -15,6 +19,101 @@ from kg_forge.graph.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+GET_ENTITY_QUERY = """
+        MATCH (e:Entity {
+            namespace: $namespace,
+            entity_type: $entity_type,
+            normalized_name: $normalized_name
+        })
+        RETURN e
+        """
+
+# Bulk writes larger than this many rows are sent as one auto-commit
+# CALL { ... } IN TRANSACTIONS query instead of one transaction per batch
+IN_TRANSACTIONS_THRESHOLD = 10_000
+
+# Relationship types cannot be parameterized in Cypher, so the type is
+# substituted into this template; all values remain bound parameters.
+_RELATIONSHIP_QUERY_TEMPLATE = """
+        MATCH (from:Entity {
+            namespace: $namespace,
+            entity_type: $from_entity_type,
+            normalized_name: $from_normalized
+        })
+        MATCH (to:Entity {
+            namespace: $namespace,
+            entity_type: $to_entity_type,
+            normalized_name: $to_normalized
+        })
+        MERGE (from)-[r:%s]->(to)
+        ON CREATE SET
+            r.namespace = $namespace,
+            r.created_at = timestamp()
+        SET r += $properties
+        RETURN r, from, to
+        """
+
+
+# Per-row body of bulk_create_entities; must end by returning ``count``
+_BULK_ENTITY_MERGE = """
+        MERGE (e:Entity {
+            namespace: $namespace,
+            entity_type: row.entity_type,
+            normalized_name: row.normalized_name
+        })
+        ON CREATE SET
+            e.name = row.name,
+            e.created_at = timestamp()
+        SET e += row.properties
+        RETURN count(e) AS count"""
+
+
+def _in_transactions(body: str) -> str:
+    """Wrap a per-row ``... RETURN count(x) AS count`` body for IN TRANSACTIONS.
+    
+    The body runs once per row inside ``CALL { ... }`` and the counts are
+    summed outside, so the result has the same single ``count`` column as
+    the batched form.
+    """
+    return """
+        UNWIND $rows AS row
+        CALL {
+            WITH row
+            %s
+        } IN TRANSACTIONS OF $chunk ROWS
+        RETURN sum(count) AS count
+        """ % body
+
+
+_BULK_ENTITY_QUERY = "UNWIND $rows AS row" + _BULK_ENTITY_MERGE
+_BULK_ENTITY_IN_TX_QUERY = _in_transactions(_BULK_ENTITY_MERGE)
+
+
+# Relationship types that are safe to splice into the template unquoted
+_REL_TYPE_RE = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+
+
+@lru_cache(maxsize=256)
+def _relationship_query(rel_type: str) -> str:
+    """Get the (cached) create-relationship query for a relationship type.
+    
+    Raises:
+        GraphError: If rel_type is not a plain uppercase identifier
+    """
+    if not _REL_TYPE_RE.match(rel_type):
+        raise GraphError(f"Invalid relationship type: {rel_type!r}")
+    return _RELATIONSHIP_QUERY_TEMPLATE % rel_type
+
+
+def _is_constraint_violation(error: BaseException) -> bool:
+    """Check whether an error (or its cause) is a uniqueness violation."""
+    while error is not None:
+        if "ConstraintValidationFailed" in (getattr(error, 'code', None) or ""):
+            return True
+        error = error.__cause__
+    return False
+
+
 class Neo4jEntityRepository(EntityRepository):
     """Neo4j implementation of EntityRepository.
     
@@ -28,6 +127,8 @@ class Neo4jEntityRepository(EntityRepository):
             client: Neo4j client instance
         """
         self.client = client
+        # Shared with every other repository on this client
+        self._lookups = lookup_cache_for(client)
     
     def create_entity(
         self,
@@ -52,29 +153,25 @@ class Neo4jEntityRepository(EntityRepository):
         """
         normalized_name = self.normalize_name(name)
         
+        # Only CREATE when no entity matches; an empty result means it
+        # already existed. Concurrent creators are serialized by the
+        # entity_unique constraint, which rejects the loser.
         query = """
-        MERGE (e:Entity {
+        OPTIONAL MATCH (existing:Entity {
             namespace: $namespace,
             entity_type: $entity_type,
             normalized_name: $normalized_name
         })
-        ON CREATE SET
-            e.name = $name,
-            e.created_at = timestamp()
-        WITH e, (e.created_at = timestamp()) as is_new
-        WHERE is_new = false
-        RETURN null as entity, 'exists' as status
-        
-        UNION
-        
-        MATCH (e:Entity {
+        WITH existing WHERE existing IS NULL
+        CREATE (e:Entity {
             namespace: $namespace,
             entity_type: $entity_type,
-            normalized_name: $normalized_name
+            normalized_name: $normalized_name,
+            name: $name,
+            created_at: timestamp()
         })
-        WHERE e.created_at = timestamp()
-        SET e += properties($properties)
-        RETURN e as entity, 'created' as status
+        SET e += $properties
+        RETURN e AS entity
         """
         
         params = {
@@ -88,63 +185,200 @@ class Neo4jEntityRepository(EntityRepository):
         try:
             result = self.client.execute_write_tx(query, params)
             
-            if result and result[0].get('status') == 'exists':
+            if not result or not result[0].get('entity'):
                 raise DuplicateEntityError(namespace, entity_type, name)
             
-            if result and result[0].get('entity'):
-                entity_data = dict(result[0]['entity'])
-                logger.info(f"Created entity: {entity_type}='{name}' in namespace '{namespace}'")
-                return entity_data
-            
-            raise GraphError("Failed to create entity")
+            entity_data = dict(result[0]['entity'])
+            logger.info("Created entity: %s='%s' in namespace '%s'", entity_type, name, namespace)
+            return entity_data
             
         except DuplicateEntityError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create entity: {e}")
+            if _is_constraint_violation(e):
+                raise DuplicateEntityError(namespace, entity_type, name) from e
+            logger.error("Failed to create entity: %s", e)
             raise GraphError(f"Failed to create entity: {e}")
+        finally:
+            self._lookups.pop(("entity", namespace, entity_type, normalized_name))
+            self._lookups.pop(("entity_types", namespace))
+    
+    def bulk_create_entities(
+        self,
+        namespace: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """Create or update many entities with one transaction per batch.
+        
+        Unlike create_entity, existing entities are not an error: they are
+        matched and their properties updated. Above IN_TRANSACTIONS_THRESHOLD
+        rows the server commits every ``batch_size`` rows itself
+        (``CALL { ... } IN TRANSACTIONS``), keeping its memory bounded; a
+        failure part-way leaves the earlier batches committed.
+        
+        Args:
+            namespace: Namespace for isolation
+            rows: Dicts with ``entity_type``, ``name`` and optional ``properties``
+            batch_size: Maximum number of rows sent per transaction
+                (default: the client's batch_size)
+            
+        Returns:
+            int: Number of entities written
+            
+        Raises:
+            GraphError: If a batch fails
+        """
+        normalized_names = normalize_names_batch([row["name"] for row in rows])
+        params_rows = [
+            {
+                "entity_type": row["entity_type"],
+                "name": row["name"],
+                "normalized_name": normalized_name,
+                "properties": row.get("properties") or {},
+            }
+            for row, normalized_name in zip(rows, normalized_names)
+        ]
+        
+        try:
+            if len(params_rows) > IN_TRANSACTIONS_THRESHOLD:
+                result = self.client.execute_auto_commit(
+                    _BULK_ENTITY_IN_TX_QUERY,
+                    {
+                        "namespace": namespace,
+                        "rows": params_rows,
+                        "chunk": batch_size or self.client.batch_size,
+                    }
+                )
+                written = result[0]['count'] if result else 0
+            else:
+                written = self.client.execute_unwind_write(
+                    _BULK_ENTITY_QUERY, params_rows, batch_size,
+                    parameters={"namespace": namespace}, count_key="count"
+                )
+        except Exception as e:
+            logger.error("Failed to bulk create entities: %s", e)
+            raise GraphError(f"Failed to bulk create entities: {e}")
+        finally:
+            for row in params_rows:
+                self._lookups.pop(
+                    ("entity", namespace, row["entity_type"], row["normalized_name"])
+                )
+            self._lookups.pop(("entity_types", namespace))
+        
+        logger.info("Bulk wrote %s entities in namespace '%s'", written, namespace)
+        return written
     
     def get_entity(
         self,
         namespace: str,
         entity_type: str,
-        name: str
+        name: str,
+        use_cache: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Get an entity by type and name.
         
+        Found entities are memoized per client until this repository writes
+        the entity or the entry expires. Misses are not memoized, so an
+        entity written by another client is seen on the next call.
+        
         Args:
             namespace: Namespace for isolation
             entity_type: Type of entity
             name: Entity name (will be normalized for lookup)
+            use_cache: Set False to always read from the database
             
         Returns:
             dict: Entity data, or None if not found
         """
         normalized_name = self.normalize_name(name)
         
+        key = ("entity", namespace, entity_type, normalized_name)
+        if use_cache:
+            hit, cached = self._lookups.get(key)
+            if hit:
+                return copy.deepcopy(cached)
+        
+        query = GET_ENTITY_QUERY
+        
+        params = {
+            "namespace": namespace,
+            "entity_type": entity_type,
+            "normalized_name": normalized_name
+        }
+        
+        try:
+            # The lookup cache is the only cache layer for this read
+            result = self.client.execute_query(query, params, read_only=True, cache=False)
+        except Exception as e:
+            logger.error("Failed to get entity: %s", e)
+            return None
+        
+        if not result or not result[0].get('e'):
+            return None
+        entity = dict(result[0]['e'])
+        # Deep copies, as in the client's query cache, so callers mutating
+        # list-valued properties cannot change later hits
+        self._lookups.put(key, copy.deepcopy(entity))
+        return entity
+    
+    def get_entities(
+        self,
+        namespace: str,
+        keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Get many entities in a single query.
+        
+        Args:
+            namespace: Namespace for isolation
+            keys: (entity_type, name) pairs; names are normalized for lookup
+            
+        Returns:
+            dict: Entity data keyed by the (entity_type, name) pairs that
+                were found; missing entities are absent
+        """
+        if not keys:
+            return {}
+        
+        by_normalized: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for (entity_type, name), normalized_name in zip(
+            keys, normalize_names_batch([name for _, name in keys])
+        ):
+            by_normalized.setdefault((entity_type, normalized_name), []).append(
+                (entity_type, name)
+            )
+        
         query = """
+        UNWIND $keys AS k
         MATCH (e:Entity {
             namespace: $namespace,
-            entity_type: $entity_type,
-            normalized_name: $normalized_name
+            entity_type: k.entity_type,
+            normalized_name: k.normalized_name
         })
         RETURN e
         """
         
         params = {
             "namespace": namespace,
-            "entity_type": entity_type,
-            "normalized_name": normalized_name
+            "keys": [
+                {"entity_type": entity_type, "normalized_name": normalized_name}
+                for entity_type, normalized_name in by_normalized
+            ]
         }
         
         try:
-            result = self.client.execute_query(query, params)
-            if result and result[0].get('e'):
-                return dict(result[0]['e'])
-            return None
+            result = self.client.execute_query(query, params, read_only=True)
         except Exception as e:
-            logger.error(f"Failed to get entity: {e}")
-            return None
+            logger.error("Failed to get entities: %s", e)
+            return {}
+        
+        entities = {}
+        for r in result:
+            entity = dict(r['e'])
+            lookup = (entity.get('entity_type'), entity.get('normalized_name'))
+            for key in by_normalized.get(lookup, ()):
+                entities[key] = entity
+        return entities
     
     def list_entities(
         self,
@@ -187,21 +421,78 @@ class Neo4jEntityRepository(EntityRepository):
             }
         
         try:
-            result = self.client.execute_query(query, params)
+            result = self.client.execute_query(query, params, read_only=True)
             return [dict(r['e']) for r in result]
         except Exception as e:
-            logger.error(f"Failed to list entities: {e}")
+            logger.error("Failed to list entities: %s", e)
             return []
     
-    def list_entity_types(self, namespace: str) -> List[str]:
+    def iter_entities(
+        self,
+        namespace: str,
+        entity_type: Optional[str] = None,
+        as_rows: bool = False
+    ) -> Iterator[Union[Dict[str, Any], EntityRow]]:
+        """Stream entities one at a time, optionally filtered by type.
+        
+        Unlike list_entities there is no limit and nothing is buffered, so
+        large namespaces can be walked in constant memory and callers can
+        stop early.
+        
+        Args:
+            namespace: Namespace for isolation
+            entity_type: Optional type filter
+            as_rows: Yield slotted EntityRow objects instead of dicts
+            
+        Yields:
+            dict or EntityRow: Entity data
+            
+        Raises:
+            GraphConnectionError: If the query fails
+        """
+        if entity_type:
+            query = """
+            MATCH (e:Entity {namespace: $namespace, entity_type: $entity_type})
+            RETURN e
+            ORDER BY e.name
+            """
+            params = {"namespace": namespace, "entity_type": entity_type}
+        else:
+            query = """
+            MATCH (e:Entity {namespace: $namespace})
+            RETURN e
+            ORDER BY e.entity_type, e.name
+            """
+            params = {"namespace": namespace}
+        
+        if as_rows:
+            for record in self.client.stream_query(query, params, read_only=True):
+                yield EntityRow.from_node(record['e'])
+        else:
+            for record in self.client.stream_query(query, params, read_only=True):
+                yield record['e']
+    
+    def list_entity_types(self, namespace: str, use_cache: bool = True) -> List[str]:
         """List all entity types in namespace.
         
+        The scan grows with the number of entities while the answer is a
+        handful of types, so a non-empty result is memoized per client until
+        this repository creates, updates or deletes an entity in the
+        namespace.
+        
         Args:
             namespace: Namespace for isolation
+            use_cache: Set False to always read from the database
             
         Returns:
             list: Sorted list of unique entity types
         """
+        key = ("entity_types", namespace)
+        if use_cache:
+            hit, cached = self._lookups.get(key)
+            if hit:
+                return list(cached)
+        
         query = """
         MATCH (e:Entity {namespace: $namespace})
         RETURN DISTINCT e.entity_type as entity_type
@@ -211,11 +502,15 @@ class Neo4jEntityRepository(EntityRepository):
         params = {"namespace": namespace}
         
         try:
-            result = self.client.execute_query(query, params)
-            return [r['entity_type'] for r in result if r.get('entity_type')]
+            result = self.client.execute_query(query, params, read_only=True, cache=False)
         except Exception as e:
-            logger.error(f"Failed to list entity types: {e}")
+            logger.error("Failed to list entity types: %s", e)
             return []
+        
+        types = tuple(r['entity_type'] for r in result if r.get('entity_type'))
+        if types:
+            self._lookups.put(key, types)
+        return list(types)
     
     def update_entity(
         self,
@@ -261,7 +556,7 @@ class Neo4jEntityRepository(EntityRepository):
             result = self.client.execute_write_tx(query, params)
             if result and result[0].get('e'):
                 entity_data = dict(result[0]['e'])
-                logger.info(f"Updated entity: {entity_type}='{name}' in namespace '{namespace}'")
+                logger.info("Updated entity: %s='%s' in namespace '%s'", entity_type, name, namespace)
                 return entity_data
             
             raise EntityNotFoundError(namespace, entity_type, name)
@@ -269,8 +564,11 @@ class Neo4jEntityRepository(EntityRepository):
         except EntityNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to update entity: {e}")
+            logger.error("Failed to update entity: %s", e)
             raise GraphError(f"Failed to update entity: {e}")
+        finally:
+            self._lookups.pop(("entity", namespace, entity_type, normalized_name))
+            self._lookups.pop(("entity_types", namespace))
     
     def delete_entity(
         self,
@@ -297,7 +595,7 @@ class Neo4jEntityRepository(EntityRepository):
             normalized_name: $normalized_name
         })
         DETACH DELETE e
-        RETURN count(e) as deleted_count
+        RETURN count(e) > 0 AS deleted
         """
         
         params = {
@@ -307,17 +605,19 @@ class Neo4jEntityRepository(EntityRepository):
         }
         
         try:
-            result = self.client.execute_write_tx(query, params)
-            deleted = result[0]['deleted_count'] > 0 if result else False
+            deleted = bool(self.client.execute_scalar(query, params, read_only=False))
             
             if deleted:
-                logger.info(f"Deleted entity: {entity_type}='{name}' from namespace '{namespace}'")
+                logger.info("Deleted entity: %s='%s' from namespace '%s'", entity_type, name, namespace)
             
             return deleted
             
         except Exception as e:
-            logger.error(f"Failed to delete entity: {e}")
+            logger.error("Failed to delete entity: %s", e)
             return False
+        finally:
+            self._lookups.pop(("entity", namespace, entity_type, normalized_name))
+            self._lookups.pop(("entity_types", namespace))
     
     def create_relationship(
         self,
@@ -345,30 +645,13 @@ class Neo4jEntityRepository(EntityRepository):
             
         Raises:
             EntityNotFoundError: If either entity doesn't exist
+            GraphError: If rel_type is not a valid relationship type
         """
         from_normalized = self.normalize_name(from_entity_name)
         to_normalized = self.normalize_name(to_entity_name)
         rel_type_upper = rel_type.upper()
         
-        # Build dynamic query with relationship type
-        query = f"""
-        MATCH (from:Entity {{
-            namespace: $namespace,
-            entity_type: $from_entity_type,
-            normalized_name: $from_normalized
-        }})
-        MATCH (to:Entity {{
-            namespace: $namespace,
-            entity_type: $to_entity_type,
-            normalized_name: $to_normalized
-        }})
-        MERGE (from)-[r:{rel_type_upper}]->(to)
-        ON CREATE SET
-            r.namespace = $namespace,
-            r.created_at = timestamp()
-        SET r += $properties
-        RETURN r, from, to
-        """
+        query = _relationship_query(rel_type_upper)
         
         params = {
             "namespace": namespace,
@@ -391,47 +674,14 @@ class Neo4jEntityRepository(EntityRepository):
             
             rel_data = dict(result[0]['r'])
             logger.info(
-                f"Created relationship: {from_entity_type}='{from_entity_name}' "
-                f"-[{rel_type_upper}]-> {to_entity_type}='{to_entity_name}'"
+                "Created relationship: %s='%s' -[%s]-> %s='%s'",
+                from_entity_type, from_entity_name, rel_type_upper,
+                to_entity_type, to_entity_name
             )
             return rel_data
             
         except EntityNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create relationship: {e}")
+            logger.error("Failed to create relationship: %s", e)
             raise GraphError(f"Failed to create relationship: {e}")
-    
-    def normalize_name(self, name: str) -> str:
-        """Normalize an entity name for matching.
-        
-        Normalization rules:
-        1. Remove content in parentheses (e.g., "(KD)", "(v2)")
-        2. Convert to lowercase
-        3. Trim and collapse whitespace
-        4. Keep only alphanumeric and spaces
-        
-        Args:
-            name: Original name
-            
-        Returns:
-            str: Normalized name
-            
-        Examples:
-            "Knowledge Discovery (KD)" -> "knowledge discovery"
-            "Platform  Engineering" -> "platform engineering"
-            "AI/ML Platform" -> "ai ml platform"
-        """
-        # Remove content in parentheses
-        normalized = re.sub(r'\([^)]*\)', '', name)
-        
-        # Convert to lowercase
-        normalized = normalized.lower()
-        
-        # Keep only alphanumeric and spaces
-        normalized = re.sub(r'[^a-z0-9\s]', ' ', normalized)
-        
-        # Collapse multiple spaces to single space and trim
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
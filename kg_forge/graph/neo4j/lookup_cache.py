@@ -0,0 +1,95 @@
+"""Per-client memo of point lookups made by the Neo4j repositories."""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+# Default bounds for each client's lookup cache
+DEFAULT_MAXSIZE = 50_000
+DEFAULT_TTL = 60.0
+
+_MISSING = object()
+
+
+class LookupCache:
+    """Bounded LRU cache with per-entry expiry.
+    
+    Unlike the client's query cache, which any write clears wholesale, this
+    cache is invalidated key by key by the repository that owns the data, so
+    lookups repeated during ingest (the same document or entity checked for
+    every mention) stay warm across unrelated writes.
+    """
+    
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a key.
+        
+        Returns:
+            tuple: (hit, value); value is None on a miss
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, entry[1]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# One cache per client, shared by every repository built on it
+_CACHES: "weakref.WeakKeyDictionary[Any, LookupCache]" = weakref.WeakKeyDictionary()
+_CACHES_LOCK = threading.Lock()
+
+
+def lookup_cache_for(client: Any) -> LookupCache:
+    """Get the lookup cache shared by all repositories using ``client``.
+    
+    Args:
+        client: Graph client instance
+    
+    Returns:
+        LookupCache: The client's cache, created on first use
+    """
+    with _CACHES_LOCK:
+        cache = _CACHES.get(client)
+        if cache is None:
+            cache = _CACHES[client] = LookupCache()
+        return cache
@@ -0,0 +1,108 @@
+"""Error handling shared by the sync and async Neo4j clients' query methods."""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Optional, Tuple
+
+from kg_forge.graph.exceptions import (
+    ConnectionError as GraphConnectionError,
+    GraphError,
+    QueryError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maps a wrapped method's arguments (without self) to the (query, parameters)
+# pair that is logged when it fails
+Describe = Callable[..., Tuple[str, Any]]
+
+
+def query_and_parameters(query, parameters=None, *args, **kwargs) -> Tuple[str, Any]:
+    """Default ``describe``: the method's own ``query`` and ``parameters``."""
+    return query, parameters
+
+
+def raise_if_timed_out(error: Exception, query: str) -> None:
+    """Re-raise a server-side transaction timeout as QueryError."""
+    code = getattr(error, "code", None) or ""
+    if "TransactionTimedOut" in code:
+        logger.error(f"Query timed out: {query}")
+        raise QueryError(f"Query timed out: {error}", query=query) from error
+
+
+def _translate(kind: str, error: Exception, query: str, parameters: Any) -> GraphConnectionError:
+    """Log a failed query once and build the error to raise in its place."""
+    raise_if_timed_out(error, query)
+    logger.error(
+        "%s failed: %s\nQuery: %s\nParameters: %s",
+        kind, error, query, parameters,
+        extra={"kind": kind, "query": query, "params": parameters},
+    )
+    return GraphConnectionError(f"{kind} failed: {error}")
+
+
+def wrap_query_errors(kind: str, describe: Optional[Describe] = None):
+    """Turn unexpected errors raised by a query method into GraphConnectionError.
+    
+    Errors already in the graph hierarchy pass through; server-side timeouts
+    become QueryError; anything else is logged once, with the query and
+    parameters attached as structured ``extra`` fields, and re-raised chained.
+    Generator methods are wrapped as generators, so errors raised while the
+    caller iterates are translated too.
+    
+    Args:
+        kind: Operation name used in the log and error messages
+        describe: Maps the method's arguments to the (query, parameters)
+            pair to log; defaults to its ``query`` and ``parameters``
+    """
+    describe = describe or query_and_parameters
+    
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(self, *args, **kwargs):
+                try:
+                    yield from func(self, *args, **kwargs)
+                except GraphError:
+                    raise
+                except Exception as e:
+                    query, parameters = describe(*args, **kwargs)
+                    raise _translate(kind, e, query, parameters) from e
+            return generator_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except GraphError:
+                raise
+            except Exception as e:
+                query, parameters = describe(*args, **kwargs)
+                raise _translate(kind, e, query, parameters) from e
+        return wrapper
+    return decorator
+
+
+def wrap_async_query_errors(kind: str, describe: Optional[Describe] = None):
+    """Coroutine version of wrap_query_errors for the async client.
+    
+    Args:
+        kind: Operation name used in the log and error messages
+        describe: Maps the method's arguments to the (query, parameters)
+            pair to log; defaults to its ``query`` and ``parameters``
+    """
+    describe = describe or query_and_parameters
+    
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except GraphError:
+                raise
+            except Exception as e:
+                query, parameters = describe(*args, **kwargs)
+                raise _translate(kind, e, query, parameters) from e
+        return wrapper
+    return decorator
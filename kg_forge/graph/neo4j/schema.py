@@ -1,14 +1,69 @@
 """Neo4j schema management implementation."""
 
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import threading
+import time
+from typing import ClassVar, Dict, Any, FrozenSet, Optional, List, Set, Tuple
 
 from kg_forge.graph.base import SchemaManager
 from kg_forge.graph.neo4j.client import Neo4jClient
+from kg_forge.graph.neo4j.lookup_cache import lookup_cache_for
 from kg_forge.graph.exceptions import SchemaError
 
 logger = logging.getLogger(__name__)
 
+# Schema DDL keyed by constraint/index name. The statements are fixed strings,
+# so the server plans each one once; verify_schema checks the same names.
+# Values that vary per call belong in query parameters, never in the text.
+CONSTRAINTS = {
+    "doc_unique": (
+        "CREATE CONSTRAINT doc_unique IF NOT EXISTS "
+        "FOR (d:Doc) REQUIRE (d.namespace, d.doc_id) IS UNIQUE"
+    ),
+    "entity_unique": (
+        "CREATE CONSTRAINT entity_unique IF NOT EXISTS "
+        "FOR (e:Entity) REQUIRE (e.namespace, e.entity_type, e.normalized_name) IS UNIQUE"
+    ),
+}
+
+INDEXES = {
+    # Doc indexes
+    "doc_namespace": "CREATE INDEX doc_namespace IF NOT EXISTS FOR (d:Doc) ON (d.namespace)",
+    "doc_namespace_hash": (
+        "CREATE INDEX doc_namespace_hash IF NOT EXISTS FOR (d:Doc) ON (d.namespace, d.content_hash)"
+    ),
+    # Entity indexes
+    "entity_namespace": "CREATE INDEX entity_namespace IF NOT EXISTS FOR (e:Entity) ON (e.namespace)",
+    "entity_type": "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.entity_type)",
+    "entity_name": "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+}
+
+# Indexes from earlier schema versions, dropped whenever the indexes are
+# created so existing databases stop maintaining them. doc_content_hash was
+# replaced by the composite doc_namespace_hash.
+DROPPED_INDEXES = {
+    "doc_content_hash": "DROP INDEX doc_content_hash IF EXISTS",
+}
+
+# Statement tuples sent by create_constraints/create_indexes
+_CONSTRAINT_STATEMENTS: Tuple[str, ...] = tuple(CONSTRAINTS.values())
+_INDEX_STATEMENTS: Tuple[str, ...] = tuple(INDEXES.values()) + tuple(DROPPED_INDEXES.values())
+
+# Nodes deleted per inner transaction when clearing a namespace
+CLEAR_BATCH_ROWS = 10_000
+
+# First Neo4j release accepting vector.hnsw.* index options
+HNSW_OPTIONS_MIN_VERSION = (5, 23)
+
+_SERVER_VERSION_RE = re.compile(r"^Neo4j/(\d+)\.(\d+)")
+
+
+def _server_version(agent: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse (major, minor) from a server agent string like ``Neo4j/5.14.0``."""
+    match = _SERVER_VERSION_RE.match(agent or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
 
 class Neo4jSchemaManager(SchemaManager):
     """Neo4j implementation of SchemaManager.
@@ -16,6 +71,17 @@ class Neo4jSchemaManager(SchemaManager):
     Manages database schema including constraints and indexes.
     """
     
+    # (uri, database) pairs whose schema was ensured by this process
+    _ensured: Set[Tuple[Any, Any]] = set()
+    _ensure_lock = threading.Lock()
+    
+    # Names verify_schema requires, fixed at import time
+    REQUIRED_CONSTRAINT_NAMES: ClassVar[FrozenSet[str]] = frozenset(CONSTRAINTS)
+    REQUIRED_INDEX_NAMES: ClassVar[FrozenSet[str]] = frozenset(INDEXES)
+    
+    # Seconds verify_schema reuses the constraint and index names it read
+    _schema_cache_ttl = 30.0
+    
     def __init__(self, client: Neo4jClient):
         """Initialize schema manager.
         
@@ -23,6 +89,8 @@ class Neo4jSchemaManager(SchemaManager):
             client: Neo4j client instance
         """
         self.client = client
+        # (expiry, (constraint names, index names)) from the last SHOW queries
+        self._schema_cache: Optional[Tuple[float, Tuple[FrozenSet[str], FrozenSet[str]]]] = None
     
     def create_schema(self) -> None:
         """Create complete schema (constraints and indexes).
@@ -34,12 +102,47 @@ class Neo4jSchemaManager(SchemaManager):
         """
         try:
             logger.info("Creating database schema...")
-            self.create_constraints()
-            self.create_indexes()
+            self._create_constraints_and_indexes()
             logger.info("Database schema created successfully")
         except Exception as e:
             raise SchemaError(f"Failed to create schema: {e}")
     
+    def ensure_schema(self) -> bool:
+        """Create constraints and indexes once per database per process.
+        
+        Cheap to call from every ingest entry point: after the first
+        successful run for a database, later calls return immediately.
+        
+        Returns:
+            bool: True if the schema was created by this call, False if it
+                had already been ensured
+            
+        Raises:
+            SchemaError: If schema creation fails
+        """
+        key = (getattr(self.client, 'uri', None), getattr(self.client, 'database', None))
+        with self._ensure_lock:
+            if key in self._ensured:
+                return False
+            self._create_constraints_and_indexes()
+            self._ensured.add(key)
+        return True
+    
+    def _create_constraints_and_indexes(self) -> None:
+        """Send every constraint and index statement in one transaction.
+        
+        Raises:
+            SchemaError: If the transaction fails
+        """
+        self._schema_cache = None
+        try:
+            self.client.execute_write_batch(_CONSTRAINT_STATEMENTS + _INDEX_STATEMENTS)
+        except Exception as e:
+            raise SchemaError(f"Failed to create constraints and indexes: {e}")
+        logger.info(
+            f"Created {len(CONSTRAINTS)} constraints and {len(INDEXES)} indexes"
+        )
+    
     def create_constraints(self) -> None:
         """Create uniqueness constraints for nodes.
         
@@ -48,27 +151,12 @@ class Neo4jSchemaManager(SchemaManager):
         - Entity nodes: unique on (namespace, entity_type, normalized_name)
         """
         logger.info("Creating constraints...")
-        
-        # Constraint for Doc nodes
-        doc_constraint = """
-        CREATE CONSTRAINT doc_unique IF NOT EXISTS
-        FOR (d:Doc)
-        REQUIRE (d.namespace, d.doc_id) IS UNIQUE
-        """
-        
-        # Constraint for Entity nodes
-        entity_constraint = """
-        CREATE CONSTRAINT entity_unique IF NOT EXISTS
-        FOR (e:Entity)
-        REQUIRE (e.namespace, e.entity_type, e.normalized_name) IS UNIQUE
-        """
+        self._schema_cache = None
         
         try:
-            self.client.execute_write(doc_constraint)
-            logger.info("Created Doc uniqueness constraint")
-            
-            self.client.execute_write(entity_constraint)
-            logger.info("Created Entity uniqueness constraint")
+            # One transaction for all DDL instead of a commit per statement
+            self.client.execute_write_batch(_CONSTRAINT_STATEMENTS)
+            logger.info("Created Doc and Entity uniqueness constraints")
         except Exception as e:
             raise SchemaError(f"Failed to create constraints: {e}")
     
@@ -76,39 +164,36 @@ class Neo4jSchemaManager(SchemaManager):
         """Create performance indexes.
         
         Creates indexes on:
-        - Doc: namespace, content_hash
+        - Doc: namespace, (namespace, content_hash)
         - Entity: namespace, entity_type, name
+        
+        Also drops the indexes listed in DROPPED_INDEXES, such as the
+        single-property ``doc_content_hash`` index of older databases.
         """
         logger.info("Creating indexes...")
-        
-        indexes = [
-            # Doc indexes
-            "CREATE INDEX doc_namespace IF NOT EXISTS FOR (d:Doc) ON (d.namespace)",
-            "CREATE INDEX doc_content_hash IF NOT EXISTS FOR (d:Doc) ON (d.content_hash)",
-            
-            # Entity indexes
-            "CREATE INDEX entity_namespace IF NOT EXISTS FOR (e:Entity) ON (e.namespace)",
-            "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.entity_type)",
-            "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
-        ]
+        self._schema_cache = None
         
         try:
-            for index_query in indexes:
-                self.client.execute_write(index_query)
-                logger.debug(f"Created index: {index_query[:50]}...")
-            
-            logger.info(f"Created {len(indexes)} indexes")
+            self.client.execute_write_batch(_INDEX_STATEMENTS)
+            logger.info(f"Created {len(INDEXES)} indexes")
         except Exception as e:
             raise SchemaError(f"Failed to create indexes: {e}")
     
-    def create_vector_index(self) -> None:
+    def create_vector_index(self, m: int = 32, ef_construction: int = 200) -> None:
         """
         Create vector index for entity embeddings.
         
-        This creates a vector index using cosine similarity for
-        384-dimensional BERT embeddings (all-MiniLM-L6-v2).
+        This creates an HNSW vector index using cosine similarity for
+        384-dimensional BERT embeddings (all-MiniLM-L6-v2). The HNSW options
+        are only sent to servers known to accept them (Neo4j 5.23+, from the
+        agent recorded on connect); others get the default graph parameters.
+        
+        Args:
+            m: Maximum connections per node in the HNSW graph
+            ef_construction: Candidate list size used while building the graph
         """
         logger.info("Creating vector index...")
+        self._schema_cache = None
         
         query = """
         CREATE VECTOR INDEX entity_embeddings IF NOT EXISTS
@@ -116,13 +201,27 @@ class Neo4jSchemaManager(SchemaManager):
         ON e.embedding
         OPTIONS {indexConfig: {
             `vector.dimensions`: 384,
-            `vector.similarity_function`: 'cosine'
+            `vector.similarity_function`: 'cosine'%s
         }}
         """
+        version = _server_version(getattr(self.client, "server_agent", None))
+        if version is not None and version >= HNSW_OPTIONS_MIN_VERSION:
+            options = (
+                f",\n            `vector.hnsw.m`: {int(m)},"
+                f"\n            `vector.hnsw.ef_construction`: {int(ef_construction)}"
+            )
+            params = f"m={m}, ef_construction={ef_construction}"
+        else:
+            logger.debug("Server version unknown or before 5.23; using default HNSW parameters")
+            options = ""
+            params = "default HNSW parameters"
         
         try:
-            self.client.execute_write(query)
-            logger.info("Created vector index: entity_embeddings (384 dimensions, cosine similarity)")
+            self.client.execute_write(query % options)
+            logger.info(
+                f"Created vector index: entity_embeddings "
+                f"(384 dimensions, cosine similarity, {params})"
+            )
         except Exception as e:
             # Vector indexes are only available in Neo4j Enterprise Edition or AuraDB
             logger.warning(
@@ -138,31 +237,18 @@ class Neo4jSchemaManager(SchemaManager):
             bool: True if all constraints and indexes exist
         """
         try:
-            # Check constraints
-            constraints_query = "SHOW CONSTRAINTS"
-            constraints = self.client.execute_query(constraints_query)
+            constraint_names, index_names = self._get_schema_names()
             
-            constraint_names = {c.get('name', '') for c in constraints}
-            required_constraints = {'doc_unique', 'entity_unique'}
-            
-            missing_constraints = required_constraints - constraint_names
+            # Check constraints
+            missing_constraints = self.REQUIRED_CONSTRAINT_NAMES - constraint_names
             if missing_constraints:
-                logger.warning(f"Missing constraints: {missing_constraints}")
+                logger.warning(f"Missing constraints: {sorted(missing_constraints)}")
                 return False
             
             # Check indexes
-            indexes_query = "SHOW INDEXES"
-            indexes = self.client.execute_query(indexes_query)
-            
-            index_names = {idx.get('name', '') for idx in indexes}
-            required_indexes = {
-                'doc_namespace', 'doc_content_hash',
-                'entity_namespace', 'entity_type', 'entity_name'
-            }
-            
-            missing_indexes = required_indexes - index_names
+            missing_indexes = self.REQUIRED_INDEX_NAMES - index_names
             if missing_indexes:
-                logger.warning(f"Missing indexes: {missing_indexes}")
+                logger.warning(f"Missing indexes: {sorted(missing_indexes)}")
                 return False
             
             logger.info("Schema verification passed")
@@ -172,6 +258,43 @@ class Neo4jSchemaManager(SchemaManager):
             logger.error(f"Schema verification failed: {e}")
             return False
     
+    def _get_schema_names(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Get which of the required constraints and indexes exist.
+        
+        Results are reused for ``_schema_cache_ttl`` seconds; the create_*
+        methods drop them. Unlike the client's query cache, this one is not
+        cleared by ordinary data writes.
+        
+        Returns:
+            tuple: (constraint names, index names)
+        """
+        cached = self._schema_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        params = {
+            "constraints": sorted(self.REQUIRED_CONSTRAINT_NAMES),
+            "indexes": sorted(self.REQUIRED_INDEX_NAMES),
+        }
+        
+        # YIELD only the name column and let the server filter; the full
+        # SHOW rows carry a dozen columns (options, properties, ...) that
+        # are never used here
+        with self.client.batch_session():
+            constraints = self.client.execute_read(
+                "SHOW CONSTRAINTS YIELD name WHERE name IN $constraints", params
+            )
+            indexes = self.client.execute_read(
+                "SHOW INDEXES YIELD name WHERE name IN $indexes", params
+            )
+        names = (
+            frozenset(c.get('name', '') for c in constraints),
+            frozenset(idx.get('name', '') for idx in indexes),
+        )
+        
+        self._schema_cache = (time.monotonic() + self._schema_cache_ttl, names)
+        return names
+    
     def clear_namespace(self, namespace: str) -> int:
         """Clear all data for a specific namespace.
         
@@ -183,32 +306,31 @@ class Neo4jSchemaManager(SchemaManager):
         """
         logger.info(f"Clearing namespace: {namespace}")
         
-        # Delete all relationships first
-        delete_rels_query = """
-        MATCH (n {namespace: $namespace})-[r]-()
-        DELETE r
-        """
-        
-        # Then delete all nodes
-        delete_nodes_query = """
-        MATCH (n {namespace: $namespace})
-        DELETE n
-        RETURN count(n) as deleted_count
-        """
+        # Anchor on each label so the namespace indexes are used instead of
+        # an all-nodes scan, and commit in chunks so a large namespace does
+        # not have to fit in one transaction. DETACH DELETE drops incident
+        # relationships along with each node.
+        deleted_count = 0
         
         try:
-            # Delete relationships
-            self.client.execute_write(delete_rels_query, {"namespace": namespace})
-            
-            # Delete nodes and get count
-            result = self.client.execute_write_tx(delete_nodes_query, {"namespace": namespace})
-            deleted_count = result[0]['deleted_count'] if result else 0
+            for label in ("Doc", "Entity"):
+                delete_query = f"""
+                MATCH (n:{label} {{namespace: $namespace}})
+                CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {CLEAR_BATCH_ROWS} ROWS
+                RETURN count(n) as deleted_count
+                """
+                result = self.client.execute_auto_commit(delete_query, {"namespace": namespace})
+                deleted_count += result[0]['deleted_count'] if result else 0
             
             logger.info(f"Deleted {deleted_count} nodes from namespace '{namespace}'")
             return deleted_count
             
         except Exception as e:
             raise SchemaError(f"Failed to clear namespace '{namespace}': {e}")
+        finally:
+            # Repository lookups memoized for this client are now stale, even
+            # after a failure since earlier batches may have committed
+            lookup_cache_for(self.client).clear()
     
     def get_statistics(self, namespace: Optional[str] = None) -> Dict[str, Any]:
         """Get database statistics.
@@ -221,34 +343,37 @@ class Neo4jSchemaManager(SchemaManager):
         """
         try:
             if namespace:
-                # Statistics for specific namespace
+                # Statistics for specific namespace in one round-trip. Every
+                # branch is anchored on a label so its namespace index is used,
+                # and relationships are counted once, from their source node.
                 stats_query = """
-                MATCH (n {namespace: $namespace})
-                WITH count(n) as total_nodes, labels(n) as node_labels
-                UNWIND node_labels as label
-                RETURN label, count(*) as count
+                MATCH (d:Doc {namespace: $namespace})
+                RETURN 'node' AS kind, 'Doc' AS key, count(d) AS count
+                UNION ALL
+                MATCH (e:Entity {namespace: $namespace})
+                RETURN 'node' AS kind, 'Entity' AS key, count(e) AS count
+                UNION ALL
+                MATCH (:Doc {namespace: $namespace})-[r]->()
+                RETURN 'relationship' AS kind, type(r) AS key, count(r) AS count
+                UNION ALL
+                MATCH (:Entity {namespace: $namespace})-[r]->()
+                RETURN 'relationship' AS kind, type(r) AS key, count(r) AS count
                 """
                 
-                node_results = self.client.execute_query(
-                    stats_query,
-                    {"namespace": namespace}
-                )
-                
-                # Count relationships
-                rel_query = """
-                MATCH (n {namespace: $namespace})-[r]-()
-                RETURN type(r) as rel_type, count(r) as count
-                """
+                results = self.client.execute_read(stats_query, {"namespace": namespace})
                 
-                rel_results = self.client.execute_query(
-                    rel_query,
-                    {"namespace": namespace}
-                )
+                nodes: Dict[str, int] = {}
+                relationships: Dict[str, int] = {}
+                for r in results:
+                    if not r['count']:
+                        continue
+                    target = nodes if r['kind'] == 'node' else relationships
+                    target[r['key']] = target.get(r['key'], 0) + r['count']
                 
                 return {
                     "namespace": namespace,
-                    "nodes": {r['label']: r['count'] for r in node_results},
-                    "relationships": {r['rel_type']: r['count'] for r in rel_results},
+                    "nodes": nodes,
+                    "relationships": relationships,
                 }
             else:
                 # Global statistics
@@ -257,7 +382,7 @@ class Neo4jSchemaManager(SchemaManager):
                 RETURN count(n) as total_nodes
                 """
                 
-                result = self.client.execute_query(global_query)
+                result = self.client.execute_read(global_query)
                 total_nodes = result[0]['total_nodes'] if result else 0
                 
                 return {
@@ -0,0 +1,9 @@
+"""
+Interpreter compatibility helpers shared by the data models.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass on models created in bulk: slotted
+# dataclasses on Python 3.10+, older interpreters fall back to a __dict__.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
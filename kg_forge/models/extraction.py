@@ -5,6 +5,8 @@ Data models for entity extraction.
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
+from kg_forge.models._compat import SLOTS
+
 
 @dataclass
 class ExtractionRequest:
@@ -26,8 +28,27 @@ class ExtractionRequest:
     """Minimum confidence threshold (0.0-1.0). Entities below this are filtered out."""
 
 
-@dataclass
-class ExtractedEntity:
+class _HookAttributes:
+    """Slots for attributes that pipeline hooks set on entities.
+    
+    Covers the deduplication markers and the attributes the hook API in
+    specs/08-entity-normalization-deduplication.md assigns. Kept outside the
+    dataclass fields so the attributes only exist once a hook assigns them
+    (hooks check with ``hasattr``).
+    """
+    
+    __slots__ = (
+        "duplicate_of",
+        "duplicate_of_id",
+        "normalized_name",
+        "merged_into",
+        "aliases",
+        "embedding",
+    )
+
+
+@dataclass(**SLOTS)
+class ExtractedEntity(_HookAttributes):
     """Single entity extracted from content."""
     
     entity_type: str
@@ -48,7 +69,7 @@ class ExtractedEntity:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ExtractedRelationship:
     """Relationship between two extracted entities using array indices."""
     
@@ -0,0 +1,76 @@
+"""
+Lightweight row models for graph query results.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping
+
+from kg_forge.models._compat import SLOTS
+
+_ENTITY_FIELDS = ("namespace", "entity_type", "normalized_name", "name")
+_DOCUMENT_FIELDS = ("namespace", "doc_id", "source_path", "content_hash")
+
+
+@dataclass(**SLOTS)
+class EntityRow:
+    """Entity node read from the graph."""
+    
+    namespace: str
+    entity_type: str
+    normalized_name: str
+    name: str
+    extra: Dict[str, Any] = field(default_factory=dict)
+    """Any other node properties (description, timestamps, ...)."""
+    
+    @classmethod
+    def from_node(cls, node: Mapping[str, Any]) -> "EntityRow":
+        """Build a row from a node's properties."""
+        return cls(
+            node.get("namespace"),
+            node.get("entity_type"),
+            node.get("normalized_name"),
+            node.get("name"),
+            {k: v for k, v in node.items() if k not in _ENTITY_FIELDS},
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the node properties as a plain dict."""
+        data = dict(self.extra)
+        data["namespace"] = self.namespace
+        data["entity_type"] = self.entity_type
+        data["normalized_name"] = self.normalized_name
+        data["name"] = self.name
+        return data
+
+
+@dataclass(**SLOTS)
+class DocumentRow:
+    """Document node read from the graph."""
+    
+    namespace: str
+    doc_id: str
+    source_path: str
+    content_hash: str
+    extra: Dict[str, Any] = field(default_factory=dict)
+    """Any other node properties (title, metadata, timestamps, ...)."""
+    
+    @classmethod
+    def from_node(cls, node: Mapping[str, Any]) -> "DocumentRow":
+        """Build a row from a node's properties."""
+        return cls(
+            node.get("namespace"),
+            node.get("doc_id"),
+            node.get("source_path"),
+            node.get("content_hash"),
+            {k: v for k, v in node.items() if k not in _DOCUMENT_FIELDS},
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the node properties as a plain dict."""
+        data = dict(self.extra)
+        data["namespace"] = self.namespace
+        data["doc_id"] = self.doc_id
+        data["source_path"] = self.source_path
+        data["content_hash"] = self.content_hash
+        return data
+
@@ -4,6 +4,11 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+from kg_forge.models._compat import SLOTS
+
+# Error messages kept on PipelineStatistics; later ones are only counted
+MAX_RECORDED_ERRORS = 1000
+
 
 @dataclass
 class PipelineConfig:
@@ -21,7 +26,7 @@ class PipelineConfig:
     dry_run: bool = False  # Extract but don't write to graph
 
 
-@dataclass
+@dataclass(**SLOTS)
 class DocumentProcessingResult:
     """Result of processing a single document."""
     
@@ -35,7 +40,7 @@ class DocumentProcessingResult:
     skip_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PipelineStatistics:
     """Overall pipeline execution statistics."""
     
@@ -48,6 +53,22 @@ class PipelineStatistics:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     errors: List[str] = field(default_factory=list)
+    dropped_errors: int = 0  # Errors past MAX_RECORDED_ERRORS, counted only
+    
+    def record_error(self, message: str) -> None:
+        """
+        Record an error message, keeping at most MAX_RECORDED_ERRORS.
+        
+        Long runs with many failures would otherwise grow the list without
+        bound; messages past the cap are counted in dropped_errors.
+        
+        Args:
+            message: Error message to record
+        """
+        if len(self.errors) < MAX_RECORDED_ERRORS:
+            self.errors.append(message)
+        else:
+            self.dropped_errors += 1
     
     @property
     def duration(self) -> float:
@@ -1,6 +1,6 @@
 """HTML parsing utilities for kg-forge."""
 
 from kg_forge.parsers.html_parser import ConfluenceHTMLParser
-from kg_forge.parsers.document_loader import DocumentLoader
+from kg_forge.parsers.document_loader import DocumentLoader, iter_html_files
 
-__all__ = ["ConfluenceHTMLParser", "DocumentLoader"]
+__all__ = ["ConfluenceHTMLParser", "DocumentLoader", "iter_html_files"]
@@ -1,8 +1,12 @@
 """Document loader for bulk HTML parsing."""
 
+import fnmatch
 import logging
+import operator
+import os
+import re
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from kg_forge.models.document import ParsedDocument
 from kg_forge.parsers.html_parser import ConfluenceHTMLParser
@@ -10,6 +14,42 @@ from kg_forge.parsers.html_parser import ConfluenceHTMLParser
 logger = logging.getLogger(__name__)
 
 
+def iter_html_files(directory: Path, pattern: str = "*.html") -> Iterator[Path]:
+    """
+    Yield the files in a directory whose names match a glob pattern.
+
+    Scans with os.scandir, whose entries carry their file type, so no extra
+    stat call is made per file, and yields in name order so runs are
+    reproducible. Matches the same files as Path.glob: the scan is not
+    recursive and hidden files are included when the pattern matches them.
+
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern for file names (default: "*.html")
+
+    Yields:
+        Matching file paths, sorted by name
+    """
+    suffix = pattern[1:]
+    # Both matchers are C-level callables, so no Python frame runs per name
+    if pattern.startswith("*") and not any(c in suffix for c in "*?["):
+        # Plain "*.ext" patterns (the common case) need only a suffix test
+        matches = operator.methodcaller("endswith", suffix)
+    else:
+        matches = re.compile(fnmatch.translate(pattern)).match
+
+    # Only names are collected; a Path is built just for the files yielded
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if matches(entry.name) and entry.is_file()
+        ]
+    names.sort()
+    for name in names:
+        yield directory / name
+
+
 class DocumentLoader:
     """Load and parse multiple HTML documents."""
 
@@ -39,23 +79,17 @@ class DocumentLoader:
             FileNotFoundError: If directory doesn't exist
             ValueError: If no HTML files found
         """
-        if not directory.exists():
-            raise FileNotFoundError(f"Directory not found: {directory}")
-
+        # One stat on the normal path; exists() only to pick the error
         if not directory.is_dir():
+            if not directory.exists():
+                raise FileNotFoundError(f"Directory not found: {directory}")
             raise ValueError(f"Not a directory: {directory}")
 
-        # Find all HTML files
-        html_files = list(directory.glob(pattern))
-
-        if not html_files:
-            raise ValueError(f"No files matching '{pattern}' found in {directory}")
-
-        logger.info(f"Found {len(html_files)} HTML files in {directory}")
-
-        # Parse all files
+        # Parse files as they are found rather than collecting paths first
         documents = []
-        for filepath in html_files:
+        found = 0
+        for filepath in iter_html_files(directory, pattern):
+            found += 1
             try:
                 doc = self.parser.parse_file(filepath)
                 documents.append(doc)
@@ -65,7 +99,10 @@ class DocumentLoader:
                 # Continue with other files
                 continue
 
-        logger.info(f"Successfully parsed {len(documents)}/{len(html_files)} files")
+        if not found:
+            raise ValueError(f"No files matching '{pattern}' found in {directory}")
+
+        logger.info(f"Successfully parsed {len(documents)}/{found} files in {directory}")
 
         return documents
 
@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import os
 import re
 from pathlib import Path
 from typing import List, Optional
@@ -13,6 +14,8 @@ from kg_forge.models.document import DocumentLink, ParsedDocument
 
 logger = logging.getLogger(__name__)
 
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 class ConfluenceHTMLParser:
     """Parse Confluence HTML exports to structured documents."""
@@ -75,13 +78,15 @@ class ConfluenceHTMLParser:
         Returns:
             Document ID (numeric part before .html)
         """
-        # Pattern: anything ending with _<digits>.html
-        match = re.search(r"_(\d+)\.html$", filename)
-        if match:
-            return match.group(1)
+        # Pattern: anything ending with _<digits>.html (plain string ops,
+        # since this runs once per file)
+        if filename.endswith(".html"):
+            _, sep, digits = filename[:-5].rpartition("_")
+            if sep and digits.isdecimal():
+                return digits
 
         # Fallback: use filename without extension
-        return Path(filename).stem
+        return os.path.splitext(filename)[0]
 
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """
@@ -191,7 +196,7 @@ class ConfluenceHTMLParser:
             Cleaned markdown string
         """
         # Remove excessive blank lines (more than 2)
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
         # Strip leading/trailing whitespace
         markdown = markdown.strip()
@@ -7,8 +7,9 @@ Provides:
 - Type definitions for hook functions
 """
 
+import inspect
 import logging
-from typing import List, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -129,8 +130,31 @@ class HookRegistry:
         """Initialize empty hook registries."""
         self.before_store_hooks: List[ProcessBeforeStoreHook] = []
         self.after_batch_hooks: List[ProcessAfterBatchHook] = []
+        # (hook, parameter name) -> whether the hook accepts that parameter
+        self._accepts_cache: Dict[Tuple[Any, str], bool] = {}
         logger.debug("HookRegistry initialized")
     
+    def _accepts(self, hook: Callable, parameter: str) -> bool:
+        """
+        Check whether a hook accepts an optional parameter.
+        
+        The signature is inspected once per hook rather than on every call,
+        since hooks run for every document.
+        
+        Args:
+            hook: Registered hook function
+            parameter: Parameter name to look for
+            
+        Returns:
+            True if the hook's signature has the parameter
+        """
+        key = (hook, parameter)
+        accepts = self._accepts_cache.get(key)
+        if accepts is None:
+            accepts = parameter in inspect.signature(hook).parameters
+            self._accepts_cache[key] = accepts
+        return accepts
+    
     def register_before_store(self, hook: ProcessBeforeStoreHook):
         """
         Register a before-store hook.
@@ -179,9 +203,7 @@ class HookRegistry:
             try:
                 logger.debug(f"Running before_store hook: {hook.__name__}")
                 # Check if hook accepts interactive parameter
-                import inspect
-                sig = inspect.signature(hook)
-                if 'interactive' in sig.parameters:
+                if self._accepts(hook, 'interactive'):
                     result = hook(doc, result, graph_client, interactive)
                 else:
                     result = hook(doc, result, graph_client)
@@ -211,9 +233,7 @@ class HookRegistry:
             try:
                 logger.debug(f"Running after_batch hook: {hook.__name__}")
                 # Check if hook accepts namespace parameter
-                import inspect
-                sig = inspect.signature(hook)
-                if 'namespace' in sig.parameters:
+                if self._accepts(hook, 'namespace'):
                     hook(entities, graph_client, interactive, namespace=namespace)
                 else:
                     hook(entities, graph_client, interactive)
@@ -3,10 +3,11 @@
 import logging
 from typing import List, Optional, TYPE_CHECKING
 
-from sentence_transformers import SentenceTransformer
-from kg_forge.vector.chroma import ChromaVectorStore
-
+# sentence-transformers (torch) and ChromaDB take seconds to import, so they
+# are loaded when vector dedup actually runs, not when the hooks package is
+# imported.
 if TYPE_CHECKING:
+    from kg_forge.vector.chroma import ChromaVectorStore
     from kg_forge.pipeline.orchestrator import PipelineContext
     from kg_forge.models.extraction import Entity, ExtractionResult
 
@@ -19,7 +20,7 @@ class VectorDeduplicator:
     def __init__(
         self,
         model_name: str = 'all-MiniLM-L6-v2',
-        vector_store: Optional[ChromaVectorStore] = None
+        vector_store: Optional["ChromaVectorStore"] = None
     ):
         """
         Initialize with a sentence-transformers model and vector store.
@@ -28,6 +29,9 @@ class VectorDeduplicator:
             model_name: HuggingFace model name (default: all-MiniLM-L6-v2)
             vector_store: VectorStore instance (creates new if None)
         """
+        from sentence_transformers import SentenceTransformer
+        from kg_forge.vector.chroma import ChromaVectorStore
+        
         self.model = SentenceTransformer(model_name)
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
         self.vector_store = vector_store or ChromaVectorStore()
@@ -129,6 +133,8 @@ def vector_deduplicate_entities(
     
     # Initialize deduplicator with ChromaDB
     try:
+        from kg_forge.vector.chroma import ChromaVectorStore
+        
         vector_store = ChromaVectorStore(persist_directory=persist_dir)
         deduplicator = VectorDeduplicator(model_name, vector_store)
         context.logger.info(
@@ -20,10 +20,11 @@ from kg_forge.models.document import ParsedDocument
 from kg_forge.models.extraction import ExtractionRequest, ExtractedEntity, ExtractedRelationship
 from kg_forge.extractors.base import EntityExtractor
 from kg_forge.parsers.html_parser import ConfluenceHTMLParser
-from kg_forge.parsers.document_loader import DocumentLoader
+from kg_forge.parsers.document_loader import DocumentLoader, iter_html_files
 from kg_forge.graph.base import GraphClient
 from kg_forge.graph.neo4j.document_repo import Neo4jDocumentRepository
 from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
+from kg_forge.graph.neo4j.schema import Neo4jSchemaManager
 from kg_forge.graph.exceptions import GraphError, DuplicateEntityError
 from kg_forge.pipeline.hooks import get_hook_registry, InteractiveSession
 
@@ -69,6 +70,14 @@ class PipelineOrchestrator:
         self.document_repo = Neo4jDocumentRepository(graph_client)
         self.entity_repo = Neo4jEntityRepository(graph_client)
         
+        # MERGE on Doc/Entity only seeks (and locks per node) when the
+        # uniqueness constraints exist
+        if not config.dry_run:
+            try:
+                Neo4jSchemaManager(graph_client).ensure_schema()
+            except GraphError as e:
+                logger.warning(f"Could not ensure graph schema: {e}")
+        
         # Initialize document loader with parser
         parser = ConfluenceHTMLParser()
         self.document_loader = DocumentLoader(parser)
@@ -200,14 +209,14 @@ class PipelineOrchestrator:
             # Convert source_dir string to Path object
             source_path = Path(self.config.source_dir)
             
-            if not source_path.exists():
-                raise FileNotFoundError(f"Directory not found: {source_path}")
-            
+            # One stat on the normal path; exists() only to pick the error
             if not source_path.is_dir():
+                if not source_path.exists():
+                    raise FileNotFoundError(f"Directory not found: {source_path}")
                 raise ValueError(f"Not a directory: {source_path}")
             
-            # Find all HTML files
-            html_files = list(source_path.glob("*.html"))
+            # Find all HTML files (the list gives the run its total)
+            html_files = list(iter_html_files(source_path))
             
             if not html_files:
                 raise ValueError(f"No HTML files found in {source_path}")
@@ -228,7 +237,7 @@ class PipelineOrchestrator:
         Returns:
             Processing result with statistics
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Check if already processed (hash-based idempotency)
@@ -239,7 +248,7 @@ class PipelineOrchestrator:
                         success=True,
                         skipped=True,
                         skip_reason="Already processed (hash match)",
-                        processing_time=time.time() - start_time
+                        processing_time=time.monotonic() - start_time
                     )
             
             # Extract entities via LLM
@@ -250,7 +259,7 @@ class PipelineOrchestrator:
                     document_id=doc.doc_id,
                     success=False,
                     error=extraction_result.error or "Extraction failed",
-                    processing_time=time.time() - start_time
+                    processing_time=time.monotonic() - start_time
                 )
             
             # Run before_store hooks
@@ -285,7 +294,7 @@ class PipelineOrchestrator:
                 success=True,
                 entities_found=len(entities),
                 relationships_created=relationships_created,
-                processing_time=time.time() - start_time
+                processing_time=time.monotonic() - start_time
             )
             
         except Exception as e:
@@ -294,7 +303,7 @@ class PipelineOrchestrator:
                 document_id=doc.doc_id,
                 success=False,
                 error=str(e),
-                processing_time=time.time() - start_time
+                processing_time=time.monotonic() - start_time
             )
     
     def _document_already_processed(self, doc: ParsedDocument) -> bool:
@@ -374,28 +383,37 @@ class PipelineOrchestrator:
             )
             logger.debug(f"Created/updated document {doc.doc_id}")
             
-            # Create/update entities and links
+            # Create/update entities and links; repository methods are bound
+            # once rather than looked up for every entity
+            doc_id = doc.doc_id
+            normalize_name = self.entity_repo.normalize_name
+            create_entity = self.entity_repo.create_entity
+            add_mention = self.document_repo.add_mention
             for entity in entities:
+                entity_type = entity.entity_type
+                normalized_name = normalize_name(entity.name)
+                
                 # Try to create entity (it's OK if it already exists)
                 try:
-                    self.entity_repo.create_entity(
+                    create_entity(
                         namespace=namespace,
-                        entity_type=entity.entity_type,
+                        entity_type=entity_type,
                         name=entity.name,
                         **entity.properties  # Spread properties as kwargs (entity_repo wraps them)
                     )
                     entities_created += 1
-                    logger.debug(f"Created entity: {entity.entity_type}/{entity.name}")
+                    logger.debug("Created entity: %s/%s", entity_type, entity.name)
                 except DuplicateEntityError:
                     # Entity already exists - this is normal in a knowledge graph
-                    logger.debug(f"Entity already exists: {entity.entity_type}/{entity.name}")
+                    logger.debug("Entity already exists: %s/%s", entity_type, entity.name)
                 
                 # Link document to entity (MENTIONS relationship)
-                self.document_repo.add_mention(
+                add_mention(
                     namespace=namespace,
-                    doc_id=doc.doc_id,
-                    entity_type=entity.entity_type,
+                    doc_id=doc_id,
+                    entity_type=entity_type,
                     entity_name=entity.name,
+                    normalized_name=normalized_name,
                     confidence=entity.confidence
                 )
                 relationships_created += 1
@@ -485,7 +503,7 @@ class PipelineOrchestrator:
             self.stats.failed += 1
             if result.error:
                 error_msg = f"{result.document_id}: {result.error}"
-                self.stats.errors.append(error_msg)
+                self.stats.record_error(error_msg)
     
     def _log_progress(self, result: DocumentProcessingResult):
         """
@@ -41,7 +41,11 @@ setup(
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
-        ]
+        ],
+        # Native Bolt (de)serialization for the neo4j driver
+        "fast": [
+            "neo4j-rust-ext>=5.14.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -88,3 +88,17 @@ def test_parse_empty_directory(runner, tmp_path):
     
     assert result.exit_code == 0
     assert "0" in result.output  # Should mention 0 documents
+
+
+def test_parse_summary_totals(runner, test_data_dir):
+    """Test that the summary totals match the parsed documents."""
+    from kg_forge.parsers import DocumentLoader
+    
+    documents = DocumentLoader().load_from_directory(test_data_dir)
+    total_links = sum(len(doc.links) for doc in documents)
+    total_chars = sum(len(doc.text) for doc in documents)
+    
+    result = runner.invoke(parse_html, ["--source", str(test_data_dir)])
+    
+    assert f"Total links: {total_links}\n" in result.output
+    assert f"Total content: {total_chars:,} characters" in result.output
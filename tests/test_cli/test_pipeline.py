@@ -27,6 +27,7 @@ def mock_stats():
     stats.total_relationships = 30
     stats.duration = 15.5
     stats.errors = []
+    stats.dropped_errors = 0
     return stats
 
 
@@ -78,6 +78,50 @@ class TestResponseParser:
         
         assert len(entities) == 0
     
+    def test_parse_entities_only(self):
+        """Test parsing without relationships returns just the entity list."""
+        response_text = """
+        {
+          "entities": [
+            {"type_id": "product", "name": "A"},
+            {"type_id": "product", "name": "B"}
+          ],
+          "relations": [
+            {"from_entity": 0, "to_entity": 1, "relation_type": "uses"}
+          ]
+        }
+        """
+        
+        entities = self.parser.parse(response_text, include_relationships=False)
+        
+        assert [e.name for e in entities] == ["A", "B"]
+        assert self.parser.parse("", include_relationships=False) == []
+    
+    def test_parse_relationships_skips_out_of_range_indices(self):
+        """Test relationships with invalid entity indices are skipped."""
+        response_text = """
+        {
+          "entities": [
+            {"type_id": "product", "name": "A"},
+            {"type_id": "technology", "name": "B"}
+          ],
+          "relations": [
+            {"from_entity": 0, "to_entity": 1, "relation_type": "uses"},
+            {"from_entity": 0, "to_entity": 2, "relation_type": "uses"},
+            {"from_entity": -1, "to_entity": 1, "relation_type": "uses"},
+            {"from_entity": "1", "to_entity": "0", "type": "used_by"}
+          ]
+        }
+        """
+        
+        entities, relationships = self.parser.parse(response_text)
+        
+        assert len(entities) == 2
+        assert [(r.from_index, r.to_index, r.relation_type) for r in relationships] == [
+            (0, 1, "USES"),
+            (1, 0, "USED_BY"),
+        ]
+    
     def test_parse_malformed_json(self):
         """Test parsing malformed JSON raises error."""
         response_text = "{entities: [invalid json}"
@@ -87,6 +131,22 @@ class TestResponseParser:
         
         assert "Invalid JSON" in str(exc_info.value)
     
+    def test_parse_repairs_common_llm_mistakes(self):
+        """Test trailing commas and Python literals are repaired locally."""
+        response_text = """
+        {
+          "entities": [
+            {"type_id": "product", "name": "Trailing, True", "active": True, "owner": None,},
+          ],
+        }
+        """
+        
+        entities, relationships = self.parser.parse(response_text)
+        
+        assert len(entities) == 1
+        assert entities[0].name == "Trailing, True"
+        assert entities[0].properties == {"active": True, "owner": None}
+    
     def test_parse_missing_entities_field(self):
         """Test parsing JSON without 'entities' field."""
         response_text = '{"results": []}'
@@ -29,6 +29,19 @@ class TestPromptBuilder:
         
         assert "Template not found" in str(exc_info.value)
     
+    def test_initialization_invalid_template(self, tmp_path):
+        """Test initialization fails if placeholders are out of order."""
+        entities_dir = tmp_path / "entities"
+        entities_dir.mkdir()
+        (entities_dir / "prompt_template.md").write_text(
+            "{{TEXT}}\n{{ENTITY_TYPE_DEFINITIONS}}\n"
+        )
+        
+        with pytest.raises(ValueError) as exc_info:
+            PromptBuilder(entities_dir=entities_dir)
+        
+        assert "before {{TEXT}}" in str(exc_info.value)
+    
     def test_build_extraction_prompt_all_types(self):
         """Test building prompt with all entity types."""
         builder = PromptBuilder(entities_dir=Path("entities_extract"))
@@ -102,6 +115,20 @@ class TestPromptBuilder:
         # Should include at least some expected types
         assert any(t in ["product", "technology", "component", "workstream"] for t in types)
     
+    def test_entity_definitions_text_cached(self):
+        """Test that rendered definitions are reused across calls."""
+        builder = PromptBuilder(entities_dir=Path("entities_extract"))
+        
+        first = builder.build_extraction_prompt("Doc one", entity_types=["Product"])
+        second = builder.build_extraction_prompt("Doc two", entity_types=["product"])
+        
+        assert frozenset({"product"}) in builder._defs_cache
+        assert len(builder._defs_cache) == 1
+        assert first.replace("Doc one", "") == second.replace("Doc two", "")
+        
+        builder.reload()
+        assert builder._defs_cache == {}
+    
     def test_build_entity_definitions_formatting(self):
         """Test that entity definitions are properly formatted."""
         builder = PromptBuilder(entities_dir=Path("entities_extract"))
@@ -70,6 +70,7 @@ def mock_neo4j_client():
     client.password = "password"
     client.database = "neo4j"
     client._driver = MagicMock()
+    client.batch_session.return_value = MagicMock()
     return client
 
 
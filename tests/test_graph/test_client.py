@@ -0,0 +1,681 @@
+"""Unit tests for Neo4j client.
+
+These tests patch the Neo4j driver so no database is required.
+For integration tests with real Neo4j, see test_integration.py.
+"""
+
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+from kg_forge.graph.neo4j.client import (
+    Neo4jClient,
+    WriteSummary,
+    _DRIVER_CACHE,
+    _SHARED_CLIENTS,
+)
+from kg_forge.config.settings import Settings
+
+
+def _record(values):
+    """Build a fake Neo4j record."""
+    record = Mock()
+    record.data.return_value = values
+    return record
+
+
+@pytest.fixture
+def mock_driver():
+    """Patch GraphDatabase.driver and return the fake driver."""
+    with patch("neo4j.GraphDatabase") as graph_db, \
+            patch.dict(_DRIVER_CACHE, clear=True):
+        graph_db.driver.side_effect = lambda *args, **kwargs: MagicMock()
+        yield graph_db
+
+
+class TestClientConnection:
+    """Test driver construction."""
+    
+    def test_connect_passes_pool_settings(self, mock_driver):
+        """Test that pool tuning knobs reach the driver."""
+        client = Neo4jClient(
+            "bolt://localhost:7687", "neo4j", "pw",
+            max_connection_pool_size=10,
+            connection_acquisition_timeout=5.0
+        )
+        
+        assert client.connect() is True
+        
+        kwargs = mock_driver.driver.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 10
+        assert kwargs["connection_acquisition_timeout"] == 5.0
+        assert kwargs["keep_alive"] is True
+    
+    def test_connect_verifies_once(self, mock_driver):
+        """Test that reconnecting a verified client skips the handshake."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        client.connect()
+        client.connect()
+        
+        assert mock_driver.driver.call_count == 1
+        client.driver.get_server_info.assert_called_once()
+    
+    def test_connect_records_server_agent(self, mock_driver):
+        """Test that the handshake's server agent is kept on the client."""
+        driver = MagicMock()
+        driver.get_server_info.return_value.agent = "Neo4j/5.20.0"
+        mock_driver.driver.side_effect = lambda *args, **kwargs: driver
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", warmup=False)
+        
+        client.connect()
+        
+        assert client.server_agent == "Neo4j/5.20.0"
+        client.driver.verify_connectivity.assert_not_called()
+    
+    def test_connect_skip_verify(self, mock_driver):
+        """Test that skip_verify creates the driver without a handshake."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        assert client.connect(skip_verify=True) is True
+        
+        client.driver.get_server_info.assert_not_called()
+    
+    def test_connect_runs_warmup_queries(self, mock_driver):
+        """Test that warm-up reads run once after verification."""
+        client = Neo4jClient(
+            "bolt://localhost:7687", "neo4j", "pw", warmup=True,
+            warmup_queries=["MATCH (e:Entity) RETURN count(e)"]
+        )
+        
+        client.connect()
+        
+        session = client.driver.session.return_value.__enter__.return_value
+        queries = [c.args[0] for c in session.run.call_args_list]
+        assert queries[-1] == "MATCH (e:Entity) RETURN count(e)"
+        assert len(queries) == 3
+    
+    def test_connect_without_warmup(self, mock_driver):
+        """Test that warm-up is off unless requested."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        client.connect()
+        
+        client.driver.session.assert_not_called()
+    
+    def test_clients_share_driver(self, mock_driver):
+        """Test that identical settings reuse one driver until the last close."""
+        first = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        second = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", database="other")
+        
+        first.connect()
+        second.connect()
+        driver = first.driver
+        
+        assert second.driver is driver
+        assert mock_driver.driver.call_count == 1
+        
+        first.close()
+        driver.close.assert_not_called()
+        second.close()
+        driver.close.assert_called_once()
+    
+    def test_connect_reports_rust_codec(self, mock_driver, caplog):
+        """Test that driver creation logs whether the Rust codec is active."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        with caplog.at_level("INFO", logger="kg_forge.graph.neo4j.client"):
+            client.connect()
+        
+        assert "Rust PackStream codec" in caplog.text
+    
+    def test_shared_client_is_reused(self, mock_driver):
+        """Test that get_shared_client hands out one connected instance."""
+        with patch.dict(_SHARED_CLIENTS, clear=True), patch("atexit.register"):
+            first = Neo4jClient.get_shared_client(Settings())
+            second = Neo4jClient.get_shared_client(Settings())
+            
+            assert first is second
+            assert first.driver is not None
+            assert mock_driver.driver.call_count == 1
+            
+            Neo4jClient.close_shared_clients()
+            
+            assert first.driver is None
+            assert not _SHARED_CLIENTS
+
+
+class TestAsyncClient:
+    """Test the async client against a patched async driver."""
+    
+    def test_execute_query_uses_read_transaction(self):
+        """Test that execute_query reads through a managed transaction."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from kg_forge.graph.neo4j.async_client import AsyncNeo4jClient
+        
+        result = Mock()
+        result.data = AsyncMock(return_value=[{"n": 1}, {"n": 2}])
+        
+        tx = Mock()
+        tx.run = AsyncMock(return_value=result)
+        
+        async def _run_tx(fn):
+            return await fn(tx)
+        
+        session = MagicMock()
+        session.execute_read = AsyncMock(side_effect=_run_tx)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        
+        client = AsyncNeo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        rows = asyncio.run(client.execute_query("RETURN 1 AS n"))
+        
+        assert rows == [{"n": 1}, {"n": 2}]
+        tx.run.assert_awaited_once_with("RETURN 1 AS n", {})
+        assert client._driver.session.call_args.kwargs["default_access_mode"] == "READ"
+    
+    def test_connect_reuses_driver_and_closes_failed_one(self):
+        """Test that reconnecting keeps the driver and a failed verify closes it."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+        from kg_forge.graph.neo4j.async_client import AsyncNeo4jClient
+        
+        failed = Mock()
+        failed.verify_connectivity = AsyncMock(side_effect=RuntimeError("refused"))
+        failed.close = AsyncMock()
+        good = Mock()
+        good.verify_connectivity = AsyncMock()
+        
+        client = AsyncNeo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        with patch("kg_forge.graph.neo4j.async_client.AsyncGraphDatabase") as graph_db:
+            graph_db.driver.side_effect = [failed, good]
+            with pytest.raises(GraphConnectionError):
+                asyncio.run(client.connect())
+            assert client._driver is None
+            failed.close.assert_awaited_once()
+            
+            assert asyncio.run(client.connect())
+            assert asyncio.run(client.connect())
+        
+        assert client._driver is good
+        assert graph_db.driver.call_count == 2
+
+
+class TestUnwindWrite:
+    """Test batched UNWIND writes."""
+    
+    def test_rows_are_sent_in_batches(self):
+        """Test that rows are chunked and counters summed."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        summary = Mock()
+        summary.counters = Mock(
+            nodes_created=2, nodes_deleted=0, relationships_created=0,
+            relationships_deleted=0, properties_set=4
+        )
+        session.execute_write.return_value = summary
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        rows = [{"id": i} for i in range(5)]
+        totals = client.execute_unwind_write(
+            "UNWIND $rows AS row MERGE (n:X {id: row.id})", rows, batch_size=2
+        )
+        
+        chunks = [c.args[1] for c in session.execute_write.call_args_list]
+        assert chunks == [rows[0:2], rows[2:4], rows[4:5]]
+        assert totals["nodes_created"] == 6
+        assert totals["properties_set"] == 12
+    
+    def test_batch_size_and_count_column(self):
+        """Test the client default batch size, shared parameters and count_key."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_write.side_effect = lambda fn, chunk: fn(tx, chunk)
+        tx = Mock()
+        tx.run.return_value.single.side_effect = [{"count": 2}, {"count": 1}]
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", batch_size=2)
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        rows = [{"id": i} for i in range(3)]
+        written = client.execute_unwind_write(
+            "UNWIND $rows AS row MERGE (n:X {ns: $ns, id: row.id}) RETURN count(n) AS count",
+            rows, parameters={"ns": "default"}, count_key="count"
+        )
+        
+        assert written == 3
+        sent = [c.args[1] for c in tx.run.call_args_list]
+        assert sent == [
+            {"ns": "default", "rows": rows[0:2]},
+            {"ns": "default", "rows": rows[2:3]},
+        ]
+
+
+class TestQueryCache:
+    """Test the read-query result cache."""
+    
+    @pytest.fixture
+    def client(self):
+        """Client with a fake driver whose session returns one record."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        tx = Mock()
+        tx.run.return_value.data.side_effect = lambda: [{"count": 1}]
+        session.execute_read.side_effect = lambda fn: fn(tx)
+        session.execute_write.side_effect = lambda fn: fn(tx)
+        
+        client = Neo4jClient(
+            "bolt://localhost:7687", "neo4j", "pw", query_cache_size=10_000
+        )
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        client._tx = tx
+        return client
+    
+    def test_repeated_read_is_cached(self, client):
+        """Test that identical reads hit the database once."""
+        first = client.execute_query("MATCH (n) RETURN count(n) AS count", {"ns": "a"})
+        first[0]["count"] = 99
+        second = client.execute_query("MATCH (n) RETURN count(n) AS count", {"ns": "a"})
+        
+        assert second == [{"count": 1}]
+        assert client._tx.run.call_count == 1
+        assert client.cache_hits == 1
+        assert client.cache_misses == 1
+    
+    def test_cached_rows_are_deep_copies(self, client):
+        """Test that mutating nested values in a result does not reach the cache."""
+        client._tx.run.return_value.data.side_effect = lambda: [{"e": {"name": "a"}}]
+        first = client.execute_query("MATCH (e) RETURN e", {"ns": "a"})
+        first[0]["e"]["name"] = "changed"
+        second = client.execute_query("MATCH (e) RETURN e", {"ns": "a"})
+        
+        assert second == [{"e": {"name": "a"}}]
+        assert client._tx.run.call_count == 1
+    
+    def test_write_invalidates_cache(self, client):
+        """Test that writes clear cached reads."""
+        client.execute_query("MATCH (n) RETURN count(n) AS count")
+        client.execute_query("MATCH (n) DETACH DELETE n")
+        client.execute_query("MATCH (n) RETURN count(n) AS count")
+        
+        assert client._tx.run.call_count == 3
+    
+    def test_reads_and_writes_use_managed_transactions(self, client):
+        """Test that queries are routed by their clauses."""
+        session = client._driver.session.return_value
+        client.execute_query("MATCH (n) RETURN count(n) AS count")
+        client.execute_query("MERGE (n:Entity {name: $name})", {"name": "x"})
+        
+        session.execute_read.assert_called_once()
+        session.execute_write.assert_called_once()
+    
+    def test_read_only_overrides_routing(self, client):
+        """Test that read_only forces read routing for procedure calls."""
+        session = client._driver.session.return_value
+        client.execute_query(
+            "CALL db.labels() YIELD label RETURN label", read_only=True
+        )
+        
+        session.execute_read.assert_called_once()
+        session.execute_write.assert_not_called()
+        assert client._driver.session.call_args.kwargs["default_access_mode"] == "READ"
+    
+    def test_execute_scalar_pulls_single_value(self, client):
+        """Test that execute_scalar returns one value without caching it."""
+        client._tx.run.return_value.single.return_value = [True]
+        
+        assert client.execute_scalar("RETURN EXISTS { MATCH (n) } AS exists") is True
+        assert client.execute_scalar("RETURN EXISTS { MATCH (n) } AS exists") is True
+        
+        client._tx.run.return_value.single.assert_called_with(strict=False)
+        assert client._tx.run.call_count == 2
+        
+        client._tx.run.return_value.single.return_value = None
+        assert client.execute_scalar("RETURN 1") is None
+    
+    def test_execute_read_uses_driver_execute_query(self, client):
+        """Test that execute_read is one routed driver call, uncached."""
+        from neo4j import RoutingControl
+        client._driver.execute_query.return_value = [{"name": "doc_unique"}]
+        
+        assert client.execute_read("SHOW CONSTRAINTS") == [{"name": "doc_unique"}]
+        assert client.execute_read("SHOW CONSTRAINTS") == [{"name": "doc_unique"}]
+        
+        kwargs = client._driver.execute_query.call_args.kwargs
+        assert kwargs["routing_"] == RoutingControl.READ
+        assert kwargs["database_"] == "neo4j"
+        assert client._driver.execute_query.call_count == 2
+        client._driver.session.assert_not_called()
+    
+    def test_execute_read_uses_bound_session(self, client):
+        """Test that execute_read joins an open batch session."""
+        with client.batch_session():
+            assert client.execute_read("SHOW INDEXES") == [{"count": 1}]
+        
+        client._driver.execute_query.assert_not_called()
+    
+    def test_cache_is_disabled_by_default(self, client):
+        """Test that reads are not cached unless a cache size is given."""
+        client.query_cache_size = Neo4jClient("bolt://x", "neo4j", "pw").query_cache_size
+        client.execute_query("MATCH (n) RETURN count(n) AS count")
+        client.execute_query("MATCH (n) RETURN count(n) AS count")
+        
+        assert client._tx.run.call_count == 2
+
+
+class TestStreamQuery:
+    """Test streaming reads."""
+    
+    def test_stream_stops_early_and_closes_session(self):
+        """Test that records are yielded lazily and the session is closed."""
+        consumed = []
+        
+        def records():
+            for i in range(100):
+                consumed.append(i)
+                yield _record({"i": i})
+        
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.run.return_value = records()
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        stream = client.stream_query("MATCH (n) RETURN n.i AS i")
+        assert next(stream) == {"i": 0}
+        stream.close()
+        
+        assert consumed == [0]
+        session.__exit__.assert_called_once()
+    
+    def test_stream_errors_are_wrapped_and_chained(self, caplog):
+        """Test that failures while streaming go through the shared error handling."""
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError, QueryError
+        
+        timeout = RuntimeError("terminated")
+        timeout.code = "Neo.ClientError.Transaction.TransactionTimedOut"
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.run.side_effect = [RuntimeError("socket closed"), timeout]
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        with caplog.at_level("ERROR", logger="kg_forge.graph.neo4j.query_errors"):
+            with pytest.raises(GraphConnectionError, match="Query execution failed") as exc_info:
+                list(client.stream_query("MATCH (n) RETURN n"))
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+        assert len(caplog.records) == 1
+        
+        with pytest.raises(QueryError):
+            list(client.stream_query("MATCH (n) RETURN n"))
+
+
+class TestWriteSummary:
+    """Test the write summary tuple."""
+    
+    def test_supports_attribute_index_and_key_access(self):
+        """Test that legacy dict-style lookups keep working."""
+        summary = WriteSummary(nodes_created=3, properties_set=2)
+        
+        assert summary.nodes_created == 3
+        assert summary[0] == 3
+        assert summary["properties_set"] == 2
+        assert summary._asdict()["nodes_deleted"] == 0
+        with pytest.raises(KeyError):
+            summary["missing"]
+    
+    def test_supports_read_only_mapping_api(self):
+        """Test that dict-style membership, get, items and dict() use counter names."""
+        summary = WriteSummary(nodes_created=3, properties_set=2)
+        
+        for name in ("count", "index"):
+            with pytest.raises(KeyError):
+                summary[name]
+            assert name not in summary
+        assert "nodes_created" in summary
+        assert summary.get("properties_set") == 2
+        assert summary.get("count", -1) == -1
+        assert dict(summary) == summary._asdict()
+        assert dict(summary.items()) == summary._asdict()
+        assert list(summary.values()) == [3, 0, 0, 0, 2]
+    
+    def test_summaries_add_fieldwise(self):
+        """Test that adding summaries sums each counter."""
+        total = WriteSummary(1, 0, 2, 0, 3) + WriteSummary(1, 1, 1, 1, 1)
+        
+        assert total == WriteSummary(2, 1, 3, 1, 4)
+
+
+class TestBatchedWrites:
+    """Test the batched write context manager."""
+    
+    def test_statements_commit_per_batch(self):
+        """Test that statements are grouped into transactions."""
+        tx = Mock()
+        tx.run.return_value.consume.return_value.counters = Mock(
+            nodes_created=1, nodes_deleted=0, relationships_created=0,
+            relationships_deleted=0, properties_set=1
+        )
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_write.side_effect = lambda fn: fn(tx)
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        with client.batched_writes(batch_size=2) as batch:
+            for i in range(5):
+                batch.add("CREATE (n:X {id: $id})", {"id": i})
+        
+        assert session.execute_write.call_count == 3
+        assert tx.run.call_count == 5
+        assert batch.summary.nodes_created == 5
+    
+    def test_error_discards_pending_statements(self):
+        """Test that a failing block does not commit buffered statements."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        
+        with pytest.raises(RuntimeError):
+            with client.batched_writes() as batch:
+                batch.add("CREATE (n:X)")
+                raise RuntimeError("boom")
+        
+        client._driver.session.assert_not_called()
+    
+    def test_execute_write_batch_uses_one_transaction(self):
+        """Test that a list of statements is committed together."""
+        tx = Mock()
+        tx.run.return_value.consume.return_value.counters = Mock(
+            nodes_created=0, nodes_deleted=0, relationships_created=0,
+            relationships_deleted=0, properties_set=0
+        )
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_write.side_effect = lambda fn: fn(tx)
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        client.execute_write_batch(["CREATE INDEX a", "CREATE INDEX b", "CREATE INDEX c"])
+        
+        assert session.execute_write.call_count == 1
+        assert [c.args[0] for c in tx.run.call_args_list] == [
+            "CREATE INDEX a", "CREATE INDEX b", "CREATE INDEX c"
+        ]
+
+    
+    def test_batch_session_reuses_one_session(self):
+        """Test that queries inside batch_session share a session."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_read.return_value = []
+        session.execute_write.return_value = WriteSummary()
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", query_cache_size=0)
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        with client.batch_session():
+            client.execute_query("SHOW CONSTRAINTS", read_only=True)
+            client.execute_query("SHOW INDEXES", read_only=True)
+            client.execute_write_batch(["CREATE INDEX a"])
+        client.execute_query("SHOW INDEXES", read_only=True)
+        
+        assert client._driver.session.call_count == 2
+        assert session.execute_read.call_count == 3
+
+    
+    def test_every_session_names_the_database(self):
+        """Test that sessions always target the configured database."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.run.return_value = iter([])
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", database="kg")
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        
+        with client.batch_session():
+            list(client.stream_query("MATCH (n) RETURN n"))
+        client._warm_up()
+        
+        # stream_query opens its own session even inside a batch session
+        assert client._driver.session.call_count == 3
+        for call in client._driver.session.call_args_list:
+            assert call.kwargs["database"] == "kg"
+
+
+class TestQueryTimeout:
+    """Test per-call query timeouts."""
+    
+    @pytest.fixture
+    def client(self):
+        """Client with a fake driver that runs transaction functions."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute_read.side_effect = lambda fn: fn(Mock())
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw", query_timeout=30)
+        client._driver = Mock()
+        client._driver.session.return_value = session
+        return client
+    
+    def test_timeout_is_attached_to_transaction(self, client):
+        """Test that the per-call timeout overrides the client default."""
+        session = client._driver.session.return_value
+        client.execute_query("MATCH (n) RETURN n", {"a": [1]}, timeout=5)
+        
+        tx_function = session.execute_read.call_args.args[0]
+        assert tx_function.timeout == 5
+    
+    def test_timeout_error_raises_query_error(self, client):
+        """Test that server-side timeouts surface as QueryError."""
+        from kg_forge.graph.exceptions import QueryError
+        
+        error = Exception("timed out")
+        error.code = "Neo.ClientError.Transaction.TransactionTimedOut"
+        client._driver.session.return_value.execute_read.side_effect = error
+        
+        with pytest.raises(QueryError) as exc_info:
+            client.execute_query("MATCH (n) RETURN n", {"a": [1]})
+        
+        assert exc_info.value.query == "MATCH (n) RETURN n"
+
+
+class TestQueryErrors:
+    """Test error wrapping on query methods."""
+    
+    def test_driver_error_becomes_connection_error(self):
+        """Test that driver failures are re-raised chained as GraphConnectionError."""
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.side_effect = RuntimeError("socket closed")
+        
+        with pytest.raises(GraphConnectionError, match="Write transaction failed") as exc_info:
+            client.execute_write_tx("CREATE (n)", parameters={"a": 1})
+        
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+    
+    def test_unwind_and_batch_errors_are_wrapped(self, caplog):
+        """Test that batched writes log once and summarize their rows."""
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.side_effect = RuntimeError("socket closed")
+        
+        with caplog.at_level("ERROR"):
+            with pytest.raises(GraphConnectionError, match="Batched write failed"):
+                client.execute_unwind_write("UNWIND $rows AS row CREATE (n)", [{}, {}])
+            with pytest.raises(GraphConnectionError, match="Batched write transaction failed"):
+                with client.batched_writes() as batch:
+                    batch.add("CREATE (n)")
+        
+        assert [r.params for r in caplog.records] == ["<2 rows>", "<1 statements>"]
+    
+    def test_async_driver_error_becomes_connection_error(self):
+        """Test that the async client wraps driver failures the same way."""
+        import asyncio
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+        from kg_forge.graph.neo4j.async_client import AsyncNeo4jClient
+        
+        client = AsyncNeo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        client._driver = Mock()
+        client._driver.session.side_effect = RuntimeError("socket closed")
+        
+        with pytest.raises(GraphConnectionError, match="Write transaction failed") as exc_info:
+            asyncio.run(client.execute_write_tx("CREATE (n)"))
+        
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+    
+    def test_not_connected_passes_through(self):
+        """Test that the not-connected error is not re-wrapped."""
+        from kg_forge.graph.exceptions import ConnectionError as GraphConnectionError
+        
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        with pytest.raises(GraphConnectionError, match="^Not connected to database$"):
+            client.execute_write("CREATE (n)")
+
+
+class TestAsyncRepositories:
+    """Test concurrent lookups in the async repositories."""
+    
+    def test_bulk_get_entities_keeps_order(self):
+        """Test that gathered lookups are returned in input order."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from kg_forge.graph.neo4j.async_repos import AsyncNeo4jEntityRepository
+        
+        async def fake_query(query, params, read_only=None):
+            if params["normalized_name"] == "missing":
+                return []
+            return [{"e": {"normalized_name": params["normalized_name"]}}]
+        
+        client = Mock()
+        client.execute_query = AsyncMock(side_effect=fake_query)
+        repo = AsyncNeo4jEntityRepository(client)
+        
+        result = asyncio.run(repo.bulk_get_entities(
+            "default", [("Team", "Core (C)"), ("Team", "Missing"), ("Product", "KD")]
+        ))
+        
+        assert result == [{"normalized_name": "core"}, None, {"normalized_name": "kd"}]
+        assert client.execute_query.await_count == 3
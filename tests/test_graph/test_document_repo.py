@@ -31,7 +31,7 @@ class TestDocumentExists:
     def test_document_exists_by_id_true(self, doc_repo):
         """Test checking if document exists by ID."""
         repo, client = doc_repo
-        client.execute_query.return_value = [{'count': 1}]
+        client.execute_scalar.return_value = True
         
         result = repo.document_exists("default", "test-doc-123")
         
@@ -40,7 +40,7 @@ class TestDocumentExists:
     def test_document_exists_by_id_false(self, doc_repo):
         """Test document doesn't exist."""
         repo, client = doc_repo
-        client.execute_query.return_value = [{'count': 0}]
+        client.execute_scalar.return_value = False
         
         result = repo.document_exists("default", "nonexistent")
         
@@ -49,11 +49,57 @@ class TestDocumentExists:
     def test_document_hash_exists_true(self, doc_repo):
         """Test checking if document exists by hash."""
         repo, client = doc_repo
-        client.execute_query.return_value = [{'count': 1}]
+        client.execute_scalar.return_value = True
         
         result = repo.document_hash_exists("default", "abc123")
         
         assert result is True
+    
+    def test_document_exists_memoizes_only_hits(self, doc_repo):
+        """Test that misses are re-checked and hits are cached until a write."""
+        repo, client = doc_repo
+        client.execute_scalar.return_value = False
+        client.execute_write_tx.return_value = [{'d': {'doc_id': 'new-doc'}}]
+        
+        assert repo.document_exists("default", "new-doc") is False
+        assert repo.document_exists("default", "new-doc") is False
+        assert client.execute_scalar.call_count == 2
+        
+        client.execute_scalar.return_value = True
+        assert repo.document_exists("default", "new-doc") is True
+        assert repo.document_exists("default", "new-doc") is True
+        assert client.execute_scalar.call_count == 3
+        
+        repo.create_document("default", "new-doc", "/path", "hash")
+        assert repo.document_exists("default", "new-doc") is True
+        assert client.execute_scalar.call_count == 4
+    
+    def test_existence_checks_short_circuit(self, doc_repo):
+        """Test that existence checks use EXISTS instead of counting."""
+        repo, client = doc_repo
+        client.execute_scalar.return_value = True
+        
+        repo.document_exists("default", "test-doc-123")
+        repo.document_hash_exists("default", "abc123")
+        
+        for call in client.execute_scalar.call_args_list:
+            assert "EXISTS {" in call.args[0]
+            assert "count(" not in call.args[0]
+
+
+class TestGetDocuments:
+    """Test multi-document lookups."""
+    
+    def test_get_documents_uses_in_list(self, doc_repo):
+        """Test that documents are fetched with one IN-list query."""
+        repo, client = doc_repo
+        client.execute_query.return_value = [{'d': {'doc_id': 'a'}}]
+        
+        result = repo.get_documents("default", ["a", "b", "a"])
+        
+        params = client.execute_query.call_args.args[1]
+        assert params["doc_ids"] == ["a", "b"]
+        assert result == {'a': {'doc_id': 'a'}}
 
 
 class TestCreateDocument:
@@ -126,7 +172,9 @@ class TestAddMention:
     def test_add_mention_success(self, doc_repo):
         """Test successfully adding mention."""
         repo, client = doc_repo
-        client.execute_write_tx.return_value = [{'r': {'confidence': 0.9}}]
+        client.execute_write_tx.return_value = [
+            {'has_doc': True, 'has_ent': True, 'r': {'confidence': 0.9}}
+        ]
         
         result = repo.add_mention(
             "default", "test-doc-123",
@@ -140,10 +188,11 @@ class TestAddMention:
     def test_add_mention_with_properties(self, doc_repo):
         """Test adding mention with extra properties."""
         repo, client = doc_repo
-        client.execute_write_tx.return_value = [{'r': {
-            'confidence': 0.95,
-            'context': 'test context'
-        }}]
+        client.execute_write_tx.return_value = [{
+            'has_doc': True,
+            'has_ent': True,
+            'r': {'confidence': 0.95, 'context': 'test context'}
+        }]
         
         result = repo.add_mention(
             "default", "test-doc-123",
@@ -153,11 +202,136 @@ class TestAddMention:
         )
         
         assert result['context'] == 'test context'
+    
+    def test_add_mention_uses_given_normalized_name(self, doc_repo):
+        """Test that a pre-normalized name is used as-is."""
+        repo, client = doc_repo
+        client.execute_write_tx.return_value = [
+            {'has_doc': True, 'has_ent': True, 'r': {}}
+        ]
+        
+        repo.add_mention(
+            "default", "test-doc-123",
+            "Product", "Test Product (TP)",
+            normalized_name="test product"
+        )
+        
+        params = client.execute_write_tx.call_args.args[1]
+        assert params["normalized_name"] == "test product"
+        assert params["properties"] == {}
+    
+    def test_add_mention_missing_document(self, doc_repo):
+        """Test that a missing document is reported without extra queries."""
+        from kg_forge.graph.exceptions import DocumentNotFoundError
+        
+        repo, client = doc_repo
+        client.execute_write_tx.return_value = [
+            {'has_doc': False, 'has_ent': True, 'r': None}
+        ]
+        
+        with pytest.raises(DocumentNotFoundError):
+            repo.add_mention("default", "missing", "Product", "Test Product")
+        client.execute_query.assert_not_called()
+    
+    def test_add_mention_missing_entity(self, doc_repo):
+        """Test that a missing entity is reported from the same query."""
+        from kg_forge.graph.exceptions import EntityNotFoundError
+        
+        repo, client = doc_repo
+        client.execute_write_tx.return_value = [
+            {'has_doc': True, 'has_ent': False, 'r': None}
+        ]
+        
+        with pytest.raises(EntityNotFoundError):
+            repo.add_mention("default", "test-doc-123", "Product", "Missing")
+        client.execute_query.assert_not_called()
+
+
+class TestBulkWrites:
+    """Test UNWIND bulk writes."""
+    
+    def test_bulk_add_mentions_batches_rows(self, doc_repo):
+        """Test that mentions are normalized and handed to the UNWIND writer."""
+        repo, client = doc_repo
+        client.execute_unwind_write.return_value = 3
+        rows = [
+            {"doc_id": "d1", "entity_type": "Product", "entity_name": "Knowledge Discovery (KD)"},
+            {"doc_id": "d1", "entity_type": "Team", "entity_name": "Platform Team"},
+            {"doc_id": "d2", "entity_type": "Team", "entity_name": "Platform Team",
+             "properties": {"confidence": 0.9}},
+        ]
+        
+        written = repo.bulk_add_mentions("default", rows, batch_size=2)
+        
+        assert written == 3
+        query, sent, batch_size = client.execute_unwind_write.call_args.args
+        assert "UNWIND $rows AS row" in query
+        assert batch_size == 2
+        assert sent[0]["normalized_name"] == "knowledge discovery"
+        assert sent[2]["properties"] == {"confidence": 0.9}
+        assert client.execute_unwind_write.call_args.kwargs == {
+            "parameters": {"namespace": "default"}, "count_key": "count"
+        }
+    
+    def test_bulk_create_documents_empty(self, doc_repo):
+        """Test that no rows means no queries."""
+        repo, client = doc_repo
+        
+        client.execute_unwind_write.return_value = 0
+        
+        assert repo.bulk_create_documents("default", []) == 0
+        client.execute_auto_commit.assert_not_called()
+    
+    def test_large_bulk_write_uses_in_transactions(self, doc_repo):
+        """Test that very large batches are committed server-side in chunks."""
+        from unittest.mock import patch
+        
+        repo, client = doc_repo
+        client.execute_auto_commit.return_value = [{'count': 3}]
+        rows = [
+            {"doc_id": f"d{i}", "source_path": "p", "content_hash": "h"}
+            for i in range(3)
+        ]
+        
+        with patch("kg_forge.graph.neo4j.document_repo.IN_TRANSACTIONS_THRESHOLD", 2):
+            written = repo.bulk_create_documents("default", rows, batch_size=500)
+        
+        assert written == 3
+        client.execute_unwind_write.assert_not_called()
+        query, params = client.execute_auto_commit.call_args.args
+        assert "IN TRANSACTIONS OF $chunk ROWS" in query
+        assert params["chunk"] == 500
+        assert len(params["rows"]) == 3
 
 
 class TestDocumentQueries:
     """Test document query operations."""
     
+    def test_iter_documents_streams(self, doc_repo):
+        """Test that iter_documents yields documents lazily."""
+        repo, client = doc_repo
+        client.stream_query.return_value = iter([{'d': {'doc_id': 'a'}}, {'d': {'doc_id': 'b'}}])
+        
+        result = list(repo.iter_documents("default"))
+        
+        assert result == [{'doc_id': 'a'}, {'doc_id': 'b'}]
+        assert client.stream_query.call_args.args[1] == {"namespace": "default"}
+    
+    def test_iter_documents_as_rows(self, doc_repo):
+        """Test that documents can be streamed as slotted rows."""
+        repo, client = doc_repo
+        node = {
+            'namespace': 'default', 'doc_id': 'a', 'source_path': 'a.html',
+            'content_hash': 'h1', 'title': 'A'
+        }
+        client.stream_query.return_value = iter([{'d': node}])
+        
+        row = next(repo.iter_documents("default", as_rows=True))
+        
+        assert row.doc_id == 'a'
+        assert row.extra == {'title': 'A'}
+        assert row.to_dict() == node
+    
     def test_get_document_entities(self, doc_repo):
         """Test getting entities mentioned in document."""
         repo, client = doc_repo
@@ -204,13 +378,32 @@ class TestDocumentQueries:
         assert 'mention_properties' in result[0]
 
 
+class TestEntitiesForDocuments:
+    """Test page-level entity lookups."""
+    
+    def test_groups_entities_by_document(self, doc_repo):
+        """Test that one query returns entities grouped per document."""
+        repo, client = doc_repo
+        client.execute_query.return_value = [{
+            'did': 'a',
+            'ents': [{'name': 'Entity 1'}, {'name': 'Entity 2'}],
+            'rels': [{'confidence': 0.9}, {'confidence': 0.8}]
+        }]
+        
+        result = repo.get_entities_for_documents("default", ["a", "b"])
+        
+        assert client.execute_query.call_count == 1
+        assert result['a'][1] == {'name': 'Entity 2', 'mention_properties': {'confidence': 0.8}}
+        assert result['b'] == []
+
+
 class TestErrorHandling:
     """Test error handling."""
     
     def test_document_exists_handles_exception(self, doc_repo):
         """Test that document_exists handles exceptions."""
         repo, client = doc_repo
-        client.execute_query.side_effect = Exception("DB error")
+        client.execute_scalar.side_effect = Exception("DB error")
         
         result = repo.document_exists("default", "test-doc")
         
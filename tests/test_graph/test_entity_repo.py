@@ -32,6 +32,11 @@ class TestEntityNormalization:
         """Test that special characters are removed."""
         result = entity_repo.normalize_name("AI/ML-Platform")
         assert result == "ai ml platform"
+    
+    def test_normalize_name_non_ascii(self, entity_repo):
+        """Test that non-ASCII letters are treated as separators."""
+        result = entity_repo.normalize_name("Café Über (beta)")
+        assert result == "caf ber"
 
 
 class TestEntityList:
@@ -51,6 +56,35 @@ class TestEntityList:
         assert result[0]['name'] == 'Product A'
         assert result[1]['name'] == 'Product B'
     
+    def test_iter_entities_streams(self, entity_repo, mock_neo4j_client):
+        """Test that iter_entities yields rows from the streaming API."""
+        mock_neo4j_client.stream_query.return_value = iter([
+            {'e': {'name': 'Product A'}},
+            {'e': {'name': 'Product B'}}
+        ])
+        
+        stream = entity_repo.iter_entities("default", entity_type="Product")
+        
+        assert next(stream) == {'name': 'Product A'}
+        query, params = mock_neo4j_client.stream_query.call_args.args
+        assert "LIMIT" not in query
+        assert params == {"namespace": "default", "entity_type": "Product"}
+        mock_neo4j_client.execute_query.assert_not_called()
+    
+    def test_iter_entities_as_rows(self, entity_repo, mock_neo4j_client):
+        """Test that entities can be streamed as slotted rows."""
+        node = {
+            'namespace': 'default', 'entity_type': 'Team', 'normalized_name': 'core',
+            'name': 'Core', 'description': 'Core team'
+        }
+        mock_neo4j_client.stream_query.return_value = iter([{'e': node}])
+        
+        row = next(entity_repo.iter_entities("default", as_rows=True))
+        
+        assert row.name == 'Core'
+        assert row.extra == {'description': 'Core team'}
+        assert row.to_dict() == node
+    
     def test_list_entity_types(self, entity_repo, mock_neo4j_client):
         """Test listing all entity types in a namespace."""
         # Mock the client to return distinct types
@@ -66,6 +100,19 @@ class TestEntityList:
         assert 'Product' in result
         assert 'Team' in result
         assert 'Technology' in result
+    
+    def test_list_entity_types_is_memoized_until_write(self, entity_repo, mock_neo4j_client):
+        """Test that entity types are cached and dropped on entity writes."""
+        mock_neo4j_client.execute_query.return_value = [{'entity_type': 'Product'}]
+        
+        assert entity_repo.list_entity_types("default") == ['Product']
+        assert entity_repo.list_entity_types("default") == ['Product']
+        assert mock_neo4j_client.execute_query.call_count == 1
+        
+        mock_neo4j_client.execute_scalar.return_value = True
+        entity_repo.delete_entity("default", "Product", "Gone")
+        entity_repo.list_entity_types("default")
+        assert mock_neo4j_client.execute_query.call_count == 2
 
 
 class TestEntityGet:
@@ -88,6 +135,73 @@ class TestEntityGet:
         result = entity_repo.get_entity("default", "Product", "NonExistent")
         
         assert result is None
+    
+    def test_get_entity_does_not_memoize_misses(self, entity_repo, mock_neo4j_client, sample_entity):
+        """Test that a missing entity is looked up again, bypassing the client cache."""
+        mock_neo4j_client.execute_query.return_value = []
+        assert entity_repo.get_entity("default", "Product", "Later") is None
+        
+        mock_neo4j_client.execute_query.return_value = [{'e': sample_entity}]
+        assert entity_repo.get_entity("default", "Product", "Later") is not None
+        
+        assert mock_neo4j_client.execute_query.call_count == 2
+        assert mock_neo4j_client.execute_query.call_args.kwargs["cache"] is False
+    
+    def test_get_entity_cache_hits_are_deep_copies(self, entity_repo, mock_neo4j_client):
+        """Test that mutating a returned entity does not change later cache hits."""
+        mock_neo4j_client.execute_query.return_value = [
+            {'e': {"name": "Knowledge Discovery", "aliases": ["KD"]}}
+        ]
+        
+        first = entity_repo.get_entity("default", "Product", "Knowledge Discovery")
+        first["aliases"].append("K-D")
+        second = entity_repo.get_entity("default", "Product", "Knowledge Discovery")
+        second["aliases"].append("Discovery")
+        third = entity_repo.get_entity("default", "Product", "Knowledge Discovery")
+        
+        assert third["aliases"] == ["KD"]
+        assert mock_neo4j_client.execute_query.call_count == 1
+
+    
+    def test_get_entity_is_memoized_until_write(self, entity_repo, mock_neo4j_client, sample_entity):
+        """Test that repeated lookups are served from the per-client cache."""
+        mock_neo4j_client.execute_query.return_value = [{'e': sample_entity}]
+        mock_neo4j_client.execute_write_tx.return_value = [{'e': sample_entity}]
+        
+        entity_repo.get_entity("default", "Product", "Knowledge Discovery")
+        entity_repo.get_entity("default", "Product", "knowledge discovery")
+        assert mock_neo4j_client.execute_query.call_count == 1
+        
+        # Another repository on the same client invalidates the shared entry
+        Neo4jEntityRepository(mock_neo4j_client).update_entity(
+            "default", "Product", "Knowledge Discovery", description="x"
+        )
+        entity_repo.get_entity("default", "Product", "Knowledge Discovery")
+        assert mock_neo4j_client.execute_query.call_count == 2
+        
+        entity_repo.get_entity("default", "Product", "Knowledge Discovery", use_cache=False)
+        assert mock_neo4j_client.execute_query.call_count == 3
+
+
+class TestEntityBulkGet:
+    """Test multi-entity lookups."""
+    
+    def test_get_entities_single_query(self, entity_repo, mock_neo4j_client):
+        """Test that many keys are resolved with one query."""
+        mock_neo4j_client.execute_query.return_value = [
+            {'e': {'entity_type': 'Team', 'normalized_name': 'core', 'name': 'Core'}}
+        ]
+        
+        result = entity_repo.get_entities("default", [
+            ("Team", "Core"), ("Team", "core (C)"), ("Product", "Missing")
+        ])
+        
+        assert mock_neo4j_client.execute_query.call_count == 1
+        params = mock_neo4j_client.execute_query.call_args.args[1]
+        assert len(params["keys"]) == 2
+        assert result[("Team", "Core")]['name'] == 'Core'
+        assert result[("Team", "core (C)")]['name'] == 'Core'
+        assert ("Product", "Missing") not in result
 
 
 class TestEntityCreate:
@@ -124,6 +238,52 @@ class TestEntityCreate:
         
         with pytest.raises(DuplicateEntityError):
             entity_repo.create_entity("default", "Product", "Existing Product")
+    
+    def test_create_entity_without_timestamp_union(self, entity_repo, mock_neo4j_client):
+        """Test that creation is a single guarded CREATE, not a timestamp UNION."""
+        from kg_forge.graph.exceptions import DuplicateEntityError
+        
+        mock_neo4j_client.execute_write_tx.return_value = []
+        
+        with pytest.raises(DuplicateEntityError):
+            entity_repo.create_entity("default", "Product", "Existing Product")
+        
+        query = mock_neo4j_client.execute_write_tx.call_args.args[0]
+        assert "UNION" not in query
+        assert "WHERE existing IS NULL" in query
+        mock_neo4j_client.execute_query.assert_not_called()
+    
+    def test_create_entity_constraint_race(self, entity_repo, mock_neo4j_client):
+        """Test that losing a concurrent create surfaces as a duplicate."""
+        from kg_forge.graph.exceptions import DuplicateEntityError, GraphError
+        
+        violation = Exception("already exists")
+        violation.code = "Neo.ClientError.Schema.ConstraintValidationFailed"
+        error = GraphError("Write transaction failed")
+        error.__cause__ = violation
+        mock_neo4j_client.execute_write_tx.side_effect = error
+        
+        with pytest.raises(DuplicateEntityError):
+            entity_repo.create_entity("default", "Product", "Racing Product")
+    
+    def test_bulk_create_entities(self, entity_repo, mock_neo4j_client):
+        """Test that entities are upserted in one UNWIND query per batch."""
+        mock_neo4j_client.execute_unwind_write.return_value = 2
+        
+        written = entity_repo.bulk_create_entities("default", [
+            {"entity_type": "Product", "name": "AI/ML Platform"},
+            {"entity_type": "Team", "name": "Core", "properties": {"size": 3}},
+        ])
+        
+        assert written == 2
+        query, rows, batch_size = mock_neo4j_client.execute_unwind_write.call_args.args
+        assert "UNWIND $rows AS row" in query
+        assert batch_size is None
+        assert rows[0]["normalized_name"] == "ai ml platform"
+        assert rows[1]["properties"] == {"size": 3}
+        assert mock_neo4j_client.execute_unwind_write.call_args.kwargs["parameters"] == {
+            "namespace": "default"
+        }
 
 
 class TestEntityUpdate:
@@ -158,7 +318,7 @@ class TestEntityDelete:
     
     def test_delete_entity_success(self, entity_repo, mock_neo4j_client):
         """Test successful entity deletion."""
-        mock_neo4j_client.execute_write_tx.return_value = [{'deleted_count': 1}]
+        mock_neo4j_client.execute_scalar.return_value = True
         
         result = entity_repo.delete_entity("default", "Product", "Test Product")
         
@@ -166,7 +326,7 @@ class TestEntityDelete:
     
     def test_delete_nonexistent_entity(self, entity_repo, mock_neo4j_client):
         """Test deleting non-existent entity returns False."""
-        mock_neo4j_client.execute_write_tx.return_value = [{'deleted_count': 0}]
+        mock_neo4j_client.execute_scalar.return_value = False
         
         result = entity_repo.delete_entity("default", "Product", "NonExistent")
         
@@ -191,6 +351,30 @@ class TestEntityRelationships:
         assert result is not None
         assert result['type'] == 'USES'
     
+    def test_create_relationship_reuses_query_string(self, entity_repo, mock_neo4j_client):
+        """Test that the same relationship type yields the same query string."""
+        mock_neo4j_client.execute_write_tx.return_value = [
+            {'r': {}, 'from': {}, 'to': {}}
+        ]
+        
+        entity_repo.create_relationship("default", "Team", "A", "Technology", "B", "uses")
+        entity_repo.create_relationship("default", "Team", "C", "Technology", "D", "USES")
+        
+        first, second = mock_neo4j_client.execute_write_tx.call_args_list
+        assert first.args[0] is second.args[0]
+        assert "MERGE (from)-[r:USES]->(to)" in first.args[0]
+    
+    def test_create_relationship_rejects_invalid_type(self, entity_repo, mock_neo4j_client):
+        """Test that relationship types are validated before interpolation."""
+        from kg_forge.graph.exceptions import GraphError
+        
+        with pytest.raises(GraphError):
+            entity_repo.create_relationship(
+                "default", "Team", "A", "Technology", "B",
+                "USES]->(x) DETACH DELETE x //"
+            )
+        mock_neo4j_client.execute_write_tx.assert_not_called()
+    
     def test_create_relationship_missing_source(self, entity_repo, mock_neo4j_client):
         """Test creating relationship with missing source entity."""
         mock_neo4j_client.execute_write_tx.return_value = []
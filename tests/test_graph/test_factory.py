@@ -0,0 +1,49 @@
+"""Unit tests for the graph factory functions."""
+
+import pytest
+from unittest.mock import Mock
+from kg_forge.graph.factory import (
+    get_entity_repository,
+    get_document_repository,
+    get_schema_manager,
+)
+from kg_forge.graph.exceptions import GraphError
+from kg_forge.graph.neo4j.client import Neo4jClient
+from kg_forge.graph.neo4j.entity_repo import Neo4jEntityRepository
+from kg_forge.graph.neo4j.document_repo import Neo4jDocumentRepository
+from kg_forge.graph.neo4j.schema import Neo4jSchemaManager
+
+
+class TestRepositoryFactories:
+    """Test repository lookup by client type."""
+    
+    def test_neo4j_client_gets_neo4j_repositories(self):
+        """Test that a Neo4j client maps to the Neo4j implementations."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        assert isinstance(get_entity_repository(client), Neo4jEntityRepository)
+        assert isinstance(get_document_repository(client), Neo4jDocumentRepository)
+        assert isinstance(get_schema_manager(client), Neo4jSchemaManager)
+    
+    def test_subclass_uses_parent_registration(self):
+        """Test that client subclasses resolve to their parent's repositories."""
+        class CustomClient(Neo4jClient):
+            pass
+        
+        client = CustomClient("bolt://localhost:7687", "neo4j", "pw")
+        
+        assert isinstance(get_entity_repository(client), Neo4jEntityRepository)
+    
+    def test_spec_mock_uses_registration(self):
+        """Test that objects passing isinstance (spec'd mocks) are accepted."""
+        client = Mock(spec=Neo4jClient)
+        
+        assert isinstance(get_entity_repository(client), Neo4jEntityRepository)
+        
+        with pytest.raises(GraphError):
+            get_entity_repository(Mock())
+    
+    def test_unknown_client_raises(self):
+        """Test that unsupported clients raise GraphError."""
+        with pytest.raises(GraphError, match="No schema manager available"):
+            get_schema_manager(Mock())
@@ -0,0 +1,29 @@
+"""Tests for lazy exports of the graph packages."""
+
+import subprocess
+import sys
+
+import kg_forge.graph
+import kg_forge.graph.neo4j
+from kg_forge.graph.base import GraphClient
+from kg_forge.graph.neo4j.client import Neo4jClient
+
+
+def test_graph_package_exports_resolve():
+    """Test exported names resolve to the defining classes."""
+    assert kg_forge.graph.GraphClient is GraphClient
+    assert kg_forge.graph.neo4j.Neo4jClient is Neo4jClient
+    assert set(kg_forge.graph.neo4j.__all__) <= set(dir(kg_forge.graph.neo4j))
+
+
+def test_importing_graph_packages_does_not_load_driver():
+    """Test the Neo4j driver is only imported when a class is used."""
+    code = (
+        "import sys, kg_forge.graph, kg_forge.graph.neo4j, kg_forge.graph.exceptions; "
+        "print('neo4j' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,195 @@
+"""Unit tests for Neo4j schema management.
+
+These tests use mocks to check the schema statements without requiring a real Neo4j database.
+For integration tests with real Neo4j, see test_integration.py.
+"""
+
+import pytest
+from unittest.mock import patch
+from kg_forge.graph.neo4j.schema import CONSTRAINTS, DROPPED_INDEXES, INDEXES, Neo4jSchemaManager
+
+
+class TestSchemaCreation:
+    """Test constraint and index creation."""
+    
+    def test_content_hash_index_is_namespaced(self, schema_manager, mock_neo4j_client):
+        """Test that hash lookups get a composite (namespace, content_hash) index."""
+        schema_manager.create_indexes()
+        
+        statements = mock_neo4j_client.execute_write_batch.call_args.args[0]
+        assert any("ON (d.namespace, d.content_hash)" in s for s in statements)
+    
+    def test_create_indexes_drops_replaced_hash_index(self, schema_manager, mock_neo4j_client):
+        """Test that the old single-property hash index is dropped after the new one is created."""
+        schema_manager.create_indexes()
+        
+        statements = mock_neo4j_client.execute_write_batch.call_args.args[0]
+        assert statements[-1] == "DROP INDEX doc_content_hash IF EXISTS"
+        assert statements.index(INDEXES["doc_namespace_hash"]) < len(statements) - 1
+    
+    def test_ensure_schema_runs_once_per_database(self, schema_manager, mock_neo4j_client):
+        """Test that ensure_schema only issues DDL the first time."""
+        with patch.object(Neo4jSchemaManager, "_ensured", set()):
+            assert schema_manager.ensure_schema() is True
+            calls = mock_neo4j_client.execute_write_batch.call_count
+            
+            assert Neo4jSchemaManager(mock_neo4j_client).ensure_schema() is False
+            assert mock_neo4j_client.execute_write_batch.call_count == calls
+        
+        statements = [
+            q for c in mock_neo4j_client.execute_write_batch.call_args_list for q in c.args[0]
+        ]
+        assert any("CONSTRAINT doc_unique" in s for s in statements)
+        assert any("CONSTRAINT entity_unique" in s for s in statements)
+    
+    def test_ddl_is_sent_in_one_transaction(self, schema_manager, mock_neo4j_client):
+        """Test that the whole schema costs one round-trip."""
+        schema_manager.create_schema()
+        
+        mock_neo4j_client.execute_write_batch.assert_called_once()
+        mock_neo4j_client.execute_write.assert_not_called()
+        statements = mock_neo4j_client.execute_write_batch.call_args.args[0]
+        assert len(statements) == len(CONSTRAINTS) + len(INDEXES) + len(DROPPED_INDEXES)
+
+    
+    def test_vector_index_sets_hnsw_options(self, schema_manager, mock_neo4j_client):
+        """Test that HNSW parameters are passed in the index config."""
+        mock_neo4j_client.server_agent = "Neo4j/5.23.0"
+        
+        schema_manager.create_vector_index(m=24, ef_construction=150)
+        
+        query = mock_neo4j_client.execute_write.call_args.args[0]
+        assert "`vector.hnsw.m`: 24" in query
+        assert "`vector.hnsw.ef_construction`: 150" in query
+    
+    @pytest.mark.parametrize("agent", ["Neo4j/5.14.0", None])
+    def test_vector_index_omits_hnsw_options_on_older_servers(
+        self, schema_manager, mock_neo4j_client, agent
+    ):
+        """Test that older or unknown servers get a default index in one attempt."""
+        mock_neo4j_client.server_agent = agent
+        
+        schema_manager.create_vector_index()
+        
+        mock_neo4j_client.execute_write.assert_called_once()
+        query = mock_neo4j_client.execute_write.call_args.args[0]
+        assert "vector.hnsw" not in query
+        assert "`vector.dimensions`: 384" in query
+    
+    def test_verified_names_match_created_statements(self):
+        """Test that every required name is created by its own statement."""
+        for name, statement in {**CONSTRAINTS, **INDEXES}.items():
+            assert f" {name} IF NOT EXISTS" in statement
+
+
+class TestVerifySchema:
+    """Test schema verification."""
+    
+    @pytest.fixture
+    def existing_schema(self, mock_neo4j_client):
+        """Make SHOW queries report the full required schema."""
+        def fake_query(query, parameters=None, timeout=None):
+            if query.startswith("SHOW CONSTRAINTS"):
+                names = ("doc_unique", "entity_unique")
+            else:
+                names = (
+                    "doc_namespace", "doc_namespace_hash",
+                    "entity_namespace", "entity_type", "entity_name",
+                )
+            return [{"name": n} for n in names]
+        mock_neo4j_client.execute_read.side_effect = fake_query
+    
+    def test_verify_schema_filters_on_server(self, schema_manager, mock_neo4j_client, existing_schema):
+        """Test that both SHOW queries yield only the required names in one session."""
+        assert schema_manager.verify_schema() is True
+        
+        assert mock_neo4j_client.execute_read.call_count == 2
+        mock_neo4j_client.batch_session.assert_called_once()
+        (constraints, params), (indexes, _) = [
+            c.args for c in mock_neo4j_client.execute_read.call_args_list
+        ]
+        assert constraints.startswith("SHOW CONSTRAINTS YIELD name WHERE name IN $constraints")
+        assert indexes.startswith("SHOW INDEXES YIELD name WHERE name IN $indexes")
+        assert params["constraints"] == ["doc_unique", "entity_unique"]
+    
+    def test_verify_schema_reports_missing_names(self, schema_manager, mock_neo4j_client):
+        """Test that a missing index fails verification."""
+        def fake_query(query, parameters=None, timeout=None):
+            if query.startswith("SHOW CONSTRAINTS"):
+                return [{"name": "doc_unique"}, {"name": "entity_unique"}]
+            return []
+        mock_neo4j_client.execute_read.side_effect = fake_query
+        
+        assert schema_manager.verify_schema() is False
+        assert schema_manager._get_schema_names()[1] == frozenset()
+    
+    def test_verify_schema_reuses_names(self, schema_manager, mock_neo4j_client, existing_schema):
+        """Test that repeated checks do not re-run SHOW queries."""
+        assert schema_manager.verify_schema() is True
+        calls = mock_neo4j_client.execute_read.call_count
+        
+        assert schema_manager.verify_schema() is True
+        assert mock_neo4j_client.execute_read.call_count == calls
+    
+    def test_create_invalidates_cached_names(self, schema_manager, mock_neo4j_client, existing_schema):
+        """Test that schema changes force a fresh read."""
+        schema_manager.verify_schema()
+        calls = mock_neo4j_client.execute_read.call_count
+        
+        schema_manager.create_indexes()
+        schema_manager.verify_schema()
+        
+        assert mock_neo4j_client.execute_read.call_count > calls
+
+
+class TestClearNamespace:
+    """Test namespace deletion."""
+    
+    def test_clear_namespace_deletes_per_label_in_batches(self, schema_manager, mock_neo4j_client):
+        """Test that deletes are label-anchored, chunked and summed."""
+        mock_neo4j_client.execute_auto_commit.side_effect = [
+            [{"deleted_count": 3}], [{"deleted_count": 4}]
+        ]
+        
+        assert schema_manager.clear_namespace("test") == 7
+        
+        calls = mock_neo4j_client.execute_auto_commit.call_args_list
+        assert "MATCH (n:Doc {namespace: $namespace})" in calls[0].args[0]
+        assert "MATCH (n:Entity {namespace: $namespace})" in calls[1].args[0]
+        for call in calls:
+            assert "DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS" in call.args[0]
+            assert call.args[1] == {"namespace": "test"}
+
+
+class TestStatistics:
+    """Test namespace statistics."""
+    
+    def test_statistics_come_from_one_query(self, schema_manager, mock_neo4j_client):
+        """Test that node and relationship counts share a single round-trip."""
+        mock_neo4j_client.execute_read.return_value = [
+            {"kind": "node", "key": "Doc", "count": 3},
+            {"kind": "node", "key": "Entity", "count": 12},
+            {"kind": "relationship", "key": "MENTIONS", "count": 20},
+            {"kind": "relationship", "key": "USES", "count": 4},
+        ]
+        
+        stats = schema_manager.get_statistics("test")
+        
+        assert stats["nodes"] == {"Doc": 3, "Entity": 12}
+        assert stats["relationships"] == {"MENTIONS": 20, "USES": 4}
+        mock_neo4j_client.execute_read.assert_called_once()
+        query = mock_neo4j_client.execute_read.call_args.args[0]
+        assert "MATCH (d:Doc {namespace: $namespace})" in query
+        assert "MATCH (:Entity {namespace: $namespace})-[r]->()" in query
+    
+    def test_empty_namespace_has_no_counts(self, schema_manager, mock_neo4j_client):
+        """Test that zero node counts are left out."""
+        mock_neo4j_client.execute_read.return_value = [
+            {"kind": "node", "key": "Doc", "count": 0},
+            {"kind": "node", "key": "Entity", "count": 0},
+        ]
+        
+        stats = schema_manager.get_statistics("empty")
+        
+        assert stats["nodes"] == {}
+        assert stats["relationships"] == {}
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from kg_forge.parsers.document_loader import DocumentLoader
+from kg_forge.parsers.document_loader import DocumentLoader, iter_html_files
 from kg_forge.parsers.html_parser import ConfluenceHTMLParser
 from kg_forge.models.document import ParsedDocument
 
@@ -117,3 +117,26 @@ def test_load_handles_errors_gracefully(loader, tmp_path):
     # Should have loaded at least the valid file
     assert len(documents) >= 1
     assert any(doc.doc_id == "123" for doc in documents)
+
+
+def test_iter_html_files_is_sorted_and_filtered(tmp_path):
+    """Test that discovery yields matching files in name order."""
+    for name in ["b.html", "a.html", "notes.txt", ".hidden.html"]:
+        (tmp_path / name).write_text("<html></html>")
+    (tmp_path / "dir.html").mkdir()
+
+    files = list(iter_html_files(tmp_path))
+
+    assert files == [tmp_path / ".hidden.html", tmp_path / "a.html", tmp_path / "b.html"]
+    assert files == sorted(p for p in tmp_path.glob("*.html") if p.is_file())
+
+
+def test_iter_html_files_with_glob_pattern(tmp_path):
+    """Test that non-suffix patterns still use glob matching."""
+    for name in ["page-1.html", "page-2.htm", "other.html"]:
+        (tmp_path / name).write_text("<html></html>")
+
+    assert list(iter_html_files(tmp_path, "page-?.htm*")) == [
+        tmp_path / "page-1.html",
+        tmp_path / "page-2.htm",
+    ]
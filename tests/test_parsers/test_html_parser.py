@@ -29,6 +29,8 @@ def test_extract_doc_id(parser):
         == "3182532046"
     )
     assert parser._extract_doc_id("test_file.html") == "test_file"
+    assert parser._extract_doc_id("page_.html") == "page_"
+    assert parser._extract_doc_id("notes_123.htm") == "notes_123"
 
 
 def test_parse_file_not_found(parser):
@@ -1,6 +1,7 @@
 """Tests for deduplication hooks."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 
 from kg_forge.pipeline.hooks.deduplication.fuzzy import (
@@ -156,13 +157,13 @@ class TestFuzzyDeduplicateEntitiesHook:
         # Create mock graph client and entity repo
         mock_entity_repo = Mock()
         
-        # Mock existing entity from graph (as ExtractedEntity)
-        existing_entity = ExtractedEntity(
+        # Mock existing entity from graph (graph records carry an id)
+        existing_entity = SimpleNamespace(
             entity_type="Technology",
             name="Kubernetes",
-            properties={'normalized_name': 'kubernetes'}
+            properties={'normalized_name': 'kubernetes'},
+            id='existing-1'
         )
-        existing_entity.id = 'existing-1'  # Add id attribute
         
         mock_entity_repo.list_entities.return_value = [existing_entity]
         
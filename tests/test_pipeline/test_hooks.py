@@ -132,6 +132,34 @@ class TestHookRegistry:
         # Should be: test -> TEST -> PREFIX_TEST
         assert result[0].name == "PREFIX_TEST"
     
+    def test_spec_hook_attributes_can_be_set(self):
+        """Test that hooks can set the attributes documented in the hook API."""
+        registry = HookRegistry()
+        entities = [
+            ExtractedEntity(entity_type="Product", name="Knowledge Graph"),
+            ExtractedEntity(entity_type="Product", name="KG"),
+        ]
+        
+        def spec_hook(doc, entities, graph_client):
+            first, second = entities
+            first.normalized_name = first.name.lower()
+            if not hasattr(first, 'aliases') or first.aliases is None:
+                first.aliases = []
+            first.aliases.append(second.name)
+            second.merged_into = "entity-1"
+            if not hasattr(first, 'merged_into'):
+                first.embedding = [0.1, 0.2]
+            return entities
+        
+        registry.register_before_store(spec_hook)
+        first, second = registry.run_before_store(Mock(spec=ParsedDocument), entities, Mock())
+        
+        assert first.normalized_name == "knowledge graph"
+        assert first.aliases == ["KG"]
+        assert first.embedding == [0.1, 0.2]
+        assert second.merged_into == "entity-1"
+        assert not hasattr(second, 'embedding')
+    
     def test_run_after_batch_hooks(self):
         """Test running after_batch hooks."""
         registry = HookRegistry()
@@ -151,6 +179,31 @@ class TestHookRegistry:
         
         assert hook_called['count'] == 1
     
+    def test_hook_signature_inspected_once(self, monkeypatch):
+        """Test that hook signatures are inspected once, not per call."""
+        import inspect
+        
+        registry = HookRegistry()
+        calls = []
+        
+        def test_hook(doc, entities, graph_client, interactive=None):
+            calls.append(interactive)
+            return entities
+        
+        registry.register_before_store(test_hook)
+        doc = Mock(spec=ParsedDocument)
+        graph_client = Mock()
+        session = InteractiveSession(enabled=False)
+        
+        signature = Mock(wraps=inspect.signature)
+        monkeypatch.setattr(inspect, 'signature', signature)
+        
+        for _ in range(3):
+            registry.run_before_store(doc, [], graph_client, session)
+        
+        assert calls == [session] * 3
+        assert signature.call_count == 1
+    
     def test_hook_error_handling(self):
         """Test that hook errors don't stop pipeline."""
         registry = HookRegistry()
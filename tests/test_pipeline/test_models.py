@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime, timedelta
 
 from kg_forge.models.pipeline import (
+    MAX_RECORDED_ERRORS,
     PipelineConfig,
     DocumentProcessingResult,
     PipelineStatistics,
@@ -180,3 +181,14 @@ class TestPipelineStatistics:
         assert len(stats.errors) == 2
         assert "doc1: Network error" in stats.errors
         assert "doc2: Timeout" in stats.errors
+    
+    def test_record_error_is_bounded(self):
+        """Test that recorded errors are capped and the overflow counted."""
+        stats = PipelineStatistics()
+        
+        for i in range(MAX_RECORDED_ERRORS + 5):
+            stats.record_error(f"doc{i}: Timeout")
+        
+        assert len(stats.errors) == MAX_RECORDED_ERRORS
+        assert stats.errors[0] == "doc0: Timeout"
+        assert stats.dropped_errors == 5